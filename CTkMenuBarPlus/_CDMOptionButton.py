@@ -1,10 +1,12 @@
 import customtkinter
-import sys
 from PIL.Image import Image
 import PIL
 from typing import Union, TYPE_CHECKING, Any
-from .accelerators import _register_accelerator, _unregister_accelerator
+from .accelerators import _register_accelerator, _unregister_accelerator, _format_accelerator_display
 from .constants import DEFAULT_ICON_SIZE
+from .icon_cache import _get_ctk_image
+from .widget_pool import _unbind_callback
+from customtkinter.windows.widgets.appearance_mode import CTkAppearanceModeBaseClass
 from .custom_exception_classes import *
 if TYPE_CHECKING:
     from .dropdown_menu import CustomDropdownMenu
@@ -17,22 +19,23 @@ class _CDMOptionButton(customtkinter.CTkButton):
         """Initialize option button with enhanced features.
 
         Args:
-            accelerator: Keyboard shortcut (e.g., "Ctrl+O")
-            icon: Path to icon file or PIL Image object
+            accelerator: Keyboard shortcut (e.g., "Ctrl+O" or the chord "Ctrl+K Ctrl+O")
+            icon: Path to icon file, PIL Image object or icon of an IconAtlas, or a
+                (light, dark) pair of those for appearance-mode specific icons
             icon_size: Size (px) to render icon at; defaults to menu's scaled icon size
             checkable: Whether this item can be checked/unchecked
             checked: Initial checked state
             enabled: Whether the item is initially enabled
+            throttle_ms: Minimum time (ms) between two runs of the command
+            debounce_ms: Run the command only once no activation arrived for this long (ms)
+            coalesce: Merge activations arriving while a run is queued instead of dropping them
+            disable_while_running: Disable the item while its background (async) command runs
+            run_in_executor: Run the command on the shared thread pool (None: use the menu's default)
             **kwargs: Additional arguments passed to CTkButton
         """
-        # Extract and store custom parameters
-        self.accelerator = kwargs.pop('accelerator', None)
-        self.icon = kwargs.pop('icon', None)
-        self.icon_size = kwargs.pop('icon_size', DEFAULT_ICON_SIZE)
-        self.base_icon_size = self.icon_size
-        self.checkable = kwargs.pop('checkable', False)
-        self.checked = kwargs.pop('checked', False)
-        self.enabled = kwargs.pop('enabled', True)
+        # Callbacks bound through bind(), removed again when the button is released to a pool
+        self._bound_callbacks = []
+        self._store_custom_options(kwargs)
 
         # Capture logical text before parent init so we can preserve it
         self._option_text = kwargs.get("text", "")
@@ -44,6 +47,71 @@ class _CDMOptionButton(customtkinter.CTkButton):
         self._configure_initial_state()
         self._setup_features()
 
+    def _store_custom_options(self, kwargs: dict) -> None:
+        """Pop the custom parameters out of kwargs and store them (defaults for missing ones)."""
+        self.accelerator = kwargs.pop('accelerator', None)
+        self.icon = kwargs.pop('icon', None)
+        self.icon_size = kwargs.pop('icon_size', DEFAULT_ICON_SIZE)
+        self.base_icon_size = self.icon_size
+        self.checkable = kwargs.pop('checkable', False)
+        self.checked = kwargs.pop('checked', False)
+        self.enabled = kwargs.pop('enabled', True)
+        self.throttle_ms = self._validate_delay('throttle_ms', kwargs.pop('throttle_ms', 0))
+        self.debounce_ms = self._validate_delay('debounce_ms', kwargs.pop('debounce_ms', 0))
+        self.coalesce = bool(kwargs.pop('coalesce', False))
+        self.disable_while_running = bool(kwargs.pop('disable_while_running', False))
+        self.run_in_executor = kwargs.pop('run_in_executor', None)
+        self._running_tasks = 0  # Background commands of this item in flight
+
+    def _reset(self, **kwargs) -> None:
+        """Reinitialize a released (pooled) button as if it was created with kwargs.
+
+        Args:
+            **kwargs: Same arguments as the constructor, except the master
+        """
+        self._store_custom_options(kwargs)
+        self._option_text = kwargs.get("text", "")
+        kwargs.setdefault("image", None)
+        kwargs.setdefault("state", "normal" if self.enabled else "disabled")
+        super().configure(**kwargs)
+        if self._image is None and self._image_label is not None:
+            self._draw()  # Drop the label of a previous icon
+        self._refresh_display()
+        self._setup_features()
+
+    def _release(self) -> None:
+        """Detach the button from its option so that it can be pooled and reused."""
+        self.pack_forget()
+        self._on_leave()  # Forget a hover highlight
+        self._unbind_accelerator()
+        for widget, sequence, funcid in self._bound_callbacks:
+            _unbind_callback(widget, sequence, funcid)
+        self._bound_callbacks.clear()
+        for name in ("parent_menu", "submenu", "icon_image", "_user_command", "_disabled_while_running"):
+            self.__dict__.pop(name, None)
+        super().configure(command=None)
+
+    def bind(self, sequence: str = None, command: Any = None, add: Union[str, bool] = True):
+        """Bind like CTkButton, remembering the callbacks so that a release can remove them."""
+        if not (add == "+" or add is True):
+            raise ValueError("'add' argument can only be '+' or True to preserve internal callbacks")
+        for widget in (self._canvas, self._text_label, self._image_label):
+            if widget is not None:
+                self._bound_callbacks.append((widget, sequence, widget.bind(sequence, command, add=True)))
+
+    @staticmethod
+    def _validate_delay(name: str, value: Any) -> int:
+        """Validate a throttle/debounce delay in milliseconds."""
+        if value is None:
+            return 0
+        if not isinstance(value, (int, float)) or value < 0:
+            raise ValueError(f"{name} must be a non-negative number of milliseconds")
+        return value
+
+    def has_execution_policy(self) -> bool:
+        """Return True if the command is throttled, debounced or coalesced."""
+        return bool(self.throttle_ms or self.debounce_ms or self.coalesce)
+
     def _configure_initial_state(self) -> None:
         """Configure the initial state of the button."""
         if not self.enabled:
@@ -59,20 +127,9 @@ class _CDMOptionButton(customtkinter.CTkButton):
     def _setup_icon(self) -> None:
         """Setup icon for the menu item."""
         try:
-            # Load image from file or use provided PIL image
-            if isinstance(self.icon, str):
-                image = PIL.Image.open(self.icon)
-            else:
-                image = self.icon
             self.icon_size = max(8, round(self.base_icon_size * self.parent_menu.cget("scale")))
-            # Resize to configured icon size
-            size = self.icon_size
-            image = image.resize((size, size), PIL.Image.Resampling.LANCZOS)
-            self.icon_image = customtkinter.CTkImage(
-                light_image=image,
-                dark_image=image,
-                size=(size, size)
-            )
+            # Load and resize to configured icon size; file and atlas icons share one CTkImage per size
+            self.icon_image = _get_ctk_image(self.icon, self.icon_size)
             self.configure(image=self.icon_image)
 
         except Exception as e:
@@ -89,7 +146,7 @@ class _CDMOptionButton(customtkinter.CTkButton):
         overlay and its transient master so that shortcuts work regardless of
         where the focus currently is (overlay or main window).
         """
-        tl = self.parent_menu.winfo_toplevel()
+        tl = self.parent_menu._accelerator_window()
         targets = [tl]
         try:
             trans_path = tl.tk.call('wm', 'transient', tl._w)
@@ -141,8 +198,9 @@ class _CDMOptionButton(customtkinter.CTkButton):
                         pass
 
             # Register on all targets
+            menu_path = self._get_menu_path()
             for t in targets:
-                _register_accelerator(t, self.accelerator, command)
+                _register_accelerator(t, self.accelerator, command, owner=self, menu_path=menu_path)
 
             # Mark as bound
             self._accel_bound = True
@@ -150,9 +208,65 @@ class _CDMOptionButton(customtkinter.CTkButton):
             self._accel_targets = targets
             self._accel_target_ids = target_ids
 
+        except AcceleratorConflictError:
+            raise
         except Exception as e:
             raise MenuWidgetBindingError(f"Error binding accelerator {self.accelerator}: {e}") from e
 
+    def _unbind_accelerator(self) -> None:
+        """Unregister the accelerator from every window it was bound to."""
+        if not getattr(self, "_accel_bound", False):
+            return
+        command = getattr(self, "_activate_submenu_accelerator", self._execute_if_enabled)
+        for target in getattr(self, "_accel_targets", None) or []:
+            try:
+                _unregister_accelerator(target, self._accel_key, command)
+            except Exception:
+                pass
+        self._accel_bound = False
+        self._accel_key = None
+        self._accel_targets = None
+        self._accel_target_ids = None
+
+    def _get_menu_path(self) -> str:
+        """Return the item's location such as 'File > Recent Files > notes.md' for reports."""
+        parts = [self._option_text]
+        menu = getattr(self, "parent_menu", None)
+        while menu is not None:
+            seed = getattr(menu, "menu_seed_object", None)
+            if isinstance(seed, _CDMOptionButton):
+                parts.append(seed._option_text)
+                menu = getattr(seed, "parent_menu", None)
+            else:
+                try:
+                    text = seed.cget("text") if seed is not None else ""
+                except Exception:
+                    text = ""
+                if text:
+                    parts.append(text)
+                break
+        return " > ".join(reversed(parts))
+
+    def destroy(self) -> None:
+        """Destroy the button, unregistering its accelerator and detaching it from a shared CTkImage."""
+        self._unbind_accelerator()
+        image = getattr(self, "_image", None)
+        if isinstance(image, customtkinter.CTkImage):
+            try:
+                image.remove_configure_callback(self._update_image)
+            except ValueError:
+                pass
+        super().destroy()
+
+    def _set_appearance_mode(self, mode_string: str) -> None:
+        """Follow an appearance-mode switch, leaving the redraw to the menu while it is hidden."""
+        menu = getattr(self, "parent_menu", None)
+        if menu is not None and menu._defers_redraw():
+            CTkAppearanceModeBaseClass._set_appearance_mode(self, mode_string)
+            menu._appearance_stale = True
+            return
+        super()._set_appearance_mode(mode_string)
+
     def _execute_if_enabled(self) -> None:
         """Execute button command only if enabled."""
         if self.enabled:
@@ -196,16 +310,12 @@ class _CDMOptionButton(customtkinter.CTkButton):
             base = f"{prefix}{base}"
         # Apply accelerator suffix with spacing
         if self.accelerator:
-            accel_display = self.accelerator
-            # Normalize CmdOrCtrl pseudo-modifier for platform display
+            # Normalize CmdOrCtrl pseudo-modifier for platform display and chord spacing
             try:
-                if sys.platform == 'darwin':
-                    accel_display = accel_display.replace('CmdOrCtrl', 'Cmd')
-                else:
-                    accel_display = accel_display.replace('CmdOrCtrl', 'Ctrl')
+                accel_display = _format_accelerator_display(self.accelerator)
             except Exception:
-                # Fallback: leave as-is if platform check fails
-                pass
+                # Fallback: leave as-is if formatting fails
+                accel_display = self.accelerator
             base = f"{base}    {accel_display}"
         super().configure(text=base)
 
@@ -232,7 +342,13 @@ class _CDMOptionButton(customtkinter.CTkButton):
             "checkable": lambda: self.checkable,
             "icon": lambda: self.icon,
             "scaled_icon_size": lambda: self.icon_size,
-            "icon_size": lambda: self.base_icon_size
+            "icon_size": lambda: self.base_icon_size,
+            "throttle_ms": lambda: self.throttle_ms,
+            "debounce_ms": lambda: self.debounce_ms,
+            "coalesce": lambda: self.coalesce,
+            "disable_while_running": lambda: self.disable_while_running,
+            "run_in_executor": lambda: self.run_in_executor,
+            "running": lambda: self._running_tasks > 0
         }
 
         if param in custom_params:
@@ -255,6 +371,11 @@ class _CDMOptionButton(customtkinter.CTkButton):
             "checkable": self._handle_checkable_config,
             "icon": self._handle_icon_config,
             "icon_size": self._handle_icon_size_config,
+            "throttle_ms": self._handle_throttle_config,
+            "debounce_ms": self._handle_debounce_config,
+            "coalesce": self._handle_coalesce_config,
+            "disable_while_running": self._handle_disable_while_running_config,
+            "run_in_executor": lambda value: setattr(self, 'run_in_executor', value),
         }
 
         # Treat plain text updates as logical text updates to preserve decorations
@@ -274,6 +395,8 @@ class _CDMOptionButton(customtkinter.CTkButton):
         """Handle logical option text change and refresh display."""
         self._option_text = value
         self._refresh_display()
+        if hasattr(self, 'parent_menu'):
+            self.parent_menu._invalidate_label_index()
 
     def _handle_accelerator_config(self, value: str) -> None:
         """Handle accelerator configuration change."""
@@ -287,7 +410,7 @@ class _CDMOptionButton(customtkinter.CTkButton):
         self.checkable = value
         self._refresh_display()
 
-    def _handle_icon_config(self, value: Union[str, PIL.Image.Image]) -> None:
+    def _handle_icon_config(self, value: Union[str, PIL.Image.Image, tuple]) -> None:
         """Handle icon configuration change."""
         self.icon = value
         if value:
@@ -299,4 +422,20 @@ class _CDMOptionButton(customtkinter.CTkButton):
         if value:
             self._setup_icon()
 
+    def _handle_throttle_config(self, value: int) -> None:
+        """Handle throttle_ms configuration change."""
+        self.throttle_ms = self._validate_delay('throttle_ms', value)
+
+    def _handle_debounce_config(self, value: int) -> None:
+        """Handle debounce_ms configuration change."""
+        self.debounce_ms = self._validate_delay('debounce_ms', value)
+
+    def _handle_coalesce_config(self, value: bool) -> None:
+        """Handle coalesce configuration change."""
+        self.coalesce = bool(value)
+
+    def _handle_disable_while_running_config(self, value: bool) -> None:
+        """Handle disable_while_running configuration change."""
+        self.disable_while_running = bool(value)
+
 __all__ = ["_CDMOptionButton"]
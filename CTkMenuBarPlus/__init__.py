@@ -11,4 +11,11 @@ from .menu_bar import CTkMenuBar
 from .title_menu_win import CTkTitleMenu
 from .dropdown_menu import CustomDropdownMenu
 from .context_menu import ContextMenu
-from .accelerators import _unregister_accelerator, _register_accelerator
+from .accelerators import _unregister_accelerator, _register_accelerator, find_conflicts, set_conflict_policy, \
+    accelerator_registry_info, configure_accelerator_repeat
+from .background_tasks import set_async_loop, set_executor_workers
+from .menu_cache import build_menu_from_spec
+from .icon_cache import clear_icon_cache
+from .icon_atlas import IconAtlas, load_icon_atlas, build_icon_atlas
+from .svg_icons import set_svg_renderer
+from .diagnostics import leak_check
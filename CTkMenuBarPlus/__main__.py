@@ -0,0 +1,24 @@
+"""
+Command line tools for CTkMenuBarPlus
+
+    python -m CTkMenuBarPlus build-atlas SOURCE_DIR OUTPUT_DIR [--sizes 16 24 32]
+    python -m CTkMenuBarPlus leak-check [--cycles 20] [--warmup 3]
+"""
+import sys
+from .icon_atlas import main as build_atlas_main
+from .diagnostics import main as leak_check_main
+
+_COMMANDS = {"build-atlas": build_atlas_main, "leak-check": leak_check_main}
+
+
+def main(argv=None) -> int:
+    """Dispatch to the requested tool."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in _COMMANDS:
+        print(f"usage: python -m CTkMenuBarPlus {{{','.join(_COMMANDS)}}} ...", file=sys.stderr)
+        return 2
+    return _COMMANDS[argv[0]](argv[1:])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
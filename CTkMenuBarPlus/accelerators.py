@@ -11,31 +11,180 @@ Usage:
     _register_accelerator(entry, "Ctrl+Return", on_submit, bind_scope='widget')  # bind only to widget
     # cross-platform pseudo-modifier: CmdOrCtrl (Command on macOS, Control elsewhere)
     _register_accelerator(root, "CmdOrCtrl+P", on_print)
+    # multi-stroke chords: strokes separated by spaces
+    _register_accelerator(root, "Ctrl+K Ctrl+C", on_comment)
+
+    from .accelerators import configure_accelerator_repeat
+    configure_accelerator_repeat(root, repeat='throttle', rate_hz=8)  # held Ctrl+Z undoes 8 times/s
 
     from .accelerators import _unregister_accelerator
     _unregister_accelerator(root, "CmdOrCtrl+P")              # remove all callbacks for this accel on target
     _unregister_accelerator(entry, "Ctrl+Return", on_submit)  # remove specific callback
 
+    from .accelerators import find_conflicts, set_conflict_policy
+    set_conflict_policy('raise')  # 'warn' (default), 'replace', 'ignore' or 'raise'
+    for conflict in find_conflicts():
+        print(conflict['accelerator'], conflict['active']['menu_path'], conflict['shadowed'])
+
+    from .accelerators import _forward_accelerators, _stop_forwarding_accelerators
+    _forward_accelerators(palette, root)  # key presses in a torn-off menu reach root's accelerators
+    _stop_forwarding_accelerators(palette)
+
 Notes:
     - You can pass either a toplevel/root (tk.Tk, tk.Toplevel, CTk, CTkToplevel)
       or ANY Tk/CustomTkinter widget (e.g., CTkTextbox, CTkEntry).
     - By default bindings attach to the widget's toplevel (window). Use bind_scope='widget'
       to bind only to the specified widget (fires when the widget has focus).
+    - Chords ("Ctrl+K Ctrl+C") are stored in a per-target prefix trie. After the first
+      stroke the chord stays pending for _CHORD_TIMEOUT_MS; any other stroke cancels it.
+    - Every registration is recorded in a conflict index keyed by (window group, strokes).
+      A second owner claiming the same keys in the same window group (including
+      widget-scoped bindings) is resolved by the conflict policy; the losing record is
+      kept as "shadowed", reported by find_conflicts() and restored once the winner
+      is unregistered.
+    - The registry never keeps windows alive: registrations made for an owner (a menu
+      option) hold the owner and its bound-method callback through weak references, and
+      every target purges its entries on <Destroy>. Callbacks registered without an
+      owner are held strongly until they are unregistered or their target is destroyed.
+      accelerator_registry_info() reports what is currently registered.
+    - A keypress is never handled twice (duplicates are recognized by their Tk event serial).
+      Auto-repeat of a held accelerator is allowed by default and can be throttled or
+      coalesced per window group with configure_accelerator_repeat().
 
 Author: xzyqox (KiTant) | https://github.com/KiTant
 """
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Any, Tuple
+from typing import Callable, Dict, List, Any, Tuple, NamedTuple
+import inspect
 import warnings
+import weakref
 import sys
 import time
+import tkinter as tk
+from .custom_exception_classes import AcceleratorConflictError
+from .widget_pool import _unbind_callback
 
 # Global storage for accelerator bindings, layout-independent
-_GLOBAL_ACCEL_BINDINGS: Dict[int, Dict[str, Dict[int, List[Callable]]]] = {}
-# Last event per group id (toplevel or its transient master) for deduplication:
-# group_id -> (keycode, modifier, timestamp)
-_LAST_ACCEL_EVENT: Dict[int, Tuple[int, str, float]] = {}
+_GLOBAL_ACCEL_BINDINGS: Dict[int, Dict[str, Dict[int, List["_CallbackRef"]]]] = {}
+# Last accepted event per group id (toplevel or its transient master) for deduplication:
+# group_id -> (keycode, modifier, Tk event serial, time.monotonic() timestamp)
+_LAST_ACCEL_EVENT: Dict[int, Tuple[int, str, Any, float]] = {}
+# Per-group key repeat settings; groups without an entry use _default_repeat_config
+_REPEAT_CONFIGS: Dict[int, "_RepeatConfig"] = {}
+# Coalesced accelerators waiting for their idle callback: (target id, modifier, keycode)
+_COALESCE_PENDING: set = set()
+# Parsed accelerator strings: accelerator -> strokes as returned by _parse_accelerator
+_PARSED_ACCELERATORS: Dict[str, List[Tuple[str, List[str], int]]] = {}
+# Multi-stroke accelerators: target id -> root of a prefix trie keyed by (modifier, keycode)
+_CHORD_TRIES: Dict[int, "_ChordNode"] = {}
+# Chord in progress per target id: (trie node reached so far, timeout after() id)
+_PENDING_CHORDS: Dict[int, Tuple["_ChordNode", str]] = {}
+# Key handlers bound on each target: target id -> [(event pattern, handler)]
+_KEY_HANDLERS: Dict[int, List[Tuple[str, Callable]]] = {}
+# Windows whose key presses also reach a target's accelerators (torn-off menus):
+# target id -> {window path: (window, [(event pattern, funcid)])}
+_KEY_FORWARDS: Dict[int, Dict[str, Tuple[Any, List[Tuple[str, str]]]]] = {}
+
+# Time (ms) a chord waits for its next stroke before it is dropped
+_CHORD_TIMEOUT_MS = 1500
+# Keys that only change modifier state; they never advance or cancel a pending chord
+_MODIFIER_KEYSYMS = frozenset((
+    'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R', 'Meta_L', 'Meta_R',
+    'Super_L', 'Super_R', 'Caps_Lock', 'Num_Lock', 'ISO_Level3_Shift', 'Option_L', 'Option_R',
+))
+
+
+# Conflict index: (group id, strokes) -> records claiming those keys, the active one first
+_ACCEL_INDEX: Dict[Tuple[int, Tuple[Tuple[str, int], ...]], List["_AccelRecord"]] = {}
+# How a registration that collides with another owner's accelerator is resolved
+_CONFLICT_POLICIES = ('warn', 'replace', 'ignore', 'raise')
+_conflict_policy = 'warn'
+
+# How repeated presses of the same accelerator (e.g. a held Ctrl+Z) are handled
+_REPEAT_POLICIES = ('allow', 'throttle', 'coalesce')
+
+
+class _RepeatConfig(NamedTuple):
+    """Keypress deduplication and key repeat settings of a window group."""
+    dedup_ms: float = 0.0      # Same-key events closer than this are dropped (0: serial check only)
+    repeat: str = 'allow'      # One of _REPEAT_POLICIES
+    rate_hz: float = 10.0      # Maximum rate of the 'throttle' policy
+
+
+_default_repeat_config = _RepeatConfig()
+
+
+class _CallbackRef:
+    """Callback holder that can avoid keeping the owner of a bound method alive.
+
+    With weak=True bound methods (e.g. an option's _execute_if_enabled) are stored as
+    WeakMethod; plain functions, and every callback with weak=False, are kept as is.
+    Compares equal to the callback it wraps.
+    """
+    __slots__ = ('_weak', '_strong')
+
+    def __init__(self, callback: Callable, weak: bool = False):
+        if weak and inspect.ismethod(callback):
+            self._weak, self._strong = weakref.WeakMethod(callback), None
+        else:
+            self._weak, self._strong = None, callback
+
+    def resolve(self) -> Callable | None:
+        """Return the callback, or None once its owner has been garbage collected."""
+        return self._weak() if self._weak is not None else self._strong
+
+    def __eq__(self, other: Any) -> bool:
+        mine = self.resolve()
+        theirs = other.resolve() if isinstance(other, _CallbackRef) else other
+        if mine is None or theirs is None:
+            return self is other
+        return mine == theirs
+
+    __hash__ = None
+
+
+class _AccelRecord:
+    """Who registered an accelerator: callback, owning option and menu path, and bound targets."""
+    __slots__ = ('accelerator', 'path', 'callback', '_owner', 'menu_path', 'scope', 'target_ids')
+
+    def __init__(self, accelerator: str, path: Tuple[Tuple[str, int], ...], callback: Callable,
+                 owner: Any, menu_path: str | None, scope: str):
+        self.accelerator = accelerator
+        self.path = path
+        # Only an owner ties the callback's lifetime to a widget; direct callers keep theirs alive
+        self.callback = _CallbackRef(callback, weak=owner is not None)
+        try:
+            self._owner = weakref.ref(owner) if owner is not None else None
+        except TypeError:
+            self._owner = lambda: owner
+        self.menu_path = menu_path
+        self.scope = scope
+        self.target_ids: set[int] = set()
+
+    @property
+    def owner(self) -> Any:
+        """The owning object, or None if there is none or it was garbage collected."""
+        return self._owner() if self._owner is not None else None
+
+    def describe(self) -> Dict[str, Any]:
+        """Return a plain-dict description for conflict reports."""
+        return {
+            'accelerator': self.accelerator,
+            'menu_path': self.menu_path or getattr(self.callback.resolve(), '__qualname__', repr(self.callback)),
+            'owner': self.owner,
+            'scope': self.scope,
+        }
+
+
+class _ChordNode:
+    """Node of a chord prefix trie: child strokes and callbacks of a completed chord."""
+    __slots__ = ('path', 'children', 'callbacks')
+
+    def __init__(self, path: Tuple[Tuple[str, int], ...] = ()):
+        self.path = path  # Strokes leading from the trie root to this node
+        self.children: Dict[Tuple[str, int], _ChordNode] = {}
+        self.callbacks: List[_CallbackRef] = []
 
 
 def _get_platform_keymaps() -> Tuple[Dict[str, int], Dict[str, int]]:
@@ -170,45 +319,17 @@ def _parse_modifiers(mod_tokens: List[str]) -> Tuple[str, List[str]]:
     return mods_key, tk_mods
 
 
-def _register_accelerator(widget_or_root: Any, accelerator: str, callback: Callable, *, bind_scope: str = 'window') -> None:
-    """Register a keyboard accelerator that works regardless of keyboard layout.
-
-    Supported Modifiers: Ctrl, Alt, Shift, Cmd (macOS)
-    Supported Keys: A-Z, 0-9, F1-F12, Delete, Insert, Home, End, Page_Up, Page_Down, etc.
-    Supports both single keys (F1, F2, Delete) and modified keys (Ctrl+S, Alt+F4)
+def _parse_stroke(stroke: str, *, warn: bool = True) -> Tuple[str, List[str], int] | None:
+    """Parse a single keystroke such as 'Ctrl+S', 'Alt+F4' or 'F1'.
 
     Args:
-        widget_or_root: Any Tk/CustomTkinter widget or a toplevel/root.
-        accelerator: Accelerator string in format 'Modifier+Key' or just 'Key' (e.g., "Ctrl+S", "Alt+F4", "F1")
-        callback: Function to call when the accelerator is triggered
-        bind_scope: Where to bind the handler. Options:
-            - 'window': bind on the widget's toplevel so the shortcut works for the entire window
-            - 'widget': bind directly on the provided widget (fires when that widget has focus)
-    """
-    if not accelerator or not isinstance(accelerator, str):
-        return
-
-    # Resolve toplevel/root from any widget
-    try:
-        root = widget_or_root.winfo_toplevel()
-    except Exception:
-        # Fall back to the provided object if it already behaves like a root
-        root = widget_or_root
-
-    # Determine actual binding target based on scope
-    if bind_scope not in ('window', 'widget'):
-        warnings.warn(f"_register_accelerator: unknown bind_scope '{bind_scope}', defaulting to 'window'")
-        bind_scope = 'window'
-
-    target = root if bind_scope == 'window' else widget_or_root
-
-    # Ensure target has the minimal Tk API we need
-    if not hasattr(target, 'winfo_id') or not hasattr(target, 'bind'):
-        warnings.warn("_register_accelerator: provided object does not expose Tk widget API")
-        return
+        stroke: Keystroke in format 'Modifier+Key' or just 'Key'
+        warn: Whether to warn about unsupported keys
 
-    # Parse accelerator string (e.g., "Ctrl+S", "Alt+F4", "F1", "Delete")
-    parts = [p.strip() for p in accelerator.split('+')]
+    Returns:
+        (mods_key, tk_mods, keycode) or None if the stroke cannot be parsed
+    """
+    parts = [p.strip() for p in stroke.split('+')]
 
     # Determine modifiers and key
     if len(parts) == 1:
@@ -219,7 +340,7 @@ def _register_accelerator(widget_or_root: Any, accelerator: str, callback: Calla
         try:
             mods_key, tk_mods = _parse_modifiers(mods)
         except ValueError:
-            return
+            return None
 
     # Enhanced key mapping including function keys and special keys
     key_upper = key.upper()
@@ -237,171 +358,737 @@ def _register_accelerator(widget_or_root: Any, accelerator: str, callback: Calla
         keycode = ord(key_upper)
     else:
         # Unsupported key
-        warnings.warn(f"Unsupported key in accelerator: {key}")
-        return
+        if warn:
+            warnings.warn(f"Unsupported key in accelerator: {key}")
+        return None
 
-    # Store binding info
-    target_id = target.winfo_id()
-    bindings = _GLOBAL_ACCEL_BINDINGS.setdefault(target_id, {})
-    modifier_bindings = bindings.setdefault(mods_key, {})
-    callbacks = modifier_bindings.setdefault(keycode, [])
-    # Keep only a single callback per accelerator within a window.
-    # Replace any existing different callback to avoid multiple firings.
-    if callbacks == [callback]:
-        pass
+    return mods_key, tk_mods, keycode
+
+
+def _parse_accelerator(accelerator: str, *, warn: bool = True) -> List[Tuple[str, List[str], int]] | None:
+    """Parse an accelerator into its strokes; chords separate strokes with spaces.
+
+    Returns:
+        List of (mods_key, tk_mods, keycode) per stroke, or None if any stroke is invalid
+    """
+    cached = _PARSED_ACCELERATORS.get(accelerator)
+    if cached is not None:
+        return list(cached)
+    strokes = []
+    for stroke in accelerator.split():
+        parsed = _parse_stroke(stroke, warn=warn)
+        if parsed is None:
+            return None
+        strokes.append(parsed)
+    if strokes:
+        _PARSED_ACCELERATORS[accelerator] = strokes
+    return list(strokes) or None
+
+
+def _seed_parsed_accelerators(parsed: Dict[str, List[Tuple[str, List[str], int]]]) -> None:
+    """Provide already parsed accelerators (e.g. from a menu snapshot) to skip parsing them again."""
+    for accelerator, strokes in parsed.items():
+        _PARSED_ACCELERATORS[accelerator] = [(mods_key, list(tk_mods), int(keycode))
+                                             for mods_key, tk_mods, keycode in strokes]
+
+
+def _format_accelerator_display(accelerator: str) -> str:
+    """Return the accelerator as shown in menus (platform modifiers, one space between strokes)."""
+    replacement = 'Cmd' if sys.platform == 'darwin' else 'Ctrl'
+    return ' '.join(stroke.replace('CmdOrCtrl', replacement) for stroke in accelerator.split())
+
+
+def _resolve_target(widget_or_root: Any, bind_scope: str) -> Any:
+    """Return the binding target for bind_scope ('window' -> toplevel, 'widget' -> the widget)."""
+    try:
+        root = widget_or_root.winfo_toplevel()
+    except Exception:
+        # Fall back to the provided object if it already behaves like a root
+        root = widget_or_root
+    return root if bind_scope == 'window' else widget_or_root
+
+
+def _prune_single_binding(t_id: int, mod: str, keycode: int, cb: Callable | None) -> bool:
+    """Remove cb (or all callbacks if None) for a single-stroke binding, dropping empty containers."""
+    bindings = _GLOBAL_ACCEL_BINDINGS.get(t_id)
+    if not bindings:
+        return False
+    mod_dict = bindings.get(mod)
+    if not mod_dict or keycode not in mod_dict:
+        return False
+
+    removed = False
+    if cb is None:
+        del mod_dict[keycode]
+        removed = True
     else:
-        callbacks.clear()
-        callbacks.append(callback)
+        try:
+            mod_dict[keycode].remove(cb)
+            removed = True
+            if not mod_dict[keycode]:
+                del mod_dict[keycode]
+        except ValueError:
+            pass
+
+    # Cleanup empty containers
+    if removed and not mod_dict:
+        del bindings[mod]
+    if removed and not bindings:
+        del _GLOBAL_ACCEL_BINDINGS[t_id]
+    return removed
+
+
+def _prune_chord_binding(t_id: int, path: Tuple[Tuple[str, int], ...], cb: Callable | None) -> bool:
+    """Remove cb (or all callbacks if None) for a chord, dropping trie nodes left empty."""
+    root = _CHORD_TRIES.get(t_id)
+    if root is None:
+        return False
+    nodes = [root]
+    for stroke in path:
+        child = nodes[-1].children.get(stroke)
+        if child is None:
+            return False
+        nodes.append(child)
+
+    leaf = nodes[-1]
+    if cb is None:
+        removed = bool(leaf.callbacks)
+        leaf.callbacks.clear()
+    else:
+        try:
+            leaf.callbacks.remove(cb)
+            removed = True
+        except ValueError:
+            removed = False
+
+    # Walk back up removing nodes without callbacks or children
+    for depth in range(len(path), 0, -1):
+        node = nodes[depth]
+        if node.callbacks or node.children:
+            break
+        del nodes[depth - 1].children[path[depth - 1]]
+    if not root.children:
+        del _CHORD_TRIES[t_id]
+    return removed
+
+
+def _run_callbacks(callbacks: List[_CallbackRef], prune: Callable[[_CallbackRef], Any]) -> None:
+    """Invoke accelerator callbacks, pruning any that raise or whose owner is gone."""
+    for cb in list(callbacks):  # iterate over a copy; may modify original
+        func = cb.resolve()
+        if func is None:
+            prune(cb)
+            continue
+        try:
+            func()
+        except Exception as e:
+            warnings.warn(f"Error in accelerator callback: {e}")
+            # Auto-prune stale/broken callback to avoid future warnings
+            try:
+                prune(cb)
+            except Exception:
+                pass
+
 
+def _cancel_pending_chord(target: Any, t_id: int) -> None:
+    """Drop the chord in progress on target, if any."""
+    pending = _PENDING_CHORDS.pop(t_id, None)
+    if pending is not None:
+        try:
+            target.after_cancel(pending[1])
+        except Exception:
+            pass
+
+
+def _set_pending_chord(target: Any, t_id: int, node: _ChordNode) -> None:
+    """Remember node as the chord in progress and arm its timeout."""
+    _cancel_pending_chord(target, t_id)
+    timer = target.after(_CHORD_TIMEOUT_MS, lambda: _PENDING_CHORDS.pop(t_id, None))
+    _PENDING_CHORDS[t_id] = (node, timer)
+
+
+def _accept_key_event(group_id: int, config: _RepeatConfig, mod: str, event: Any) -> bool:
+    """Decide whether a matched accelerator keypress should fire.
+
+    The same Tk event (same serial) seen twice, e.g. through both the overlay and its
+    transient master, never fires twice. Other presses of the key accepted last are
+    filtered by the group's dedup window and, for the 'throttle' policy, by its rate.
+    Timing uses time.monotonic() so wall-clock adjustments cannot affect it.
+    """
+    now = time.monotonic()
+    serial = getattr(event, 'serial', None)
+    if not isinstance(serial, int):  # Tk reports '??' when the serial is unknown
+        serial = None
+    last = _LAST_ACCEL_EVENT.get(group_id)
+    if last is not None and last[0] == event.keycode and last[1] == mod:
+        if serial is not None and serial == last[2]:
+            return False
+        elapsed_ms = (now - last[3]) * 1000.0
+        if elapsed_ms < config.dedup_ms:
+            return False
+        if config.repeat == 'throttle' and config.rate_hz > 0 and elapsed_ms < 1000.0 / config.rate_hz:
+            return False
+    _LAST_ACCEL_EVENT[group_id] = (event.keycode, mod, serial, now)
+    return True
+
+
+def _coalesce_callbacks(target: Any, t_id: int, mod: str, keycode: int) -> None:
+    """Run the callbacks of an accelerator once the event queue is idle.
+
+    Presses arriving while a run is still queued are merged into it, so a held key
+    never queues more work than the application can keep up with.
+    """
+    key = (t_id, mod, keycode)
+    if key in _COALESCE_PENDING:
+        return
+    _COALESCE_PENDING.add(key)
+
+    def _run() -> None:
+        _COALESCE_PENDING.discard(key)
+        cb_list = _GLOBAL_ACCEL_BINDINGS.get(t_id, {}).get(mod, {}).get(keycode)
+        if cb_list:
+            _run_callbacks(cb_list, lambda cb: _prune_single_binding(t_id, mod, keycode, cb))
+
+    try:
+        target.after_idle(_run)
+    except Exception:
+        _run()
+
+
+def _ensure_key_handler(target: Any, target_id: int, mods_key: str, tk_mods: List[str]) -> None:
+    """Bind the shared key handler for one modifier combination on target (once)."""
     # Create unique handler attribute name for this modifier combination
     handler_attr = f"_ctkmenubar_{mods_key.replace('+', '_')}_binding"
 
     # Ensure we have the generic handler only once per root per modifier
-    if not hasattr(target, handler_attr):
-        def _handle_key_press(event, mod=mods_key, t_id=target_id, tgt=target):
-            # Only handle if the event focus is within the same window group as the target
-            try:
-                focus_widget = event.widget or tgt.focus_displayof() or tgt.focus_get()
-                if not focus_widget:
-                    return
-                active_tl = focus_widget.winfo_toplevel()
-                # Compare group ids (toplevel or its transient master)
-                group_active = _get_group_id(active_tl)
-                group_target = _get_group_id(tgt)
-                if group_active != group_target:
-                    return
-            except Exception:
-                # If we cannot determine focus/toplevel reliably, do not handle
+    if hasattr(target, handler_attr):
+        return
+
+    def _handle_key_press(event, mod=mods_key, t_id=target_id, tgt=target):
+        # Only handle if the event focus is within the same window group as the target
+        try:
+            focus_widget = event.widget or tgt.focus_displayof() or tgt.focus_get()
+            if not focus_widget:
+                return
+            active_tl = focus_widget.winfo_toplevel()
+            # Compare group ids (toplevel or its transient master)
+            group_active = _get_group_id(active_tl)
+            group_target = _get_group_id(tgt)
+            if group_active != group_target:
                 return
+        except Exception:
+            # If we cannot determine focus/toplevel reliably, do not handle
+            return
 
-            # Create event signature for deduplication per target
-            current_time = time.time()
-            group_id = _get_group_id(tgt)
-            last = _LAST_ACCEL_EVENT.get(group_id)
-            if last and last[0] == event.keycode and last[1] == mod and current_time - last[2] < 0.1:
+        stroke = (mod, event.keycode)
+        pending = _PENDING_CHORDS.get(t_id)
+        if pending is not None:
+            if getattr(event, 'keysym', None) in _MODIFIER_KEYSYMS:
                 return
-            _LAST_ACCEL_EVENT[group_id] = (event.keycode, mod, current_time)
-
-            modifier_dict = _GLOBAL_ACCEL_BINDINGS.get(t_id, {}).get(mod, {})
-            cb_list = modifier_dict.get(event.keycode, [])
-            if cb_list:
-                for cb in list(cb_list):  # iterate over a copy; may modify original
-                    try:
-                        cb()
-                    except Exception as e:
-                        warnings.warn(f"Error in accelerator callback: {e}")
-                        # Auto-prune stale/broken callback to avoid future warnings
-                        try:
-                            store = _GLOBAL_ACCEL_BINDINGS.get(t_id, {}).get(mod, {})
-                            lst = store.get(event.keycode)
-                            if lst and cb in lst:
-                                lst.remove(cb)
-                                if not lst:
-                                    del store[event.keycode]
-                                    # If modifier has no keys left, remove it
-                                    parent = _GLOBAL_ACCEL_BINDINGS.get(t_id, {})
-                                    if not store and mod in parent:
-                                        del parent[mod]
-                                        # If target has no mods left, remove it
-                                        if not parent and t_id in _GLOBAL_ACCEL_BINDINGS:
-                                            del _GLOBAL_ACCEL_BINDINGS[t_id]
-                        except Exception:
-                            pass
+            # Advance the chord in progress; any other stroke cancels it and is consumed
+            _cancel_pending_chord(tgt, t_id)
+            node = pending[0].children.get(stroke)
+            if node is not None:
+                if node.children:
+                    _set_pending_chord(tgt, t_id, node)
+                else:
+                    _run_callbacks(node.callbacks, lambda cb: _prune_chord_binding(t_id, node.path, cb))
+            return "break"
+
+        keycode = event.keycode
+        modifier_dict = _GLOBAL_ACCEL_BINDINGS.get(t_id, {}).get(mod, {})
+        cb_list = modifier_dict.get(keycode, [])
+        if cb_list:
+            # Dropped duplicates and throttled repeats are still consumed so that they
+            # do not fall through to class bindings (e.g. the Text widget's own undo)
+            group_id = _get_group_id(tgt)
+            config = _REPEAT_CONFIGS.get(group_id, _default_repeat_config)
+            if not _accept_key_event(group_id, config, mod, event):
                 return "break"
+            if config.repeat == 'coalesce':
+                _coalesce_callbacks(tgt, t_id, mod, keycode)
+            else:
+                _run_callbacks(cb_list, lambda cb: _prune_single_binding(t_id, mod, keycode, cb))
+            return "break"
 
-        # Bind to chosen target (window or widget)
-        if mods_key == 'none':
-            target.bind('<KeyPress>', _handle_key_press, add='+')
-        else:
-            event_pattern = '<' + '-'.join(tk_mods + ['KeyPress']) + '>'
-            target.bind(event_pattern, _handle_key_press, add='+')
+        # First stroke of a chord? Unrelated keys are rejected by this single lookup.
+        trie = _CHORD_TRIES.get(t_id)
+        node = trie.children.get(stroke) if trie is not None else None
+        if node is not None:
+            _set_pending_chord(tgt, t_id, node)
+            return "break"
 
-        setattr(target, handler_attr, True)
+    # Bind to chosen target (window or widget) and to the windows forwarding to it
+    if mods_key == 'none':
+        event_pattern = '<KeyPress>'
+    else:
+        event_pattern = '<' + '-'.join(tk_mods + ['KeyPress']) + '>'
+    target.bind(event_pattern, _handle_key_press, add='+')
+    _KEY_HANDLERS.setdefault(target_id, []).append((event_pattern, _handle_key_press))
+    for window, bindings in _KEY_FORWARDS.get(target_id, {}).values():
+        bindings.append((event_pattern, tk.Misc.bind(window, event_pattern, _handle_key_press, '+')))
 
-    # Remove previous bind_all routing to avoid duplicate firings. We rely on
-    # per-window binding with active-window guard above.
+    setattr(target, handler_attr, True)
 
 
-def _unregister_accelerator(widget_or_root: Any, accelerator: str, callback: Callable | None = None, *, bind_scope: str = 'window') -> bool:
-    """Unregister accelerator from a window or a specific widget.
+def _ensure_chord_canceller(target: Any, target_id: int) -> None:
+    """Cancel a pending chord on any other key press on target (bound once per target).
+
+    Key handlers are only bound for the modifier combinations used by accelerators, so a
+    plain key (e.g. "x" after "Ctrl+K") would otherwise leave the chord armed until its
+    timeout. Tk runs only the most specific binding per tag, so this <KeyPress> binding
+    sees exactly the strokes no accelerator handler is bound for.
+    """
+    if hasattr(target, '_ctkmenubar_chord_canceller'):
+        return
+
+    def _cancel_chord(event, t_id=target_id, tgt=target):
+        if hasattr(tgt, '_ctkmenubar_none_binding'):
+            return None  # The unmodified-key handler advances or cancels chords itself
+        if t_id not in _PENDING_CHORDS or getattr(event, 'keysym', None) in _MODIFIER_KEYSYMS:
+            return None
+        _cancel_pending_chord(tgt, t_id)
+        return "break"
+
+    target.bind('<KeyPress>', _cancel_chord, add='+')
+    _KEY_HANDLERS.setdefault(target_id, []).append(('<KeyPress>', _cancel_chord))
+    for window, bindings in _KEY_FORWARDS.get(target_id, {}).values():
+        bindings.append(('<KeyPress>', tk.Misc.bind(window, '<KeyPress>', _cancel_chord, '+')))
+    setattr(target, '_ctkmenubar_chord_canceller', True)
+
+
+def _forward_accelerators(window: Any, target: Any) -> None:
+    """Let the accelerators registered on target also fire while the focus is in window.
+
+    A torn-off menu is a window of its own; forwarding its key presses keeps using the
+    registrations of the window it came from instead of registering them a second time.
+    window has to be transient for target's window group.
 
     Args:
-        widget_or_root: Any Tk/CustomTkinter widget or a toplevel/root.
-        accelerator: Accelerator string 'Modifier+Key' or just 'Key'. Supports 'CmdOrCtrl'.
-        callback: Optional specific callback to remove. If None, removes all callbacks for this accelerator.
-        bind_scope: 'window' to target the widget's toplevel, or 'widget' to target only the widget.
+        window: Toplevel (or frame managed as a toplevel) receiving the key presses
+        target: Window the accelerators are registered on
+    """
+    forwards = _KEY_FORWARDS.setdefault(target.winfo_id(), {})
+    if str(window) in forwards:
+        return
+    # Bound on the Tk level: customtkinter frames would bind on their canvas instead
+    forwards[str(window)] = (window, [(pattern, tk.Misc.bind(window, pattern, handler, '+'))
+                                      for pattern, handler in _KEY_HANDLERS.get(target.winfo_id(), ())])
+
+
+def _stop_forwarding_accelerators(window: Any) -> None:
+    """Undo every _forward_accelerators() call made for window."""
+    for t_id in list(_KEY_FORWARDS):
+        entry = _KEY_FORWARDS[t_id].pop(str(window), None)
+        if entry is not None:
+            for pattern, funcid in entry[1]:
+                _unbind_callback(window, pattern, funcid)
+        if not _KEY_FORWARDS[t_id]:
+            del _KEY_FORWARDS[t_id]
+
+
+def set_conflict_policy(policy: str) -> None:
+    """Choose how accelerator conflicts within a window group are resolved.
+
+    Args:
+        policy: One of
+            - 'warn': the newest registration wins and a warning is issued (default)
+            - 'replace': the newest registration wins silently
+            - 'ignore': the existing registration is kept, the new one is only recorded
+            - 'raise': AcceleratorConflictError is raised for the new registration
+    """
+    global _conflict_policy
+    if policy not in _CONFLICT_POLICIES:
+        raise ValueError(f"Unknown accelerator conflict policy '{policy}', expected one of {_CONFLICT_POLICIES}")
+    _conflict_policy = policy
+
+
+def get_conflict_policy() -> str:
+    """Return the active accelerator conflict policy."""
+    return _conflict_policy
+
+
+def configure_accelerator_repeat(widget: Any = None, *, dedup_ms: float | None = None,
+                                 repeat: str | None = None, rate_hz: float | None = None) -> None:
+    """Configure keypress deduplication and key repeat handling of accelerators.
+
+    Args:
+        widget: Any widget of the window to configure (the setting applies to its window group);
+            None changes the default used by all windows without their own setting
+        dedup_ms: Presses of the same accelerator closer than this many milliseconds are
+            dropped (0 disables the window; the same Tk event is never handled twice)
+        repeat: Key repeat policy:
+            - 'allow': every press and auto-repeat fires (default)
+            - 'throttle': repeats fire at most rate_hz times per second
+            - 'coalesce': repeats arriving while a run is still queued are merged into it
+        rate_hz: Maximum repeat rate for the 'throttle' policy
+
+    Raises:
+        ValueError: If repeat is not a known policy or a value is negative
+    """
+    global _default_repeat_config
+    if repeat is not None and repeat not in _REPEAT_POLICIES:
+        raise ValueError(f"Unknown accelerator repeat policy '{repeat}', expected one of {_REPEAT_POLICIES}")
+    if (dedup_ms is not None and dedup_ms < 0) or (rate_hz is not None and rate_hz < 0):
+        raise ValueError("dedup_ms and rate_hz must not be negative")
+
+    if widget is None:
+        current = _default_repeat_config
+    else:
+        group_id = _get_group_id(widget)
+        current = _REPEAT_CONFIGS.get(group_id, _default_repeat_config)
+    changes = {name: value for name, value in (('dedup_ms', dedup_ms), ('repeat', repeat), ('rate_hz', rate_hz))
+               if value is not None}
+    updated = current._replace(**changes)
+
+    if widget is None:
+        _default_repeat_config = updated
+    else:
+        _REPEAT_CONFIGS[group_id] = updated
+        # Drop the setting with its window (window ids can be reused)
+        _ensure_destroy_handler(_get_transient_master(widget) or widget.winfo_toplevel(), group_id)
+
+
+def get_accelerator_repeat(widget: Any = None) -> Dict[str, Any]:
+    """Return the deduplication and repeat settings used for widget's window (or the default).
 
     Returns:
-        True if something was removed, False otherwise.
+        Dict with 'dedup_ms', 'repeat' and 'rate_hz'
     """
-    if not accelerator or not isinstance(accelerator, str):
-        return False
+    if widget is None:
+        return _default_repeat_config._asdict()
+    return _REPEAT_CONFIGS.get(_get_group_id(widget), _default_repeat_config)._asdict()
+
+
+def find_conflicts() -> List[Dict[str, Any]]:
+    """Report accelerators claimed by more than one owner in the same window group.
 
-    # Resolve target
+    Returns:
+        One dict per conflicting key with 'group_id', 'accelerator', the 'active'
+        record description and the list of 'shadowed' record descriptions.
+    """
+    report = []
+    for key in list(_ACCEL_INDEX):
+        group_id, _path = key
+        records = _live_records(key)
+        if len(records) > 1:
+            report.append({
+                'group_id': group_id,
+                'accelerator': records[0].accelerator,
+                'active': records[0].describe(),
+                'shadowed': [record.describe() for record in records[1:]],
+            })
+    return report
+
+
+def _index_key(target: Any, path: Tuple[Tuple[str, int], ...]) -> Tuple[int, Tuple[Tuple[str, int], ...]]:
+    """Return the conflict index key of path registered on target."""
     try:
-        root = widget_or_root.winfo_toplevel()
+        group_id = _get_group_id(target)
     except Exception:
-        root = widget_or_root
+        group_id = int(target.winfo_id())
+    return group_id, path
 
-    if bind_scope not in ('window', 'widget'):
-        bind_scope = 'window'
-    target = root if bind_scope == 'window' else widget_or_root
 
-    if not hasattr(target, 'winfo_id'):
-        return False
+def _live_records(key: Tuple[int, Tuple[Tuple[str, int], ...]]) -> List[_AccelRecord]:
+    """Return the records of key after dropping those whose callback owner was garbage collected.
 
-    # Parse accelerator (allow multiple modifiers)
-    parts = [p.strip() for p in accelerator.split('+')]
-    if len(parts) == 1:
-        mods_key, _tk_mods = 'none', []
-        key = parts[0]
-    else:
-        *mods, key = parts
-        try:
-            mods_key, _tk_mods = _parse_modifiers(mods)
-        except ValueError:
-            return False
+    If the active record is dropped, the next live one is bound in its place.
+    """
+    records = _ACCEL_INDEX.get(key)
+    if not records:
+        return []
+    active = records[0]
+    records[:] = [record for record in records if record.callback.resolve() is not None]
+    if not records:
+        del _ACCEL_INDEX[key]
+    elif records[0] is not active:
+        for t_id in records[0].target_ids:
+            _store_callback(t_id, records[0].path, records[0].callback)
+    return records
 
-    key_upper = key.upper()
 
-    # Platform-specific keycode dictionaries (same as in _register_accelerator)
-    function_keys, special_keys = _get_platform_keymaps()
+def _lookup_accelerator_records(widget: Any, accelerator: str) -> List[_AccelRecord]:
+    """Return every live record for accelerator in widget's window group, the active one first."""
+    if not accelerator or not isinstance(accelerator, str):
+        return []
+    strokes = _parse_accelerator(accelerator, warn=False)
+    if strokes is None:
+        return []
+    return list(_live_records(_index_key(widget, tuple((m, k) for m, _t, k in strokes))))
 
-    if key_upper in function_keys:
-        keycode = function_keys[key_upper]
-    elif key_upper in special_keys:
-        keycode = special_keys[key_upper]
-    elif len(key) == 1 and key.isalnum():
-        keycode = ord(key_upper)
+
+def _lookup_accelerator(widget: Any, accelerator: str) -> _AccelRecord | None:
+    """Return the active record for accelerator in widget's window group (one dict lookup)."""
+    records = _lookup_accelerator_records(widget, accelerator)
+    return records[0] if records else None
+
+
+def _check_conflict(widget: Any, accelerator: str, owner: Any = None) -> None:
+    """Raise AcceleratorConflictError up front when the policy is 'raise' and accelerator is taken."""
+    if _conflict_policy != 'raise':
+        return
+    record = _lookup_accelerator(widget, accelerator)
+    if record is not None and record.owner is not owner:
+        raise AcceleratorConflictError(
+            f"Accelerator '{accelerator}' is already used by '{record.describe()['menu_path']}'")
+
+
+def _store_callback(t_id: int, path: Tuple[Tuple[str, int], ...], callback: _CallbackRef) -> None:
+    """Make callback the single callback of path on target t_id."""
+    if len(path) == 1:
+        mods_key, keycode = path[0]
+        callbacks = _GLOBAL_ACCEL_BINDINGS.setdefault(t_id, {}).setdefault(mods_key, {}).setdefault(keycode, [])
     else:
+        node = _CHORD_TRIES.setdefault(t_id, _ChordNode())
+        for stroke in path:
+            if stroke not in node.children:
+                node.children[stroke] = _ChordNode(node.path + (stroke,))
+            node = node.children[stroke]
+        callbacks = node.callbacks
+    # Keep only a single callback per accelerator within a window.
+    # Replace any existing different callback to avoid multiple firings.
+    if callbacks != [callback]:
+        callbacks.clear()
+        callbacks.append(callback)
+
+
+def _prune_callback(t_id: int, path: Tuple[Tuple[str, int], ...], callback: Callable | None) -> bool:
+    """Remove callback (or all callbacks if None) of path from target t_id."""
+    if len(path) == 1:
+        return _prune_single_binding(t_id, path[0][0], path[0][1], callback)
+    return _prune_chord_binding(t_id, path, callback)
+
+
+def _ensure_destroy_handler(target: Any, target_id: int) -> None:
+    """Purge everything registered for target when it is destroyed (bound once per target)."""
+    if hasattr(target, '_ctkmenubar_destroy_binding'):
+        return
+
+    def _handle_destroy(event, t_id=target_id, path=str(target)):
+        # <Destroy> of child widgets also reaches the toplevel's bindings
+        if str(event.widget) == path:
+            _purge_target(t_id)
+
+    target.bind('<Destroy>', _handle_destroy, add='+')
+    setattr(target, '_ctkmenubar_destroy_binding', True)
+
+
+def _purge_target(t_id: int) -> None:
+    """Remove all bindings, chords and index records that reference target id t_id.
+
+    Window ids can be reused by Tk, so nothing registered for a destroyed window may survive.
+    """
+    _GLOBAL_ACCEL_BINDINGS.pop(t_id, None)
+    _KEY_HANDLERS.pop(t_id, None)
+    for window, bindings in _KEY_FORWARDS.pop(t_id, {}).values():
+        for pattern, funcid in bindings:
+            _unbind_callback(window, pattern, funcid)
+    _CHORD_TRIES.pop(t_id, None)
+    _PENDING_CHORDS.pop(t_id, None)
+    _LAST_ACCEL_EVENT.pop(t_id, None)
+    _REPEAT_CONFIGS.pop(t_id, None)
+    for key in [key for key in _COALESCE_PENDING if key[0] == t_id]:
+        _COALESCE_PENDING.discard(key)
+    for key, records in list(_ACCEL_INDEX.items()):
+        active = records[0]
+        for record in list(records):
+            record.target_ids.discard(t_id)
+            if not record.target_ids:
+                records.remove(record)
+        if not records:
+            del _ACCEL_INDEX[key]
+        elif records[0] is not active:
+            for other_id in records[0].target_ids:
+                _store_callback(other_id, records[0].path, records[0].callback)
+
+
+def accelerator_registry_info() -> Dict[str, Any]:
+    """Report live accelerator registry entries for leak diagnostics.
+
+    Returns:
+        Dict with the number of registered targets, single-stroke bindings, chord
+        bindings, pending chords, index records (and how many are shadowed), callbacks
+        whose owner has been garbage collected, and dedup entries, plus a per-target
+        breakdown under 'targets'.
+    """
+    def _chord_callbacks(node: _ChordNode) -> List[_CallbackRef]:
+        found = list(node.callbacks)
+        for child in node.children.values():
+            found.extend(_chord_callbacks(child))
+        return found
+
+    per_target: Dict[int, Dict[str, int]] = {}
+    dead = 0
+    for t_id, mods in _GLOBAL_ACCEL_BINDINGS.items():
+        refs = [cb for keycodes in mods.values() for cbs in keycodes.values() for cb in cbs]
+        per_target.setdefault(t_id, {'bindings': 0, 'chords': 0})['bindings'] = len(refs)
+        dead += sum(1 for cb in refs if cb.resolve() is None)
+    for t_id, root in _CHORD_TRIES.items():
+        refs = _chord_callbacks(root)
+        per_target.setdefault(t_id, {'bindings': 0, 'chords': 0})['chords'] = len(refs)
+        dead += sum(1 for cb in refs if cb.resolve() is None)
+
+    records = [record for entries in _ACCEL_INDEX.values() for record in entries]
+    return {
+        'target_count': len(per_target),
+        'bindings': sum(info['bindings'] for info in per_target.values()),
+        'chords': sum(info['chords'] for info in per_target.values()),
+        'pending_chords': len(_PENDING_CHORDS),
+        'index_records': len(records),
+        'shadowed_records': len(records) - len(_ACCEL_INDEX),
+        'dead_callbacks': dead,
+        'dedup_entries': len(_LAST_ACCEL_EVENT),
+        'targets': per_target,
+    }
+
+
+def _register_accelerator(widget_or_root: Any, accelerator: str, callback: Callable, *, bind_scope: str = 'window',
+                          owner: Any = None, menu_path: str | None = None) -> bool:
+    """Register a keyboard accelerator that works regardless of keyboard layout.
+
+    Supported Modifiers: Ctrl, Alt, Shift, Cmd (macOS)
+    Supported Keys: A-Z, 0-9, F1-F12, Delete, Insert, Home, End, Page_Up, Page_Down, etc.
+    Supports both single keys (F1, F2, Delete) and modified keys (Ctrl+S, Alt+F4), as well
+    as multi-stroke chords separated by spaces (Ctrl+K Ctrl+C)
+
+    Args:
+        widget_or_root: Any Tk/CustomTkinter widget or a toplevel/root.
+        accelerator: Accelerator string in format 'Modifier+Key' or just 'Key' (e.g., "Ctrl+S", "Alt+F4", "F1"),
+            or several such strokes separated by spaces for a chord (e.g., "Ctrl+K Ctrl+C")
+        callback: Function to call when the accelerator is triggered
+        bind_scope: Where to bind the handler. Options:
+            - 'window': bind on the widget's toplevel so the shortcut works for the entire window
+            - 'widget': bind directly on the provided widget (fires when that widget has focus)
+        owner: Object owning the registration (e.g. a menu option); registrations of the same
+            owner on several targets never conflict with each other. A bound-method callback
+            of a registration with an owner is held weakly and dropped once its object is gone
+        menu_path: Human-readable location of the owner used in conflict reports
+
+    Returns:
+        True if the callback is now bound, False if it was rejected or only recorded as shadowed.
+
+    Raises:
+        AcceleratorConflictError: If the keys are taken in this window group and the policy is 'raise'
+    """
+    if not accelerator or not isinstance(accelerator, str):
+        return False
+
+    # Determine actual binding target based on scope
+    if bind_scope not in ('window', 'widget'):
+        warnings.warn(f"_register_accelerator: unknown bind_scope '{bind_scope}', defaulting to 'window'")
+        bind_scope = 'window'
+
+    target = _resolve_target(widget_or_root, bind_scope)
+
+    # Ensure target has the minimal Tk API we need
+    if not hasattr(target, 'winfo_id') or not hasattr(target, 'bind'):
+        warnings.warn("_register_accelerator: provided object does not expose Tk widget API")
+        return False
+
+    # Parse accelerator string (e.g., "Ctrl+S", "Alt+F4", "F1", "Delete", "Ctrl+K Ctrl+C")
+    strokes = _parse_accelerator(accelerator)
+    if strokes is None:
         return False
 
     target_id = target.winfo_id()
-    bindings = _GLOBAL_ACCEL_BINDINGS.get(target_id)
-    if not bindings:
+    path = tuple((mods_key, keycode) for mods_key, _tk_mods, keycode in strokes)
+
+    # Every stroke needs a handler for its modifier combination (also for shadowed
+    # records, which may be promoted later)
+    for mods_key, tk_mods, _keycode in strokes:
+        _ensure_key_handler(target, target_id, mods_key, tk_mods)
+    if len(strokes) > 1:
+        _ensure_chord_canceller(target, target_id)
+    _ensure_destroy_handler(target, target_id)
+
+    # Resolve conflicts against other owners of the same keys in this window group
+    key = _index_key(target, path)
+    records = _live_records(key)
+    record = next((r for r in records
+                   if (r.owner is owner if owner is not None else r.owner is None and r.callback == callback)), None)
+    if record is None:
+        record = _AccelRecord(accelerator, path, callback, owner, menu_path, bind_scope)
+        active = records[0] if records else None
+        if active is not None:
+            if _conflict_policy == 'raise':
+                raise AcceleratorConflictError(
+                    f"Accelerator '{accelerator}' of '{record.describe()['menu_path']}' is already used by "
+                    f"'{active.describe()['menu_path']}'")
+            if _conflict_policy == 'ignore':
+                record.target_ids.add(target_id)
+                records.append(record)
+                return False
+            if _conflict_policy == 'warn':
+                warnings.warn(f"Accelerator '{accelerator}' of '{record.describe()['menu_path']}' replaces "
+                              f"'{active.describe()['menu_path']}'")
+            # The previous owner stays recorded as shadowed until the new one is removed
+            for t_id in active.target_ids:
+                _prune_callback(t_id, path, active.callback)
+        records.insert(0, record)
+        _ACCEL_INDEX[key] = records
+    elif record is not records[0]:
+        # A shadowed owner binding another target stays shadowed
+        record.target_ids.add(target_id)
         return False
-    mod_dict = bindings.get(mods_key)
-    if not mod_dict:
+
+    # Store binding info
+    record.target_ids.add(target_id)
+    _store_callback(target_id, path, record.callback)
+    return True
+
+
+def _forget_records(target: Any, target_id: int, path: Tuple[Tuple[str, int], ...], callback: Callable | None) -> None:
+    """Drop target_id from matching index records, promoting a shadowed record if the active one goes."""
+    key = _index_key(target, path)
+    records = _ACCEL_INDEX.get(key)
+    if not records:
+        return
+    active = records[0]
+    for record in list(records):
+        if (callback is None or record.callback == callback) and target_id in record.target_ids:
+            record.target_ids.discard(target_id)
+            if not record.target_ids:
+                records.remove(record)
+    if not records:
+        del _ACCEL_INDEX[key]
+    elif records[0] is not active:
+        # Restore the most recently shadowed owner on the targets it had claimed
+        for t_id in records[0].target_ids:
+            _store_callback(t_id, path, records[0].callback)
+
+
+def _unregister_accelerator(widget_or_root: Any, accelerator: str, callback: Callable | None = None, *, bind_scope: str = 'window') -> bool:
+    """Unregister accelerator from a window or a specific widget.
+
+    Args:
+        widget_or_root: Any Tk/CustomTkinter widget or a toplevel/root.
+        accelerator: Accelerator string 'Modifier+Key', just 'Key', or a space-separated chord.
+            Supports 'CmdOrCtrl'.
+        callback: Optional specific callback to remove. If None, removes all callbacks for this accelerator.
+        bind_scope: 'window' to target the widget's toplevel, or 'widget' to target only the widget.
+
+    Returns:
+        True if something was removed, False otherwise.
+    """
+    if not accelerator or not isinstance(accelerator, str):
         return False
 
-    removed = False
-    if keycode in mod_dict:
-        if callback is None:
-            del mod_dict[keycode]
-            removed = True
-        else:
-            try:
-                mod_dict[keycode].remove(callback)
-                removed = True
-                if not mod_dict[keycode]:
-                    del mod_dict[keycode]
-            except ValueError:
-                pass
+    if bind_scope not in ('window', 'widget'):
+        bind_scope = 'window'
+    target = _resolve_target(widget_or_root, bind_scope)
 
-    # Cleanup empty containers
-    if removed and not mod_dict:
-        del bindings[mods_key]
-    if removed and not bindings:
-        del _GLOBAL_ACCEL_BINDINGS[target_id]
+    if not hasattr(target, 'winfo_id'):
+        return False
+
+    strokes = _parse_accelerator(accelerator, warn=False)
+    if strokes is None:
+        return False
 
+    target_id = target.winfo_id()
+    path = tuple((mods_key, keycode) for mods_key, _tk_mods, keycode in strokes)
+    if len(path) > 1:
+        _cancel_pending_chord(target, target_id)
+    removed = _prune_callback(target_id, path, callback)
+    _forget_records(target, target_id, path, callback)
     return removed
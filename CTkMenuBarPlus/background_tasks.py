@@ -0,0 +1,172 @@
+"""
+Background command support for CTkMenuBarPlus
+
+Menu commands may be coroutine functions. Coroutines run on an asyncio event loop in
+a daemon thread (or on a loop provided with set_async_loop()); Tk itself is never
+touched from that thread. Blocking commands of items with run_in_executor run on one
+shared, bounded ThreadPoolExecutor. Completion of both is marshalled back to the Tk
+thread by one polling pump per Tk application: a single after() loop that checks the
+tracked futures and only runs while something is in flight.
+
+Usage:
+    from .background_tasks import _submit_coroutine, _get_task_pump
+    future = _submit_coroutine(coro)
+    _get_task_pump(widget).track(future, on_done)  # on_done(future) runs on the Tk thread
+
+    from .background_tasks import _submit_blocking
+    future = _submit_blocking(func)  # func runs on the shared thread pool
+
+    from .background_tasks import set_async_loop, set_executor_workers
+    set_async_loop(my_loop)  # run menu coroutines on an existing loop instead
+    set_executor_workers(8)  # size of the shared thread pool
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, List, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+import threading
+from .constants import TASK_POLL_INTERVAL, DEFAULT_EXECUTOR_WORKERS
+
+_loop_lock = threading.Lock()
+_async_loop: asyncio.AbstractEventLoop | None = None
+_async_thread: threading.Thread | None = None
+_executor: ThreadPoolExecutor | None = None
+_executor_workers = DEFAULT_EXECUTOR_WORKERS
+
+
+def set_async_loop(loop: asyncio.AbstractEventLoop | None) -> None:
+    """Choose the asyncio loop that runs coroutine menu commands.
+
+    Args:
+        loop: A loop running in another thread, or None to use the package's own loop thread
+    """
+    global _async_loop, _async_thread
+    with _loop_lock:
+        _async_loop = loop
+        _async_thread = None
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """Return the loop for menu coroutines, starting the package's loop thread on first use."""
+    global _async_loop, _async_thread
+    with _loop_lock:
+        if _async_loop is None or _async_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="CTkMenuBarPlus-asyncio", daemon=True)
+            thread.start()
+            _async_loop, _async_thread = loop, thread
+        return _async_loop
+
+
+def _submit_coroutine(coro: Any) -> Future:
+    """Schedule coro on the menu asyncio loop and return its concurrent.futures.Future."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_async_loop())
+
+
+def set_executor_workers(max_workers: int) -> None:
+    """Set the number of worker threads shared by all run_in_executor menu commands.
+
+    Commands already running finish on the previous pool.
+
+    Args:
+        max_workers: Maximum number of worker threads
+
+    Raises:
+        ValueError: If max_workers is smaller than 1
+    """
+    global _executor, _executor_workers
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError("max_workers must be a positive integer")
+    with _loop_lock:
+        _executor_workers = max_workers
+        previous, _executor = _executor, None
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool, creating it on first use."""
+    global _executor
+    with _loop_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_executor_workers, thread_name_prefix="CTkMenuBarPlus")
+        return _executor
+
+
+def _submit_blocking(func: Callable[[], Any]) -> Future:
+    """Run func on the shared thread pool and return its Future."""
+    return _get_executor().submit(func)
+
+
+class _TaskPump:
+    """Single after() polling loop delivering finished background futures to the Tk thread."""
+
+    def __init__(self, widget: Any):
+        """Create a pump driven by widget's event loop.
+
+        Args:
+            widget: Tk widget used to arm the after() callback (normally the root)
+        """
+        self._widget = widget
+        self._tracked: List[Tuple[Future, Callable[[Future], Any]]] = []
+        self._after_id: str | None = None
+
+    def track(self, future: Future, on_done: Callable[[Future], Any]) -> None:
+        """Call on_done(future) on the Tk thread once future has finished.
+
+        Args:
+            future: Future completed by another thread
+            on_done: Callback receiving the finished (or cancelled) future
+        """
+        self._tracked.append((future, on_done))
+        if self._after_id is None:
+            self._arm()
+
+    def pending_count(self) -> int:
+        """Return the number of futures still in flight."""
+        return len(self._tracked)
+
+    def _arm(self) -> None:
+        try:
+            self._after_id = self._widget.after(TASK_POLL_INTERVAL, self._poll)
+        except Exception:
+            # The application is gone; nobody is left to receive results
+            self._after_id = None
+            self._tracked.clear()
+
+    def _poll(self) -> None:
+        """Deliver finished futures and keep polling while others are in flight."""
+        self._after_id = None
+        finished, pending = [], []
+        for entry in self._tracked:
+            (finished if entry[0].done() else pending).append(entry)
+        self._tracked = pending
+        for future, on_done in finished:
+            try:
+                on_done(future)
+            except Exception:
+                # Report like any other Tk callback error without starving the remaining results
+                try:
+                    self._widget._report_exception()
+                except Exception:
+                    pass
+        if self._tracked and self._after_id is None:
+            self._arm()
+
+
+def _get_task_pump(widget: Any) -> _TaskPump:
+    """Return the task pump shared by widget's Tk application, creating it on first use."""
+    try:
+        root = widget._root()
+    except Exception:
+        root = widget
+    pump = getattr(root, '_ctkmenubar_task_pump', None)
+    if pump is None:
+        pump = _TaskPump(root)
+        setattr(root, '_ctkmenubar_task_pump', pump)
+    return pump
+
+
+__all__ = ["set_async_loop", "set_executor_workers", "_submit_coroutine", "_submit_blocking", "_TaskPump",
+           "_get_task_pump"]
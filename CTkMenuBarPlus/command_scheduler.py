@@ -0,0 +1,197 @@
+"""
+Command execution scheduler for CTkMenuBarPlus
+
+Menu options can limit how often their command runs (throttle_ms, debounce_ms,
+coalesce). All delayed runs of one Tk application share a single scheduler: pending
+runs are kept in a heap ordered by due time and exactly one after() callback is armed
+for the earliest of them, instead of one timer per call.
+
+Usage:
+    from .command_scheduler import _get_scheduler
+    _get_scheduler(widget).submit(option, run, throttle_ms=100, coalesce=True)
+    _get_scheduler(widget).cancel(option)
+
+Policies (per key, typically an option button):
+    - throttle_ms: run at once, then at most once per throttle_ms; calls inside the
+      window are dropped, or merged into one trailing run when coalesce is True
+    - debounce_ms: run once no call has arrived for debounce_ms (takes precedence
+      over throttle_ms)
+    - coalesce alone: calls arriving while a run is still queued are merged into it;
+      the run happens on the next pass of the event loop
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+import heapq
+import itertools
+import time
+import weakref
+
+
+class _ScheduledRun:
+    """Queued run of a key; superseded runs are marked dead and skipped (lazy heap deletion)."""
+    __slots__ = ('due', 'seq', 'key', 'func', 'alive')
+
+    def __init__(self, due: float, seq: int, key: Any, func: Callable[[], Any]):
+        self.due = due
+        self.seq = seq
+        self.key = key
+        self.func = func
+        self.alive = True
+
+    def __lt__(self, other: "_ScheduledRun") -> bool:
+        return (self.due, self.seq) < (other.due, other.seq)
+
+
+class _CommandScheduler:
+    """Single after()-based scheduler for throttled, debounced and coalesced commands."""
+
+    def __init__(self, widget: Any):
+        """Create a scheduler driven by widget's event loop.
+
+        Args:
+            widget: Tk widget used to arm the after() callback (normally the root)
+        """
+        self._widget = widget
+        self._heap: List[_ScheduledRun] = []
+        self._pending: Dict[Any, _ScheduledRun] = {}
+        # Time (ms) of the last run per key; keys are dropped with their widget
+        self._last_run: "weakref.WeakKeyDictionary[Any, float]" = weakref.WeakKeyDictionary()
+        self._counter = itertools.count()
+        self._after_id: str | None = None
+        self._armed_due: float | None = None
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic() * 1000.0
+
+    def submit(self, key: Any, func: Callable[[], Any], *, throttle_ms: float = 0,
+               debounce_ms: float = 0, coalesce: bool = False) -> None:
+        """Run func for key now, later, or not at all according to the policy.
+
+        Args:
+            key: Identity the policy applies to (e.g. the option button)
+            func: Callable to run
+            throttle_ms: Minimum time between two runs
+            debounce_ms: Quiet time required before a run
+            coalesce: Merge calls into an already queued run instead of dropping them
+        """
+        now = self._now()
+        pending = self._pending.get(key)
+
+        if debounce_ms > 0:
+            self._queue(key, now + debounce_ms, func)
+            return
+
+        if pending is not None and (coalesce or throttle_ms > 0):
+            # Merge into the queued run; the latest callable wins
+            pending.func = func
+            return
+
+        if throttle_ms > 0:
+            last = self._last_run.get(key)
+            if last is not None and now - last < throttle_ms:
+                if coalesce:
+                    self._queue(key, last + throttle_ms, func)
+                return
+            self._run(key, func)
+            return
+
+        if coalesce:
+            self._queue(key, now, func)
+            return
+
+        self._run(key, func)
+
+    def cancel(self, key: Any) -> None:
+        """Drop the queued run of key, if any."""
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.alive = False
+            self._arm()
+
+    def pending_count(self) -> int:
+        """Return the number of queued runs."""
+        return len(self._pending)
+
+    def _queue(self, key: Any, due: float, func: Callable[[], Any]) -> None:
+        """Queue (or re-queue) the run of key at due."""
+        previous = self._pending.get(key)
+        if previous is not None:
+            previous.alive = False
+        entry = _ScheduledRun(due, next(self._counter), key, func)
+        self._pending[key] = entry
+        heapq.heappush(self._heap, entry)
+        self._arm()
+
+    def _run(self, key: Any, func: Callable[[], Any]) -> None:
+        try:
+            self._last_run[key] = self._now()
+        except TypeError:
+            pass  # Key cannot be weakly referenced; throttling falls back to queued runs only
+        func()
+
+    def _arm(self) -> None:
+        """Keep exactly one after() callback armed for the earliest live run."""
+        heap = self._heap
+        while heap and not heap[0].alive:
+            heapq.heappop(heap)
+        if not heap:
+            self._disarm()
+            return
+        due = heap[0].due
+        if self._after_id is not None and self._armed_due == due:
+            return
+        # The earliest run moved (re-queued, cancelled or a new earlier one): replace the timer
+        self._disarm()
+        delay = max(0, int(round(due - self._now())))
+        try:
+            self._after_id = self._widget.after(delay, self._tick)
+            self._armed_due = due
+        except Exception:
+            # The widget is gone; nothing queued can run anymore
+            self._heap.clear()
+            self._pending.clear()
+
+    def _disarm(self) -> None:
+        if self._after_id is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+        self._armed_due = None
+
+    def _tick(self) -> None:
+        """Run every queued entry that is due, then re-arm for the next one."""
+        self._after_id = None
+        self._armed_due = None
+        try:
+            now = self._now()
+            heap = self._heap
+            while heap and (not heap[0].alive or heap[0].due <= now):
+                entry = heapq.heappop(heap)
+                if not entry.alive:
+                    continue
+                entry.alive = False
+                if self._pending.get(entry.key) is entry:
+                    del self._pending[entry.key]
+                self._run(entry.key, entry.func)
+        finally:
+            self._arm()
+
+
+def _get_scheduler(widget: Any) -> _CommandScheduler:
+    """Return the command scheduler shared by widget's Tk application, creating it on first use."""
+    try:
+        root = widget._root()
+    except Exception:
+        root = widget
+    scheduler = getattr(root, '_ctkmenubar_scheduler', None)
+    if scheduler is None:
+        scheduler = _CommandScheduler(root)
+        setattr(root, '_ctkmenubar_scheduler', scheduler)
+    return scheduler
+
+
+__all__ = ["_CommandScheduler", "_get_scheduler"]
@@ -31,8 +31,27 @@ SCROLLBAR_WIDTH = 16  # Default scrollbar width
 SUBMENU_HORIZONTAL_OFFSET = 1  # Additional horizontal offset for submenu positioning
 SUBMENU_OVERLAP_PREVENTION = 1  # Minimal gap to prevent visual overlap
 
+# Type-ahead constants
+DEFAULT_TYPE_AHEAD = "jump"  # Type-ahead mode for open menus: "jump", "filter" or None
+TYPE_AHEAD_RESET_DELAY = 1000  # Idle time (ms) after which the type-ahead buffer is cleared
+
+# Background command constants
+TASK_POLL_INTERVAL = 16  # Interval (ms) at which finished background commands are collected
+DEFAULT_EXECUTOR_WORKERS = 4  # Worker threads shared by all run_in_executor commands
+
 # Icon constants
 DEFAULT_ICON_SIZE = 16  # Default icon size in pixels
+ICON_CACHE_SIZE = 256  # Resized file icons kept in memory
+
+# Widget pool constants
+BUTTON_POOL_SIZE = 64  # Released option buttons kept per container and button class
+
+# Menu bar constants
+OVERFLOW_BUTTON_TEXT = "\u00bb"  # Text of the button listing cascades that do not fit the bar
+TITLE_MENU_UPDATE_INTERVAL = 16  # Minimum interval (ms) between title menu overlay moves (one per frame)
+TITLE_MENU_BASE_X_OFFSET = 40  # Space (px) before the window title (system icon)
+TITLE_MENU_TITLE_GAP = 10  # Gap (px) between the window title and the first title menu button
+TITLE_MENU_TITLE_POLL_INTERVAL = 250  # Interval (ms) at which the title menu checks for a new window title
 
 # Type aliases for better readability
 ColorType = Union[str, Tuple[str, str]]
@@ -43,4 +62,8 @@ __all__ = ["DEFAULT_SUBMENU_DELAY", "DEFAULT_PADDING", "DEFAULT_CORNER_RADIUS_FA
            "DEFAULT_WIDTH", "DEFAULT_HEIGHT",  "DEFAULT_CORNER_RADIUS", "DEFAULT_SEPARATOR_COLOR",
            "DEFAULT_TEXT_COLOR", "DEFAULT_HOVER_COLOR", "DEFAULT_BORDER_COLOR", "DEFAULT_MAX_VISIBLE_OPTIONS",
            "SCROLLBAR_EXTRA_SPACE", "SCROLLBAR_WIDTH", "SUBMENU_HORIZONTAL_OFFSET", "SUBMENU_OVERLAP_PREVENTION",
-           "DEFAULT_ICON_SIZE", "ColorType", "WidgetType", "RootType", "DEFAULT_FG_COLOR", "DEFAULT_FONT"]
+           "DEFAULT_ICON_SIZE", "ColorType", "WidgetType", "RootType", "DEFAULT_FG_COLOR", "DEFAULT_FONT",
+           "DEFAULT_TYPE_AHEAD", "TYPE_AHEAD_RESET_DELAY", "TASK_POLL_INTERVAL",
+           "DEFAULT_EXECUTOR_WORKERS", "ICON_CACHE_SIZE", "BUTTON_POOL_SIZE",
+           "OVERFLOW_BUTTON_TEXT", "TITLE_MENU_UPDATE_INTERVAL",
+           "TITLE_MENU_BASE_X_OFFSET", "TITLE_MENU_TITLE_GAP", "TITLE_MENU_TITLE_POLL_INTERVAL"]
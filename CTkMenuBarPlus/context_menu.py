@@ -1,6 +1,7 @@
 import customtkinter
 import warnings
 from .dropdown_menu import CustomDropdownMenu
+from .widget_pool import _bind_callback, _unbind_callback
 
 
 class ContextMenu(CustomDropdownMenu):
@@ -43,12 +44,23 @@ class ContextMenu(CustomDropdownMenu):
 
     def _bind_context_menu(self):
         """Bind right-click event to show context menu."""
-        self.target_widget.bind("<Button-3>", self._show_context_menu, add="+")
+        self._context_bindings = _bind_callback(self.target_widget, "<Button-3>", self._show_context_menu)
         # Also bind to child widgets if it's a container
         try:
             for child in self.target_widget.winfo_children():
-                child.bind("<Button-3>", self._show_context_menu, add="+")
-        except:
+                self._context_bindings += _bind_callback(child, "<Button-3>", self._show_context_menu)
+        except Exception:
+            pass
+
+    def destroy(self):
+        """Remove the right-click bindings from the target, then destroy the menu and its seed."""
+        for widget, sequence, funcid in getattr(self, '_context_bindings', ()):
+            _unbind_callback(widget, sequence, funcid)
+        self._context_bindings = []
+        super().destroy()
+        try:
+            self._dummy_button.destroy()
+        except Exception:
             pass
 
     def _show_context_menu(self, event):
@@ -68,6 +80,9 @@ class ContextMenu(CustomDropdownMenu):
             Includes error handling to gracefully handle coordinate calculation
             issues or widget state problems during menu display.
         """
+        if self.is_torn_off():
+            self._show()
+            return
         try:
             # Get cursor position in screen coordinates
             cursor_x = event.x_root - self.target_widget.winfo_rootx() + 30
@@ -79,6 +94,7 @@ class ContextMenu(CustomDropdownMenu):
 
             # Show the menu at cursor position using screen coordinates
             # Place it relative to the screen, not a parent widget
+            self._refresh_if_stale()
             self.place(x=cursor_x, y=cursor_y)
             self.lift()
             self.focus()
@@ -88,7 +104,8 @@ class ContextMenu(CustomDropdownMenu):
 
     def _show(self):
         """Override _show to use stored cursor position."""
-        if hasattr(self, '_context_x') and hasattr(self, '_context_y'):
+        if not self.is_torn_off() and hasattr(self, '_context_x') and hasattr(self, '_context_y'):
+            self._refresh_if_stale()
             self.place(x=self._context_x, y=self._context_y)
         else:
             super()._show()
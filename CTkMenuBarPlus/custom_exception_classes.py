@@ -8,6 +8,11 @@ class MenuWidgetBindingError(CTkMenuBarError):
     pass
 
 
+class AcceleratorConflictError(MenuWidgetBindingError):
+    """Raised when an accelerator is already claimed in the same window and the conflict policy is 'raise'."""
+    pass
+
+
 class MenuCommandExecutionError(CTkMenuBarError):
     """Raised when menu command execution fails."""
     pass
@@ -0,0 +1,284 @@
+"""
+Diagnostics for CTkMenuBarPlus
+
+Reports what a menu tree costs: Tk widgets, option models, icons, accelerator
+registrations, pending timers, registered Tcl callbacks and an approximation of the
+Python memory held by the menus. The numbers are gathered by walking the Python side
+of the widget tree (tkinter's children dicts), so collecting them never forces a
+redraw or a geometry pass.
+
+Usage:
+    stats = file_menu.stats()  # CustomDropdownMenu, including its submenus
+    print(stats["tk_widgets"], stats["icons"]["unique"], stats["memory_bytes"])
+
+    report = menu_bar.stats()  # totals plus one entry per dropdown in report["menus_by_name"]
+
+Leak check: build and tear down menus repeatedly and compare the toplevel binding
+scripts, after() timers, accelerator registrations, Tcl commands and gc object
+counts before and after (needs a display; Xvfb works):
+    from CTkMenuBarPlus import leak_check
+    report = leak_check(root, lambda: ContextMenu(frame), cycles=50)
+    assert not report["leaked"], report["growth"]
+
+    python -m CTkMenuBarPlus leak-check [--cycles 50]  # built-in scenarios, exit code 1 on a leak
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set
+import argparse
+import gc
+import sys
+import tkinter as tk
+
+
+def _iter_menu_tree(menu: Any) -> Iterator[Any]:
+    """Yield menu and all of its submenus, depth first."""
+    yield menu
+    for submenu in menu._get_submenus():
+        yield from _iter_menu_tree(submenu)
+
+
+def _iter_widgets(widget: Any) -> Iterator[Any]:
+    """Yield widget and every Tk widget below it (without querying Tk)."""
+    yield widget
+    for child in list(getattr(widget, "children", {}).values()):
+        yield from _iter_widgets(child)
+
+
+def _shallow_size(obj: Any) -> int:
+    """Return the size of obj, its attribute dict and the attribute values themselves."""
+    size = sys.getsizeof(obj)
+    attributes = getattr(obj, "__dict__", None)
+    if attributes is not None:
+        size += sys.getsizeof(attributes)
+        for value in attributes.values():
+            try:
+                size += sys.getsizeof(value)
+            except TypeError:
+                pass
+    return size
+
+
+def _image_bytes(image: Any) -> int:
+    """Approximate the pixel memory of a loaded CTkImage (RGBA, both variants)."""
+    total, seen = 0, set()
+    for variant in (getattr(image, "_light_image", None), getattr(image, "_dark_image", None)):
+        if variant is not None and id(variant) not in seen:
+            seen.add(id(variant))
+            width, height = variant.size
+            total += width * height * 4
+    return total
+
+
+def _pending_timers(menu: Any) -> int:
+    """Count the after() callbacks menu has armed (type-ahead reset, submenu show/hide)."""
+    count = 1 if getattr(menu, "_type_ahead_timer", None) else 0
+    if getattr(menu, "_timer_id", None):
+        count += 1
+    return count
+
+
+def _collect_menu_stats(menus: Iterable[Any]) -> Dict[str, Any]:
+    """Gather the totals of every menu tree rooted in menus.
+
+    Args:
+        menus: Root dropdown menus; their submenus are included
+
+    Returns:
+        Dict with the counters documented in CustomDropdownMenu.stats()
+    """
+    stats: Dict[str, Any] = {
+        "menus": 0, "options": 0, "separators": 0, "tk_widgets": 0, "pooled_buttons": 0,
+        "accelerators": 0, "pending_timers": 0, "scheduled_commands": 0, "background_tasks": 0,
+        "tcl_callbacks": 0, "memory_bytes": 0,
+    }
+    image_users: Dict[int, int] = {}
+    images: List[Any] = []
+    seen_widgets: Set[int] = set()
+    for root in menus:
+        try:
+            scheduler = getattr(root._root(), "_ctkmenubar_scheduler", None)
+        except Exception:
+            scheduler = None
+        scheduler_pending = scheduler._pending if scheduler is not None else {}
+        for menu in _iter_menu_tree(root):
+            stats["menus"] += 1
+            stats["options"] += len(menu._options_list)
+            stats["separators"] += len(getattr(menu, "_separators", ()))
+            stats["pending_timers"] += _pending_timers(menu)
+            stats["background_tasks"] += len(getattr(menu, "_running_tasks", ()))
+            for widget in _iter_widgets(menu):
+                if id(widget) in seen_widgets:
+                    continue
+                seen_widgets.add(id(widget))
+                stats["tk_widgets"] += 1
+                stats["tcl_callbacks"] += len(getattr(widget, "_tclCommands", None) or ())
+                stats["memory_bytes"] += _shallow_size(widget)
+                pool = getattr(widget, "_ctkmenubar_button_pool", None)
+                if pool is not None:
+                    stats["pooled_buttons"] += len(pool)
+            for option in menu._options_list:
+                if getattr(option, "_accel_bound", False):
+                    stats["accelerators"] += len(getattr(option, "_accel_targets", None) or ())
+                if option in scheduler_pending:
+                    stats["scheduled_commands"] += 1
+                image = getattr(option, "icon_image", None)
+                if image is not None:
+                    if id(image) not in image_users:
+                        image_users[id(image)] = 0
+                        images.append(image)
+                    image_users[id(image)] += 1
+
+    icon_bytes = sum(_image_bytes(image) for image in images)
+    stats["icons"] = {
+        "unique": len(images),
+        "shared": sum(1 for users in image_users.values() if users > 1),
+        "uses": sum(image_users.values()),
+        "bytes": icon_bytes,
+    }
+    stats["memory_bytes"] += icon_bytes
+    return stats
+
+
+def _toplevel_binding_count(root: Any) -> int:
+    """Count the callback lines in the binding scripts of every toplevel window."""
+    total = 0
+    for widget in _iter_widgets(root):
+        if isinstance(widget, (tk.Tk, tk.Toplevel)):
+            for sequence in widget.bind():
+                total += sum(1 for line in widget.bind(sequence).split("\n") if line.strip())
+    return total
+
+
+def _resource_snapshot(root: Any) -> Dict[str, int]:
+    """Return the counters compared by leak_check()."""
+    from .accelerators import _GLOBAL_ACCEL_BINDINGS, _ACCEL_INDEX
+    gc.collect()
+    return {
+        "toplevel_bindings": _toplevel_binding_count(root),
+        "after_timers": len(root.tk.splitlist(root.tk.call("after", "info"))),
+        "accelerator_targets": len(_GLOBAL_ACCEL_BINDINGS),
+        "accelerator_records": sum(len(records) for records in _ACCEL_INDEX.values()),
+        "tcl_commands": len(root.tk.splitlist(root.tk.call("info", "commands"))),
+        "gc_objects": len(gc.get_objects()),
+    }
+
+
+def _teardown(built: Any) -> None:
+    """Destroy what a leak_check() build function returned (a widget or a list of widgets)."""
+    for widget in reversed(built) if isinstance(built, (list, tuple)) else (built,):
+        if widget is not None:
+            widget.destroy()
+
+
+def leak_check(root: Any, build: Callable[[], Any], cycles: int = 20, warmup: int = 3,
+               teardown: Callable[[Any], None] | None = None) -> Dict[str, Any]:
+    """Build and tear down menus repeatedly and report the resources that kept growing.
+
+    Warmup cycles fill module-level caches first; the counters are then compared
+    before and after the measured cycles. Every counter except gc_objects has to stay
+    exactly constant; gc_objects may fluctuate by less than one object per cycle.
+
+    Args:
+        root: Application root window
+        build: Creates the menus to check and returns them (a widget or list of widgets)
+        cycles: Measured build/teardown cycles
+        warmup: Unmeasured cycles run first
+        teardown: Destroys what build returned (default: destroy() in reverse order)
+
+    Returns:
+        Dict with "before", "after" and "growth" counters and the names of the
+        counters that grew in "leaked"
+    """
+    teardown = teardown or _teardown
+
+    def cycle() -> None:
+        built = build()
+        root.update_idletasks()
+        teardown(built)
+        root.update()
+
+    for _ in range(warmup):
+        cycle()
+    before = _resource_snapshot(root)
+    for _ in range(cycles):
+        cycle()
+    after = _resource_snapshot(root)
+    growth = {name: after[name] - before[name] for name in before}
+    leaked = [name for name, grown in growth.items()
+              if grown > 0 and (name != "gc_objects" or grown >= max(cycles, 1))]
+    return {"before": before, "after": after, "growth": growth, "leaked": leaked}
+
+
+def _leak_scenarios(root: Any) -> Dict[str, Callable[[], Any]]:
+    """Return the menu shapes checked by the leak-check command, built inside root."""
+    import customtkinter
+    from .menu_bar import CTkMenuBar
+    from .dropdown_menu import CustomDropdownMenu
+    from .context_menu import ContextMenu
+
+    menu_bar = CTkMenuBar(root)
+    frame = customtkinter.CTkFrame(root)
+    frame.pack()
+    customtkinter.CTkLabel(frame, text="target").pack()
+    persistent = CustomDropdownMenu(widget=menu_bar.add_cascade("Persistent"))
+
+    def fill(menu: Any) -> None:
+        menu.add_option("Open", command=lambda: None, accelerator="Ctrl+Shift+F11")
+        menu.add_option("Save", command=lambda: None, accelerator="Ctrl+Alt+K Ctrl+Alt+S")
+        menu.add_separator()
+        submenu = menu.add_submenu("More")
+        submenu.add_option("Nested", command=lambda: None, accelerator="Ctrl+Shift+F12")
+        submenu.add_option("Check", command=lambda: None, checkable=True)
+
+    def dropdown() -> List[Any]:
+        button = menu_bar.add_cascade("Menu")
+        menu = CustomDropdownMenu(widget=button, max_visible_options=2)
+        fill(menu)
+        return [button, menu]
+
+    def context() -> Any:
+        menu = ContextMenu(frame)
+        fill(menu)
+        return menu
+
+    def clean() -> None:
+        fill(persistent)
+        persistent.clean()
+
+    def remove_option() -> None:
+        fill(persistent)
+        for name in ("Open", "Save", "More"):
+            persistent.remove_option(name)
+        persistent.clean()  # the separator
+
+    return {"dropdown": dropdown, "context": context, "clean": clean, "remove_option": remove_option}
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Command line entry point of the leak check."""
+    parser = argparse.ArgumentParser(prog="python -m CTkMenuBarPlus leak-check",
+                                     description="Build and destroy menus repeatedly and report leaked resources.")
+    parser.add_argument("--cycles", type=int, default=20, help="measured cycles per scenario (default: 20)")
+    parser.add_argument("--warmup", type=int, default=3, help="unmeasured cycles run first (default: 3)")
+    args = parser.parse_args(argv)
+    try:
+        import customtkinter
+        root = customtkinter.CTk()
+    except tk.TclError as e:
+        print(f"leak-check needs a display (e.g. run it under xvfb-run): {e}", file=sys.stderr)
+        return 2
+    failed = False
+    try:
+        for name, build in _leak_scenarios(root).items():
+            report = leak_check(root, build, cycles=args.cycles, warmup=args.warmup)
+            failed = failed or bool(report["leaked"])
+            status = "LEAK " + ", ".join(report["leaked"]) if report["leaked"] else "ok"
+            growth = " ".join(f"{counter}={grown:+d}" for counter, grown in report["growth"].items())
+            print(f"{name:<14} {status:<8} {growth}")
+    finally:
+        root.destroy()
+    return 1 if failed else 0
+
+
+__all__ = ["leak_check", "_collect_menu_stats", "_iter_menu_tree", "_iter_widgets"]
@@ -7,6 +7,10 @@ This module provides an advanced dropdown menu system with support for:
 - Checkable menu items with state management
 - Scrollable menus with automatic scrollbar
 - Context menus (right-click)
+- Type-ahead search and filtering in open menus
+- Keyboard navigation (arrows, Enter, Escape) in open menus
+- Async (coroutine) and thread-pool commands run off the Tk thread
+- Reuse of released option buttons when menus are rebuilt
 
 Original Author: LucianoSaldivia | https://github.com/LucianoSaldivia
 CTkMenuBar Author: Akash Bora (Akascape) | https://github.com/Akascape
@@ -18,15 +22,47 @@ Version: Enhanced Edition 1.3
 from __future__ import annotations
 import customtkinter
 from functools import partial
+import bisect
+import inspect
+from concurrent.futures import Future
 import tkinter as tk
-from typing import Callable, Optional, Union, List, Any
+from typing import Callable, Optional, Union, List, Any, Dict, Tuple
 import PIL.Image, PIL.ImageTk
 import warnings
 from .custom_exception_classes import *
 from .constants import *
 from ._CDMOptionButton import _CDMOptionButton
 from ._CDMSubmenuButton import _CDMSubmenuButton
-from .accelerators import _unregister_accelerator
+from .accelerators import _lookup_accelerator_records, _check_conflict, _forward_accelerators, _stop_forwarding_accelerators
+from .keyboard_navigation import _MenuNavigator, NAVIGATION_SEQUENCES
+from .command_scheduler import _get_scheduler
+from .background_tasks import _submit_coroutine, _submit_blocking, _get_task_pump
+from .widget_pool import _get_button_pool, _unbind_callback
+from .diagnostics import _collect_menu_stats
+from customtkinter.windows.widgets.appearance_mode import CTkAppearanceModeBaseClass
+
+# Event state bits (Control, Alt/Command, Windows Alt) that mark a keystroke as a shortcut
+# rather than type-ahead input
+_TYPE_AHEAD_IGNORED_STATE = 0x0004 | 0x0008 | 0x20000
+
+
+# configure() parameters that change the menu layout; they are applied in one re-layout pass
+_LAYOUT_PARAMS = frozenset(("height", "width", "padx", "pady", "corner_radius", "border_width",
+                            "scrollbar_width", "font", "scale"))
+
+# Colors accepted by restyle()
+_THEME_PARAMS = frozenset(("fg_color", "hover_color", "text_color", "bg_color", "border_color", "separator_color"))
+
+# (font description, text) -> measured text width in pixels, shared by all menus
+_TEXT_WIDTH_CACHE: Dict[Tuple[str, str], int] = {}
+
+
+def _call_with_checked_state(command: Callable, checked: bool) -> Any:
+    """Call a checkable item's command with its new state, or without arguments if it takes none."""
+    try:
+        return command(checked)
+    except TypeError:
+        return command()
 
 
 class CustomDropdownMenu(customtkinter.CTkFrame):
@@ -53,6 +89,8 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
                  enable_scrollbar: bool = True,
                  scrollbar_width: int = SCROLLBAR_WIDTH,
                  scale: float = 1.0,
+                 type_ahead: Optional[str] = DEFAULT_TYPE_AHEAD,
+                 run_in_executor: bool = False,
                  **kwargs):
         """Initialize the dropdown menu with enhanced features.
         
@@ -77,6 +115,10 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             enable_scrollbar: Whether to enable scrollbar
             scrollbar_width: Width of the scrollbar
             scale: Single number to uniformly scale the dropdown and its options
+            type_ahead: Type-ahead mode while the menu is open: "jump" highlights the first
+                option starting with the typed text, "filter" hides non-matching options,
+                None disables type-ahead
+            run_in_executor: Default for options: run blocking commands on the shared thread pool
             **kwargs: Additional arguments passed to CTkFrame
         """
         # Setup master and bindings based on widget type
@@ -96,7 +138,7 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             widget, master, border_width, width, height, bg_color, 
             corner_radius, border_color, separator_color, text_color, 
             fg_color, hover_color, font, padx, pady, cursor, 
-            max_visible_options, enable_scrollbar, scrollbar_width, scale
+            max_visible_options, enable_scrollbar, scrollbar_width, scale, type_ahead, run_in_executor
         )
         
         # Initialize menu state and components
@@ -104,6 +146,10 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         # Apply initial scaling
         self._apply_scale()
         self._setup_menu_widget()
+        # Keys reach the focused frame itself; customtkinter's bind() would use the canvas
+        tk.Misc.bind(self, "<KeyPress>", self._on_type_ahead_key, "+")
+        for sequence in NAVIGATION_SEQUENCES:
+            tk.Misc.bind(self, sequence, self._on_navigation_key, "+")
     
     def _setup_master_and_bindings(self, widget: WidgetType, master: Any) -> Any:
         """Setup master widget and mouse event bindings based on widget type.
@@ -136,11 +182,25 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         # Default safe path
         return self._setup_default_bindings(widget, master)
     
+    def _bind_toplevel(self, tl: Any) -> None:
+        """Close the menu on clicks anywhere in tl; destroy() removes these bindings again."""
+        self._toplevel_bindings = [(tl, sequence, tl.bind(sequence, self._checkIfMouseLeft, add="+"))
+                                   for sequence in ("<ButtonPress>", "<Button-1>")]
+
+    def _unbind_toplevel(self) -> None:
+        """Remove the toplevel click bindings and leave the menu list of the bar or title menu."""
+        for tl, sequence, funcid in getattr(self, '_toplevel_bindings', ()):
+            _unbind_callback(tl, sequence, funcid)
+        self._toplevel_bindings = []
+        owner = getattr(getattr(self, 'menu_seed_object', None), 'master', None)
+        menus = getattr(owner, 'menu', None)
+        if isinstance(menus, list) and self in menus:
+            menus.remove(self)
+
     def _setup_title_menu_bindings(self, widget: WidgetType, master: Any) -> Any:
         """Setup bindings for title menu context."""
         tl = widget.winfo_toplevel()
-        tl.bind("<ButtonPress>", self._checkIfMouseLeft, add="+")
-        tl.bind("<Button-1>", self._checkIfMouseLeft, add="+")
+        self._bind_toplevel(tl)
         resolved_master = master if master is not None else getattr(widget, "master", tl)
         if hasattr(widget, "master") and hasattr(widget.master, "menu"):
             try:
@@ -152,8 +212,7 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
     def _setup_menu_bar_bindings(self, widget: WidgetType, master: Any) -> Any:
         """Setup bindings for menu bar context."""
         tl = widget.winfo_toplevel()
-        tl.bind("<ButtonPress>", self._checkIfMouseLeft, add="+")
-        tl.bind("<Button-1>", self._checkIfMouseLeft, add="+")
+        self._bind_toplevel(tl)
 
         # Determine an appropriate master: prefer the menubar's master if present
         if master is None:
@@ -171,8 +230,7 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
     def _setup_default_bindings(self, widget: WidgetType, master: Any) -> Any:
         """Setup bindings for default context."""
         tl = widget.winfo_toplevel()
-        tl.bind("<ButtonPress>", self._checkIfMouseLeft, add="+")
-        tl.bind("<Button-1>", self._checkIfMouseLeft, add="+")
+        self._bind_toplevel(tl)
 
         if master is None:
             parent = getattr(widget, "master", None)
@@ -186,7 +244,8 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
     def _store_configuration(self, widget, master, border_width, width, height, bg_color, 
                            corner_radius, border_color, separator_color, text_color, 
                            fg_color, hover_color, font, padx, pady, cursor, 
-                           max_visible_options, enable_scrollbar, scrollbar_width, scale):
+                           max_visible_options, enable_scrollbar, scrollbar_width, scale, type_ahead,
+                           run_in_executor):
         """Store all configuration parameters as instance variables."""
         # Core widget references
         self.menu_seed_object = widget
@@ -216,6 +275,12 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         self.enable_scrollbar = enable_scrollbar
         self._base_scrollbar_width = scrollbar_width
 
+        # Type-ahead configuration
+        self.type_ahead = type_ahead if type_ahead in ("jump", "filter") else None
+
+        # Background execution default for options
+        self.run_in_executor = bool(run_in_executor)
+
         # Scaling
         try:
             self.scale = float(scale)
@@ -272,7 +337,11 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         return (DEFAULT_FONT[0], max(1, int(round(DEFAULT_FONT[1] * self.scale))))
 
     def _apply_scale(self) -> None:
-        """Apply current scale to all size-related properties and re-layout children."""
+        """Apply current scale to all size-related properties and re-layout children.
+
+        Option rows and an existing scrollable frame are updated in place rather than
+        recreated.
+        """
         # Compute scaled values from base
         self.height = max(1, int(round(self._base_height * self.scale)))
         self.width = max(1, int(round(self._base_width * self.scale)))
@@ -291,49 +360,37 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         except Exception:
             pass
 
-        # Rebuild scrollable frame if present (to apply width/height/scrollbar changes)
+        # Resize the scrollable frame (if present) to the new option and scrollbar sizes
+        button_width = self.width
         if getattr(self, "_scrollable_frame", None) is not None:
             try:
-                self._destroy_scrollable_frame()
+                frame_width, frame_height, button_width, scrollbar_width = self._scrollable_frame_geometry()
+                self._scrollable_frame.configure(width=frame_width, height=frame_height,
+                                                 border_width=self.border_width)
+                self._apply_scrollbar_width(scrollbar_width)
             except Exception:
                 pass
+
+        # Update existing option buttons directly
+        padding = self._scaled_padding + (self.corner_radius / DEFAULT_CORNER_RADIUS_FACTOR)
+        for opt in list(getattr(self, "_options_list", [])):
             try:
-                self._create_scrollable_frame()
-            except Exception:
-                pass
-        else:
-            # Update existing option buttons directly
-            for opt in list(getattr(self, "_options_list", [])):
+                # Width/height
+                opt.configure(width=button_width, height=self.height, font=self.font)
+                # Icon resizing if present
+                if getattr(opt, "icon", None):
+                    opt._setup_icon()
+                # Update pack paddings
                 try:
-                    # Width/height
-                    opt.configure(width=self.width, height=self.height, font=self.font)
-                    # Icon resizing if present
-                    if getattr(opt, "icon", None):
-                            opt._setup_icon()
-                    # Update pack paddings
-                    try:
-                        opt.pack_configure(
-                            padx=self._scaled_padding + (self.corner_radius / DEFAULT_CORNER_RADIUS_FACTOR),
-                            pady=self._scaled_padding + (self.corner_radius / DEFAULT_CORNER_RADIUS_FACTOR)
-                        )
-                    except Exception:
-                        pass
+                    if opt.winfo_manager():
+                        opt.pack_configure(padx=padding, pady=padding)
                 except Exception:
                     pass
+            except Exception:
+                pass
 
-        # Update separator frames height
-        try:
-            for child in list(self.winfo_children()):
-                # Skip CTkScrollableFrame container itself
-                if isinstance(child, getattr(customtkinter, 'CTkScrollableFrame', ())):
-                    continue
-                if isinstance(child, customtkinter.CTkFrame):
-                    try:
-                        child.configure(height=max(1, int(round(2 * self.scale))))
-                    except Exception:
-                        pass
-        except Exception:
-            pass
+        # Update separator lines height
+        self._update_separators()
     
     def _initialize_menu_state(self):
         """Initialize menu state variables and containers."""
@@ -347,6 +404,34 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         
         # Menu options storage
         self._options_list: List[Union[_CDMOptionButton, _CDMSubmenuButton]] = []
+        # Rows in display order (options, submenus and separators) and the separators alone
+        self._items: List[Union[_CDMOptionButton, _CDMSubmenuButton, tk.Frame]] = []
+        self._separators: List[tk.Frame] = []
+
+        # Type-ahead state
+        self._type_ahead_buffer = ""
+        self._type_ahead_timer = None
+        self._label_index = None  # Sorted (label, position) pairs, built lazily
+        self._row_positions = None  # Option -> visible row, built lazily
+        self._filtered_options = None  # Options packed while a filter is active
+        self._highlighted_option = None
+
+        # Keyboard navigation controller, created lazily on the root menu of the tree
+        self._navigator = None
+
+        # Background (async) commands in flight, cancelled when the menu is destroyed
+        self._running_tasks = set()
+
+        # Theme colors changed by restyle() while the menu was hidden, applied on next show
+        self._pending_style = set()
+        # Set when the appearance mode changed while the menu was hidden; redrawn on next show
+        self._appearance_stale = False
+
+        # Tear-off state: None (dropdown), "palette" (tear_off()) or "popup" (submenu of a
+        # floating menu), the window the menu floats above and the close-button command
+        self._floating = None
+        self._float_owner = None
+        self._close_command = None
     
     def _setup_menu_widget(self):
         """Setup the menu widget command binding."""
@@ -355,14 +440,117 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         except Exception as e:
             raise MenuWidgetBindingError(f"Failed to set up menu widget binding: {e}") from e
     
-    def selectOption(self, command: Optional[Callable]) -> None:
-        """Execute the selected option command and hide all menus."""
+    def selectOption(self, command: Optional[Callable], option: Optional[_CDMOptionButton] = None) -> None:
+        """Execute the selected option command and hide all menus.
+
+        Clicks and keyboard activation (accelerators, Enter) both end up here, so the
+        option's throttle_ms/debounce_ms/coalesce policy applies to every activation.
+
+        Args:
+            command: The command to execute
+            option: The option that was activated; its execution policy decides when the command runs
+        """
         self._hideAllMenus()
-        if command and callable(command):
-            try:
-                command()
-            except Exception as e:
-                raise MenuCommandExecutionError(f"Failed to execute menu command: {e}") from e
+        if not command or not callable(command) or self._is_busy(option):
+            return
+        if option is not None and option.has_execution_policy():
+            _get_scheduler(self).submit(option, partial(self._run_scheduled_command, option, command),
+                                        throttle_ms=option.throttle_ms, debounce_ms=option.debounce_ms,
+                                        coalesce=option.coalesce)
+        else:
+            self._run_command(command, option)
+
+    def _run_command(self, command: Callable, option: Optional[_CDMOptionButton] = None) -> None:
+        """Run a menu command, wrapping its errors in MenuCommandExecutionError.
+
+        A command returning a coroutine (an async def command) is handed to the
+        background asyncio loop instead of blocking the Tk loop; a Future returned for a
+        run_in_executor item is followed until the thread pool finishes it.
+        """
+        try:
+            result = command()
+        except Exception as e:
+            raise MenuCommandExecutionError(f"Failed to execute menu command: {e}") from e
+        if inspect.iscoroutine(result):
+            self._track_background_command(option, _submit_coroutine(result))
+        elif isinstance(result, Future):
+            self._track_background_command(option, result)
+
+    def _track_background_command(self, option: Optional[_CDMOptionButton], future) -> None:
+        """Follow a background command until it finishes, keeping its item busy meanwhile.
+
+        Args:
+            option: The item that started the command (None for programmatic calls)
+            future: concurrent.futures.Future of the running command
+        """
+        self._running_tasks.add(future)
+        if option is not None:
+            option._running_tasks += 1
+            if option.disable_while_running and option.enabled:
+                option._disabled_while_running = True
+                option.set_enabled(False)
+        _get_task_pump(self).track(future, partial(self._finish_background_command, option))
+
+    def _finish_background_command(self, option: Optional[_CDMOptionButton], future) -> None:
+        """Restore the item once its background command finished and surface its error (Tk thread)."""
+        self._running_tasks.discard(future)
+        if option is not None:
+            option._running_tasks = max(0, option._running_tasks - 1)
+            if not option._running_tasks and getattr(option, "_disabled_while_running", False):
+                option._disabled_while_running = False
+                try:
+                    if option.winfo_exists():
+                        option.set_enabled(True)
+                except Exception:
+                    pass
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            raise MenuCommandExecutionError(f"Failed to execute menu command: {error}") from error
+
+    def _cancel_background_commands(self) -> None:
+        """Cancel every background command started from this menu."""
+        for future in list(self._running_tasks):
+            future.cancel()
+        self._running_tasks.clear()
+
+    def _run_scheduled_command(self, option: _CDMOptionButton, command: Callable) -> None:
+        """Run a command queued by the scheduler unless its option has been destroyed meanwhile."""
+        try:
+            if not option.winfo_exists():
+                return
+        except Exception:
+            return
+        if not self._is_busy(option):
+            self._run_command(command, option)
+
+    def _runs_in_executor(self, option: Optional[_CDMOptionButton]) -> bool:
+        """Return True if option's command runs on the shared thread pool."""
+        if option is None:
+            return False
+        setting = getattr(option, "run_in_executor", None)
+        return self.run_in_executor if setting is None else bool(setting)
+
+    def _is_busy(self, option: Optional[_CDMOptionButton]) -> bool:
+        """Return True if option runs in the thread pool and a previous run has not finished yet."""
+        return option is not None and option._running_tasks > 0 and self._runs_in_executor(option)
+
+    def _call_user_command(self, option: _CDMOptionButton, command: Callable, *checked: bool) -> Any:
+        """Call the user's command, on the shared thread pool if the option runs in the executor.
+
+        Args:
+            option: The activated option
+            command: The user's command
+            *checked: New checked state passed to checkable items' commands
+
+        Returns:
+            The command's result, or a Future when it was handed to the thread pool
+        """
+        call = partial(_call_with_checked_state, command, *checked) if checked else command
+        if self._runs_in_executor(option) and not inspect.iscoroutinefunction(command):
+            return _submit_blocking(call)
+        return call()
 
     def _dummy_command(*args, **kwargs) -> None:
         """Default empty command for menu options."""
@@ -377,6 +565,11 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
                    checkable: bool = False,
                    checked: bool = False,
                    enabled: bool = True,
+                   throttle_ms: int = 0,
+                   debounce_ms: int = 0,
+                   coalesce: bool = False,
+                   disable_while_running: bool = False,
+                   run_in_executor: Optional[bool] = None,
                    **kwargs) -> _CDMOptionButton:
         """Add a new option to the dropdown menu.
 
@@ -384,18 +577,26 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             option: The text to display for this option
             command: The function to call when this option is selected
             accelerator: Keyboard shortcut (e.g., "Ctrl+O", "Alt+F4")
-            icon: Path to icon file or PIL Image object
+            icon: Path to icon file, PIL Image object or atlas icon, or a (light, dark) pair of those
             icon_size: Size (px) to render icon at; defaults to menu's scaled icon size
             checkable: Whether this item can be checked/unchecked
             checked: Initial checked state
             enabled: Whether the item is initially enabled
+            throttle_ms: Run the command at most once per this many milliseconds
+                (e.g. for an expensive command bound to a held-down accelerator)
+            debounce_ms: Run the command only after activations stopped for this many milliseconds
+            coalesce: Merge activations arriving while a run is queued into that run
+                (with throttle_ms: run once more at the end of the window instead of dropping)
+            disable_while_running: Disable the item while its async or thread-pool command is running
+            run_in_executor: Run the (blocking) command on the shared thread pool; None uses the
+                menu's run_in_executor default. A second activation while it runs is ignored
             **kwargs: Additional arguments to pass to the button
 
         Returns:
             The created option button
 
         Raises:
-            ValueError: If option text is empty or None
+            ValueError: If option text is empty or None, or a delay is negative
         """
         # Validate input parameters
         self._validate_option_input(option)
@@ -405,16 +606,16 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         # Check for duplicate accelerators
         if accelerator and self._has_duplicate_accelerator(accelerator, option):
             return self._get_existing_option_with_accelerator(accelerator)
+        if accelerator:
+            _check_conflict(self, accelerator)
         
         # Create and configure the option button
         option_button = self._create_option_button(
-            option, command, accelerator, icon, icon_size, checkable, checked, enabled, **kwargs
+            option, command, accelerator, icon, icon_size, checkable, checked, enabled,
+            throttle_ms=throttle_ms, debounce_ms=debounce_ms, coalesce=coalesce,
+            disable_while_running=disable_while_running, run_in_executor=run_in_executor, **kwargs
         )
         
-        # Set up checkable command wrapper if needed
-        if checkable:
-            self._setup_checkable_command(option_button, command)
-        
         # Add to menu and update display
         self._add_option_to_menu(option_button)
         
@@ -433,8 +634,12 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             raise ValueError("Option text must be a non-empty string")
     
     def _has_duplicate_accelerator(self, accelerator: str, option: str) -> bool:
-        """Check if accelerator is already in use.
-        
+        """Check if accelerator is already in use by an option of this menu.
+
+        Uses the global accelerator index, so the check only looks at the records of this
+        key (also those shadowed by another menu). Conflicts with other menus or windows
+        are resolved by the accelerator conflict policy.
+
         Args:
             accelerator: The accelerator to check
             option: The option text (for warning message)
@@ -442,26 +647,26 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         Returns:
             True if duplicate found
         """
-        for existing in self._options_list:
-            if (hasattr(existing, "accelerator") and existing.accelerator == accelerator):
-                warnings.warn(f"Duplicate accelerator '{accelerator}' detected for menu option '{option}'. "
-                              f"Skipping addition to prevent conflicts.")
-                return True
+        if self._get_existing_option_with_accelerator(accelerator) is not None:
+            warnings.warn(f"Duplicate accelerator '{accelerator}' detected for menu option '{option}'. "
+                          f"Skipping addition to prevent conflicts.")
+            return True
         return False
     
-    def _get_existing_option_with_accelerator(self, accelerator: str) -> _CDMOptionButton:
-        """Get existing option with the specified accelerator.
+    def _get_existing_option_with_accelerator(self, accelerator: str) -> Optional[_CDMOptionButton]:
+        """Get the option of this menu that owns the specified accelerator.
         
         Args:
             accelerator: The accelerator to find
             
         Returns:
-            The existing option button
+            The existing option button, or None if no option of this menu owns it
         """
-        for existing in self._options_list:
-            if (hasattr(existing, "accelerator") and existing.accelerator == accelerator):
-                return existing
-        return None  # Should not happen if _has_duplicate_accelerator returned True
+        for record in _lookup_accelerator_records(self, accelerator):
+            owner = record.owner
+            if owner is not None and getattr(owner, "parent_menu", None) is self:
+                return owner
+        return None
     
     def _create_option_button(self,
                               option: str, command: Callable,
@@ -487,14 +692,13 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         Returns:
             The created option button
         """
-        option_button = _CDMOptionButton(
-            self._options_container,
+        option_button = self._new_option_button(
+            _CDMOptionButton,
             width=self.width,
             height=self.height,
             text=option,
             anchor="w",
             text_color=self.text_color,
-            command=partial(self.selectOption, command),
             accelerator=accelerator,
             icon=icon,
             icon_size=icon_size or self.icon_size,
@@ -506,8 +710,51 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         
         # Configure button appearance
         option_button.configure(cursor=self.cursor)
+        self._bind_option_command(option_button, command)
         
         return option_button
+
+    def _new_option_button(self, button_class: type, **kwargs) -> _CDMOptionButton:
+        """Return a button in the options container, reusing a released one when available.
+
+        Args:
+            button_class: _CDMOptionButton or _CDMSubmenuButton
+            **kwargs: Constructor arguments of the button (without the master)
+
+        Returns:
+            The new or reset button, not yet packed
+        """
+        button = _get_button_pool(self._options_container).acquire(button_class)
+        if button is None:
+            return button_class(self._options_container, **kwargs)
+        button._reset(**kwargs)
+        return button
+
+    def _release_option_button(self, option: _CDMOptionButton) -> None:
+        """Hand a removed option's button back to its container's pool (or destroy it)."""
+        if option._running_tasks:
+            # A running background command still reports back to this button
+            option.destroy()
+            return
+        _get_button_pool(option.master).release(option)
+
+    def _bind_option_command(self, option_button: _CDMOptionButton, command: Callable) -> None:
+        """Route the option's command through selectOption (wrapped for checkable items).
+
+        The unwrapped command is kept on the button so that recreated buttons are wired
+        from it rather than from the already wrapped button command.
+
+        Args:
+            option_button: The option button
+            command: The user command
+        """
+        option_button._user_command = command
+        if option_button.checkable:
+            self._setup_checkable_command(option_button, command)
+        else:
+            option_button.configure(command=partial(self.selectOption,
+                                                    partial(self._call_user_command, option_button, command),
+                                                    option_button))
     
     def _setup_checkable_command(self, option_button: _CDMOptionButton, original_command: Callable) -> None:
         """Setup command wrapper for checkable items.
@@ -521,15 +768,10 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             option_button.toggle_checked()
             # Then execute the original command with the new state
             if original_command:
-                try:
-                    # Try to pass the checked state to the command
-                    original_command(option_button.checked)
-                except TypeError:
-                    # If command doesn't accept parameters, call without them
-                    original_command()
+                return self._call_user_command(option_button, original_command, option_button.checked)
         
         # Update the button's command
-        option_button.configure(command=partial(self.selectOption, checkable_command))
+        option_button.configure(command=partial(self.selectOption, checkable_command, option_button))
     
     def _add_option_to_menu(self, option_button: _CDMOptionButton) -> None:
         """Add option button to the menu and configure it.
@@ -540,6 +782,8 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         # Set parent menu and configure
         option_button.setParentMenu(self)
         self._options_list.append(option_button)
+        self._items.append(option_button)
+        self._invalidate_label_index()
         self._configureButton(option_button)
 
         # Pack option with calculated padding based on corner radius
@@ -574,7 +818,7 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
 
         Args:
             submenu_name: Name of the submenu
-            icon: Path to icon file or PIL Image object
+            icon: Path to icon file, PIL Image object or atlas icon, or a (light, dark) pair of those
             icon_size: Size (px) to render icon at; defaults to menu's scaled icon size
             accelerator: Keyboard shortcut
             max_visible_options: Maximum number of visible options before scrollbar appears (inherits from parent if None)
@@ -594,14 +838,18 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         if scrollbar_width is None:
             # Use parent's BASE scrollbar width to avoid double scaling in submenu
             scrollbar_width = kwargs.pop('scrollbar_width', self._base_scrollbar_width)
-
-        submenuButtonSeed = _CDMSubmenuButton(self._options_container, text=submenu_name, anchor="w",
-                                              text_color=self.text_color, enabled=enabled,
-                                              width=self.width, height=self.height, accelerator=accelerator,
-                                              icon=icon, icon_size=icon_size or self.icon_size,
-                                              **kwargs)
+        if accelerator:
+            _check_conflict(self, accelerator)
+
+        submenuButtonSeed = self._new_option_button(_CDMSubmenuButton, text=submenu_name, anchor="w",
+                                                    text_color=self.text_color, enabled=enabled,
+                                                    width=self.width, height=self.height, accelerator=accelerator,
+                                                    icon=icon, icon_size=icon_size or self.icon_size,
+                                                    **kwargs)
         submenuButtonSeed.setParentMenu(self)
         self._options_list.append(submenuButtonSeed)
+        self._items.append(submenuButtonSeed)
+        self._invalidate_label_index()
         self._configureButton(submenuButtonSeed)
 
         # IMPORTANT: pass BASE (unscaled) values to the submenu so it applies the SAME scale
@@ -625,7 +873,9 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             max_visible_options=max_visible_options,
             enable_scrollbar=enable_scrollbar,
             scrollbar_width=scrollbar_width,
-            scale=self.scale)
+            scale=self.scale,
+            type_ahead=self.type_ahead,
+            run_in_executor=self.run_in_executor)
 
         submenuButtonSeed.setSubmenu(submenu=submenu)
         submenuButtonSeed.configure(command=submenu.toggleShow)
@@ -651,18 +901,72 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         return submenu
 
     def add_separator(self) -> None:
-        separator = customtkinter.CTkFrame(
-            master=self,
-            height=max(1, int(round(2 * getattr(self, 'scale', 1.0)))),
-            width=self.width,
-            fg_color=self.separator_color,
-            border_width=0
-        )
-        separator.pack(
-            side="top",
-            fill="x",
-            expand=True,
-        )
+        """Add a separator line below the current last item."""
+        self._append_separator()
+
+    def _append_separator(self) -> tk.Frame:
+        """Create, track and pack a separator line in the options container.
+
+        Separators are plain tk frames (no canvas or draw engine); the menu keeps
+        their color and height in sync on restyling, scaling and appearance changes.
+
+        Returns:
+            The separator frame
+        """
+        separator = tk.Frame(self._options_container, height=self._separator_height(),
+                             bg=self._separator_tk_color(),
+                             borderwidth=0, highlightthickness=0)
+        self._separators.append(separator)
+        self._items.append(separator)
+        separator.pack(**self._separator_pack_kwargs())
+        return separator
+
+    def _separator_height(self) -> int:
+        """Return the separator height in pixels for the current scale and widget scaling."""
+        return max(1, int(round(self._apply_widget_scaling(2 * self.scale))))
+
+    def _separator_tk_color(self) -> str:
+        """Return the Tk color of separator lines; "transparent" takes the options container's color."""
+        if self.separator_color != "transparent":
+            return self._apply_appearance_mode(self.separator_color)
+        if self._options_container is not self:
+            # The scrollable frame paints its resolved background on its own Tk frame
+            return tk.Frame.cget(self._options_container, "bg")
+        color = self._fg_color if self._fg_color != "transparent" else self._bg_color
+        return self._apply_appearance_mode(color)
+
+    @staticmethod
+    def _separator_pack_kwargs() -> dict:
+        """Return the pack options of separator lines."""
+        return dict(side="top", fill="x", expand=True)
+
+    def _update_separators(self) -> None:
+        """Apply the current separator color and height to every separator line."""
+        try:
+            height = self._separator_height()
+            color = self._separator_tk_color()
+        except Exception:
+            return
+        for separator in getattr(self, "_separators", ()):
+            try:
+                separator.configure(height=height, bg=color)
+            except Exception:
+                pass
+
+    def _repack_separators(self) -> None:
+        """Pack every separator back between its neighbouring options."""
+        pack_kwargs = self._separator_pack_kwargs()
+        first_option = self._options_list[0] if self._options_list else None
+        previous = None
+        for item in self._items:
+            if not isinstance(item, _CDMOptionButton):
+                if previous is not None:
+                    item.pack(after=previous, **pack_kwargs)
+                elif first_option is not None:
+                    item.pack(before=first_option, **pack_kwargs)
+                else:
+                    item.pack(**pack_kwargs)
+            previous = item
 
     def remove_option(self, option_widget_or_name: Union['_CDMOptionButton', '_CDMSubmenuButton', str],
                       cleaning: bool = False) -> bool:
@@ -721,39 +1025,37 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
                             except Exception:
                                 pass
 
-                        # Unregister accelerators bound by this option before destroying it
+                        # Unregister accelerators bound by this option before releasing it
                         try:
-                            if getattr(option, "_accel_bound", False):
-                                cb = option._activate_submenu_accelerator if isinstance(option, _CDMSubmenuButton) else getattr(option, "_execute_if_enabled", None)
-                                key = getattr(option, "_accel_key", None)
-                                targets = getattr(option, "_accel_targets", None)
-                                if targets is None:
-                                    try:
-                                        targets = option._get_accel_targets()
-                                    except Exception:
-                                        targets = []
-                                if key and cb and targets:
-                                    for pt in targets:
-                                        try:
-                                            _unregister_accelerator(pt, key, cb)
-                                        except Exception:
-                                            pass
+                            option._unbind_accelerator()
                         except Exception:
                             pass
 
-                        # Disable and destroy the button widget itself
+                        # Drop a throttled/debounced run still queued for this option
+                        try:
+                            _get_scheduler(self).cancel(option)
+                        except Exception:
+                            pass
+
+                        # Disable the button and keep it for reuse by a later option
                         try:
                             if hasattr(option, 'enable'):
                                 option.enable(False)
-                            option.destroy()
+                            self._release_option_button(option)
                         except Exception:
                             pass
 
                         # Remove from internal list
                         try:
                             self._options_list.remove(option)
+                            self._items.remove(option)
                         except ValueError:
                             pass
+                        self._invalidate_label_index()
+                        if self._highlighted_option is option:
+                            self._highlighted_option = None
+                        if self._filtered_options is not None and option in self._filtered_options:
+                            self._filtered_options.remove(option)
 
                         removed = True
                         break
@@ -789,23 +1091,18 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         for option in self._options_list[:]:
             self.remove_option(option, True)
 
-        # Clear internal list
+        # Clear internal list and type-ahead state that referenced the options
         self._options_list.clear()
+        self._discard_type_ahead_state()
 
-        # Destroy separator frames (but keep scrollable frame for dedicated handling)
-        try:
-            for child in list(self.winfo_children()):
-                # Skip CTkScrollableFrame (handled below)
-                if isinstance(child, getattr(customtkinter, 'CTkScrollableFrame', ())):
-                    continue
-                # Destroy plain frames that are used as separators
-                if isinstance(child, customtkinter.CTkFrame):
-                    try:
-                        child.destroy()
-                    except Exception:
-                        pass
-        except Exception:
-            pass
+        # Destroy separator lines
+        for separator in self._separators:
+            try:
+                separator.destroy()
+            except Exception:
+                pass
+        self._separators.clear()
+        self._items.clear()
 
         # Destroy scrollable frame if present and reset container
         try:
@@ -839,11 +1136,250 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             text = text.split('\t', 1)[0]
         return text.strip()
 
+    def _option_pack_kwargs(self) -> dict:
+        """Return the pack options shared by every option row."""
+        padding = self._scaled_padding + (self.corner_radius / DEFAULT_CORNER_RADIUS_FACTOR)
+        return dict(side="top", fill="both", expand=True, padx=padding, pady=padding)
+
+    def _invalidate_label_index(self) -> None:
+        """Drop cached label and row lookups so they are rebuilt on next use."""
+        self._label_index = None
+        self._row_positions = None
+
+    def _get_label_index(self) -> List[tuple]:
+        """Return the (lowercase label, position) index sorted for prefix lookups."""
+        if self._label_index is None:
+            index = []
+            for position, option in enumerate(self._options_list):
+                try:
+                    index.append((str(option.cget('option')).lower(), position))
+                except Exception:
+                    continue
+            index.sort()
+            self._label_index = index
+        return self._label_index
+
+    def _find_options_by_prefix(self, prefix: str) -> List[Union[_CDMOptionButton, _CDMSubmenuButton]]:
+        """Return options whose label starts with prefix (case-insensitive), in menu order.
+
+        Args:
+            prefix: Typed text to match against option labels
+
+        Returns:
+            Matching options ordered as they appear in the menu
+        """
+        index = self._get_label_index()
+        prefix = prefix.lower()
+        position = bisect.bisect_left(index, (prefix,))
+        matches = []
+        while position < len(index) and index[position][0].startswith(prefix):
+            matches.append(index[position][1])
+            position += 1
+        return [self._options_list[i] for i in sorted(matches)]
+
+    def _visible_options(self) -> List[Union[_CDMOptionButton, _CDMSubmenuButton]]:
+        """Return the options currently packed in the menu, in order."""
+        return self._filtered_options if self._filtered_options is not None else self._options_list
+
+    def _get_row_position(self, option) -> Optional[int]:
+        """Return the visible row of option, or None if it is filtered out."""
+        if self._row_positions is None:
+            self._row_positions = {opt: row for row, opt in enumerate(self._visible_options())}
+        return self._row_positions.get(option)
+
+    def _get_navigator(self) -> _MenuNavigator:
+        """Return the keyboard navigator shared by this menu's tree."""
+        menu = self
+        while isinstance(menu.menu_seed_object, _CDMSubmenuButton):
+            menu = menu.menu_seed_object.parent_menu
+        if menu._navigator is None:
+            menu._navigator = _MenuNavigator(menu)
+        return menu._navigator
+
+    def _on_navigation_key(self, event: tk.Event) -> Optional[str]:
+        """Forward arrow/Enter/Escape keys to the tree's keyboard navigator."""
+        if getattr(self, "_is_destroyed", False) or self.menu_seed_object is None:
+            return None
+        return self._get_navigator().handle_key(self, event.keysym)
+
+    def _on_type_ahead_key(self, event: tk.Event) -> Optional[str]:
+        """Collect typed characters while the menu is open and jump to or filter options.
+
+        Args:
+            event: Key press event delivered to the focused menu
+        """
+        if not self.type_ahead or getattr(self, "_is_destroyed", False):
+            return None
+        if event.state & _TYPE_AHEAD_IGNORED_STATE:
+            return None  # Leave shortcuts to the accelerator handlers
+
+        if event.keysym == "BackSpace":
+            if not self._type_ahead_buffer:
+                return None
+            buffer = self._type_ahead_buffer[:-1]
+        elif event.char and event.char.isprintable():
+            buffer = self._type_ahead_buffer + event.char
+        else:
+            return None
+
+        self._type_ahead_buffer = buffer
+        if self.type_ahead == "filter":
+            # The filter stays until the menu is hidden or the text is erased
+            matches = self._find_options_by_prefix(buffer) if buffer else None
+            self._apply_type_ahead_filter(matches)
+            self._highlight_option(matches[0] if matches else None)
+        else:
+            self._schedule_type_ahead_reset()
+            matches = self._find_options_by_prefix(buffer) if buffer else []
+            if not matches and len(buffer) > 1:
+                # Start a new search from the last typed character
+                self._type_ahead_buffer = buffer = buffer[-1]
+                matches = self._find_options_by_prefix(buffer)
+            if matches:
+                self._highlight_option(matches[0])
+                self._scroll_option_into_view(matches[0])
+        return "break"
+
+    def _apply_type_ahead_filter(self, matches: Optional[List[Union[_CDMOptionButton, _CDMSubmenuButton]]]) -> None:
+        """Pack only the matching options, re-packing rows instead of recreating them.
+
+        Narrowing the filter only forgets the rows that stopped matching; widening it
+        packs the returning rows next to their visible neighbours.
+
+        Args:
+            matches: Options to keep visible in menu order, or None to show all options
+        """
+        current = self._visible_options()
+        target = list(self._options_list) if matches is None else list(matches)
+        if target == current:
+            return
+
+        target_set = set(target)
+        for option in current:
+            if option not in target_set:
+                option.pack_forget()
+
+        current_set = set(current)
+        pack_kwargs = self._option_pack_kwargs()
+        anchor = next((option for option in target if option in current_set), None)
+        previous = None
+        for option in target:
+            if option not in current_set:
+                if previous is not None:
+                    option.pack(after=previous, **pack_kwargs)
+                elif anchor is not None:
+                    option.pack(before=anchor, **pack_kwargs)
+                else:
+                    option.pack(**pack_kwargs)
+            previous = option
+
+        # Separators only make sense between the full list of options
+        if self._separators:
+            if matches is None:
+                self._repack_separators()
+            elif self._filtered_options is None:
+                for separator in self._separators:
+                    separator.pack_forget()
+
+        self._filtered_options = None if matches is None else target
+        self._row_positions = None
+        if self._scrollable_frame is not None:
+            try:
+                self._scrollable_frame._parent_canvas.yview_moveto(0)
+            except Exception:
+                pass
+
+    def _highlight_option(self, option) -> None:
+        """Draw option with the hover color, restoring the previously highlighted one."""
+        previous = self._highlighted_option
+        if previous is option:
+            return
+        if previous is not None:
+            try:
+                previous.configure(fg_color=self.fg_color or DEFAULT_FG_COLOR)
+            except Exception:
+                pass
+        self._highlighted_option = option
+        if option is not None:
+            try:
+                option.configure(fg_color=self.hover_color)
+            except Exception:
+                self._highlighted_option = None
+
+    def _scroll_option_into_view(self, option) -> None:
+        """Scroll the scrollable frame so that option is visible.
+
+        Rows share a single height, so the row fraction is computed directly
+        instead of querying widget geometry.
+        """
+        if self._scrollable_frame is None:
+            return
+        canvas = getattr(self._scrollable_frame, "_parent_canvas", None)
+        row = self._get_row_position(option)
+        rows = len(self._visible_options())
+        if canvas is None or row is None or not rows:
+            return
+        top, bottom = row / rows, (row + 1) / rows
+        try:
+            first, last = canvas.yview()
+            if top < first:
+                canvas.yview_moveto(top)
+            elif bottom > last:
+                canvas.yview_moveto(max(0.0, bottom - (last - first)))
+        except tk.TclError:
+            pass
+
+    def _schedule_type_ahead_reset(self) -> None:
+        """Restart the idle timer that clears the type-ahead buffer."""
+        self._cancel_type_ahead_timer()
+        self._type_ahead_timer = self.after(TYPE_AHEAD_RESET_DELAY, self._clear_type_ahead_buffer)
+
+    def _cancel_type_ahead_timer(self) -> None:
+        """Cancel the pending type-ahead reset, if any."""
+        if getattr(self, "_type_ahead_timer", None):
+            try:
+                self.after_cancel(self._type_ahead_timer)
+            except Exception:
+                pass
+            self._type_ahead_timer = None
+
+    def _clear_type_ahead_buffer(self) -> None:
+        """Forget typed text while keeping the current highlight."""
+        self._type_ahead_timer = None
+        self._type_ahead_buffer = ""
+
+    def _reset_type_ahead(self) -> None:
+        """Clear typed text, show all options again and remove the highlight."""
+        if not hasattr(self, "_type_ahead_buffer"):
+            return
+        self._cancel_type_ahead_timer()
+        self._type_ahead_buffer = ""
+        if self._filtered_options is not None:
+            self._apply_type_ahead_filter(None)
+        self._highlight_option(None)
+
+    def _discard_type_ahead_state(self) -> None:
+        """Forget type-ahead references to option widgets that are being destroyed."""
+        self._cancel_type_ahead_timer()
+        self._type_ahead_buffer = ""
+        self._filtered_options = None
+        self._highlighted_option = None
+        self._invalidate_label_index()
+
     def _show(self) -> None:
         """Show the dropdown menu at the appropriate position."""
+        self._refresh_if_stale()
+        if self._floating == "palette":
+            # Already open as a window: bring it back instead of placing it
+            self.tk.call("wm", "deiconify", self._w)
+            self.lift()
+            self.focus()
+            return
         dpi = self._get_widget_scaling() if hasattr(self, "_get_widget_scaling") else (self.winfo_fpixels('1i') / 72.0)
         
-        if isinstance(self.menu_seed_object, _CDMSubmenuButton):
+        if isinstance(self.menu_seed_object, _CDMSubmenuButton) and self.menu_seed_object.parent_menu._floating:
+            self._show_floating_submenu()
+        elif isinstance(self.menu_seed_object, _CDMSubmenuButton):
             self._show_submenu_positioned(dpi)
         else:
             self._show_main_menu_positioned(dpi)
@@ -872,6 +1408,20 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             y=button_y / dpi - self.pady
         )
     
+    def _show_floating_submenu(self) -> None:
+        """Show a submenu of a torn-off menu as a borderless window next to its button.
+
+        Tk cannot place a widget inside another toplevel, so the submenu floats too
+        until it is hidden again.
+        """
+        button = self.menu_seed_object
+        if self._floating is None:
+            self._float(override_redirect=True)
+        x = button.winfo_rootx() + button.winfo_width() + SUBMENU_HORIZONTAL_OFFSET
+        self.tk.call("wm", "geometry", self._w, f"+{x}+{button.winfo_rooty()}")
+        self._refresh_if_stale()
+        self.tk.call("wm", "deiconify", self._w)
+
     def _show_main_menu_positioned(self, dpi: float) -> None:
         """Position and show main menu relative to its trigger widget.
         
@@ -889,16 +1439,25 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         except Exception:
             pass
 
-        btn_root_x = self.menu_seed_object.winfo_rootx()
-        btn_root_y = self.menu_seed_object.winfo_rooty()
+        anchor = self._position_anchor()
+        btn_root_x = anchor.winfo_rootx()
+        btn_root_y = anchor.winfo_rooty()
         cont_root_x = container.winfo_rootx()
         cont_root_y = container.winfo_rooty()
 
         rel_x = (btn_root_x - cont_root_x) / dpi + self.padx
-        rel_y = (btn_root_y - cont_root_y + self.menu_seed_object.winfo_height()) / dpi + self.pady
+        rel_y = (btn_root_y - cont_root_y + anchor.winfo_height()) / dpi + self.pady
 
         self.place(x=rel_x, y=rel_y)
     
+    def _position_anchor(self) -> Any:
+        """Return the widget the menu opens below: its trigger, or the overflow button of
+        the menu bar while the trigger does not fit the bar."""
+        owner = getattr(self.menu_seed_object, "master", None)
+        if hasattr(owner, "_overflow_anchor"):
+            return owner._overflow_anchor(self.menu_seed_object)
+        return self.menu_seed_object
+
     def _get_submenu_button_position(self) -> tuple[int, int, int]:
         """Get the position and dimensions of the submenu button.
         
@@ -946,9 +1505,13 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         return button_x + frame_x, button_y + frame_y
 
     def _hide(self) -> None:
-        """Hide the dropdown menu and cancel any pending timers."""
+        """Hide the dropdown menu and cancel any pending timers (torn-off palettes stay open)."""
         self._cancel_pending_timer()
-        self.place_forget()
+        self._reset_type_ahead()
+        if self._floating == "popup":
+            self._unfloat()
+        elif self._floating is None:
+            self.place_forget()
     
     def _cancel_pending_timer(self) -> None:
         """Cancel any pending timer to prevent unwanted callbacks."""
@@ -998,7 +1561,9 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         try:
             self._hide_sibling_menus()
             
-            if self.winfo_viewable():
+            if self._floating == "palette":
+                self._show()
+            elif self.winfo_viewable():
                 self._hideChildrenMenus()
                 self._hide()
             else:
@@ -1007,6 +1572,93 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         except Exception as e:
             raise MenuToggleError(f"Failed to toggle menu visibility: {e}") from e
 
+    def tear_off(self, x: Optional[int] = None, y: Optional[int] = None, title: Optional[str] = None) -> None:
+        """Detach the menu into a floating palette window that stays open.
+
+        The palette is this menu's own frame managed as a window, so its options,
+        submenus and accelerator registrations stay the same objects; accelerators keep
+        working while the palette has the focus. Choosing an option leaves the palette
+        open. Closing the window (or reattach()) turns it back into a dropdown.
+
+        Args:
+            x: Screen x coordinate of the palette (default: where the menu is shown, else the pointer)
+            y: Screen y coordinate of the palette
+            title: Window title (default: the text of the menu's trigger widget)
+
+        Raises:
+            MenuPositioningError: If the menu cannot be turned into a window
+        """
+        if self._floating == "palette":
+            self._show()
+            return
+        try:
+            if self.winfo_ismapped():
+                default_x, default_y = self.winfo_rootx(), self.winfo_rooty()
+            else:
+                default_x, default_y = self.winfo_pointerxy()
+            self._hideChildrenMenus()
+            if self._floating == "popup":
+                self._unfloat()
+            self._float(override_redirect=False)
+            self._floating = "palette"
+            if title is None:
+                seed = self.menu_seed_object
+                title = seed.cget("option") if isinstance(seed, _CDMSubmenuButton) else seed.cget("text")
+            self.tk.call("wm", "title", self._w, self._strip_display_artifacts(str(title)).strip())
+            self._close_command = self.register(self.reattach)
+            self.tk.call("wm", "protocol", self._w, "WM_DELETE_WINDOW", self._close_command)
+            self.tk.call("wm", "geometry", self._w,
+                         f"+{default_x if x is None else int(x)}+{default_y if y is None else int(y)}")
+            self._refresh_if_stale()  # Restyles and mode switches made while hidden
+            self.tk.call("wm", "deiconify", self._w)
+        except tk.TclError as e:
+            self._unfloat()
+            raise MenuPositioningError(f"Failed to tear off menu: {e}") from e
+        self.lift()
+        self.focus()
+
+    def reattach(self) -> None:
+        """Close the palette created by tear_off(); the menu opens as a dropdown again."""
+        if self._floating != "palette":
+            return
+        self._hideChildrenMenus()
+        self._unfloat()
+
+    def is_torn_off(self) -> bool:
+        """Return True while the menu is shown as a palette created by tear_off()."""
+        return self._floating == "palette"
+
+    def _float(self, override_redirect: bool) -> None:
+        """Manage the menu frame as a (still withdrawn) window transient for the window it belongs to."""
+        owner = self.winfo_toplevel()
+        self.place_forget()
+        self.tk.call("wm", "manage", self._w)
+        self.tk.call("wm", "withdraw", self._w)
+        self.tk.call("wm", "overrideredirect", self._w, override_redirect)
+        self.tk.call("wm", "transient", self._w, owner._w)
+        self._floating = "popup"
+        self._float_owner = owner
+        _forward_accelerators(self, owner)
+
+    def _unfloat(self) -> None:
+        """Turn a floating menu back into an unmapped frame of its master."""
+        if self._floating is None:
+            return
+        _stop_forwarding_accelerators(self)
+        if self._close_command is not None:
+            self.deletecommand(self._close_command)
+            self._close_command = None
+        try:
+            self.tk.call("wm", "forget", self._w)
+        except tk.TclError:
+            pass  # Already destroyed
+        self._floating = None
+        self._float_owner = None
+
+    def _accelerator_window(self) -> Any:
+        """Return the window the options' accelerators are registered on (also while floating)."""
+        return self._float_owner if self._floating else self.winfo_toplevel()
+
     def _hide_sibling_menus(self) -> None:
         """Hide sibling menus in menu bar or title menu context."""
         widget_base = self.menu_seed_object.master
@@ -1027,18 +1679,104 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         self._bind_button_events(button)
     
     def _apply_button_styling(self, button: customtkinter.CTkButton) -> None:
-        """Apply visual styling to a button.
+        """Apply visual styling to a button in a single configure call (one redraw).
         
         Args:
             button: The button to style
         """
-        button.configure(fg_color=DEFAULT_FG_COLOR)
-        if self.fg_color:
-            button.configure(fg_color=self.fg_color)
+        button.configure(**self._button_style())
+
+    def _button_style(self) -> dict:
+        """Return the configure options that style this menu's option buttons."""
+        style = {"fg_color": self.fg_color or DEFAULT_FG_COLOR, "text_color": self.text_color}
         if self.hover_color:
-            button.configure(hover_color=self.hover_color)
+            style["hover_color"] = self.hover_color
         if self.font:
-            button.configure(font=self.font)
+            style["font"] = self.font
+        return style
+
+    def restyle(self, **theme) -> None:
+        """Change the colors of this menu and all of its submenus in one pass.
+
+        Every option button is updated with a single configure call. Menus that are
+        not currently shown only record the change and apply it when shown next.
+
+        Args:
+            **theme: Any of fg_color, hover_color, text_color, bg_color, border_color
+                and separator_color
+
+        Raises:
+            ValueError: If an unknown theme key is given
+        """
+        unknown = set(theme) - _THEME_PARAMS
+        if unknown:
+            raise ValueError(f"Unknown theme option(s) for restyle(): {', '.join(sorted(unknown))}")
+        if not theme:
+            return
+        for key, value in theme.items():
+            setattr(self, key, value)
+        self._pending_style.update(theme)
+        try:
+            visible = self.winfo_ismapped()
+        except Exception:
+            visible = False
+        if visible:
+            self._refresh_if_stale()
+        for submenu in self._get_submenus():
+            submenu.restyle(**theme)
+
+    def _refresh_if_stale(self) -> None:
+        """Apply changes deferred while the menu was hidden; called before the menu is shown."""
+        if self._appearance_stale:
+            self._appearance_stale = False
+            self._redraw_for_appearance_mode()
+        if self._pending_style:
+            self._apply_pending_style()
+
+    def _defers_redraw(self) -> bool:
+        """Return True if appearance-mode redraws of this menu should wait until it is shown."""
+        try:
+            return not self.winfo_ismapped()
+        except Exception:
+            return False
+
+    def _redraw_for_appearance_mode(self) -> None:
+        """Redraw the frame, separators and option buttons skipped by a deferred mode switch."""
+        self._draw()
+        self._update_separators()
+        for option in self._options_list:
+            try:
+                option._draw()
+                option._update_image()
+            except Exception:
+                pass
+
+    def _apply_pending_style(self) -> None:
+        """Push the theme colors changed by restyle() to the frame, separators and option buttons."""
+        changed, self._pending_style = self._pending_style, set()
+        frame_style = {}
+        if "bg_color" in changed and self.bg_color is not None:
+            frame_style["fg_color"] = self.bg_color
+        if "border_color" in changed:
+            frame_style["border_color"] = self.border_color
+        if frame_style:
+            super().configure(**frame_style)
+        if self._scrollable_frame is not None and changed & {"fg_color", "border_color"}:
+            try:
+                self._scrollable_frame.configure(fg_color=self.fg_color or DEFAULT_FG_COLOR,
+                                                 border_color=self.border_color)
+            except Exception:
+                pass
+        if "separator_color" in changed or (self.separator_color == "transparent"
+                                            and changed & {"fg_color", "bg_color"}):
+            self._update_separators()
+        button_style = {key: value for key, value in self._button_style().items() if key in changed}
+        if button_style:
+            for option in self._options_list:
+                try:
+                    option.configure(**button_style)
+                except Exception:
+                    pass
     
     def _bind_button_events(self, button: customtkinter.CTkButton) -> None:
         """Bind events to a button.
@@ -1194,6 +1932,20 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         except Exception:
             pass
 
+    def _set_appearance_mode(self, mode_string):
+        if getattr(self, "_options_list", None) is not None and self._defers_redraw():
+            # Hidden menu: only record the mode; the redraw happens when it is shown
+            CTkAppearanceModeBaseClass._set_appearance_mode(self, mode_string)
+            self._appearance_stale = True
+            return
+        super()._set_appearance_mode(mode_string)
+        # Separators are plain tk frames and do not follow appearance changes on their own
+        self._update_separators()
+
+    def _set_scaling(self, new_widget_scaling, new_window_scaling):
+        super()._set_scaling(new_widget_scaling, new_window_scaling)
+        self._update_separators()
+
     def configure(self, **kwargs):
         """Configure the dropdown menu properties."""
         # Mapping of parameter names to their handlers
@@ -1214,18 +1966,30 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             "max_visible_options": self._handle_max_visible_options,
             "enable_scrollbar": self._handle_enable_scrollbar,
             "scrollbar_width": self._handle_scrollbar_width,
-            "scale": self._handle_scale
+            "scale": self._handle_scale,
+            "type_ahead": self._handle_type_ahead,
+            "run_in_executor": lambda v: setattr(self, 'run_in_executor', bool(v))
         }
 
-        # Process each parameter
+        # Process each parameter; layout handlers only record the new values
         for param, value in kwargs.items():
             if param in param_handlers:
                 param_handlers[param](value)
 
-        # Configure child widgets with remaining parameters
+        # Re-layout once for all layout changes, then hand a new scale down the tree once
+        if _LAYOUT_PARAMS.intersection(kwargs):
+            self._apply_scale()
+        if "scale" in kwargs:
+            for submenu in self._get_submenus():
+                try:
+                    submenu.configure(scale=self.scale)
+                except Exception:
+                    pass
+
+        # Configure option widgets with remaining parameters
         remaining_kwargs = {k: v for k, v in kwargs.items() if k not in param_handlers}
-        for widget in self.winfo_children():
-            if isinstance(widget, (_CDMOptionButton, _CDMSubmenuButton)):
+        if remaining_kwargs:
+            for widget in self._options_list:
                 widget.configure(**remaining_kwargs)
 
     def _handle_bg_color(self, value):
@@ -1245,7 +2009,6 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             self._base_border_width = float(value) / float(self.scale)
         except Exception:
             self._base_border_width = value
-        super().configure(border_width=value)
 
     def _handle_corner_radius(self, value):
         """Handle corner_radius configuration."""
@@ -1254,14 +2017,11 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             self._base_corner_radius = float(value) / float(self.scale)
         except Exception:
             self._base_corner_radius = value
-        super().configure(corner_radius=value)
 
     def _handle_separator_color(self, value):
         """Handle separator color configuration."""
         self.separator_color = value
-        for child in self.winfo_children():
-            if isinstance(child, customtkinter.CTkFrame):
-                child.configure(fg_color=value)
+        self._update_separators()
 
     def _handle_height(self, value):
         """Handle height configuration, maintaining base for future scaling."""
@@ -1270,8 +2030,6 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             self._base_height = float(value) / float(self.scale)
         except Exception:
             self._base_height = value
-        # Update existing items to reflect new absolute change
-        self._apply_scale()
 
     def _handle_width(self, value):
         """Handle width configuration, maintaining base for future scaling."""
@@ -1280,7 +2038,6 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             self._base_width = float(value) / float(self.scale)
         except Exception:
             self._base_width = value
-        self._apply_scale()
 
     def _handle_padx(self, value):
         self.padx = value
@@ -1288,7 +2045,6 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             self._base_padx = float(value) / float(self.scale)
         except Exception:
             self._base_padx = value
-        self._apply_scale()
 
     def _handle_pady(self, value):
         self.pady = value
@@ -1296,7 +2052,6 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             self._base_pady = float(value) / float(self.scale)
         except Exception:
             self._base_pady = value
-        self._apply_scale()
 
     def _handle_max_visible_options(self, value):
         """Handle max_visible_options configuration."""
@@ -1309,7 +2064,7 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         self._update_scrollbar_visibility()
 
     def _handle_scrollbar_width(self, value):
-        """Handle scrollbar_width configuration and re-layout if needed."""
+        """Handle scrollbar_width configuration."""
         try:
             self.scrollbar_width = int(value)
         except Exception:
@@ -1318,44 +2073,46 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             self._base_scrollbar_width = float(value) / float(self.scale)
         except Exception:
             self._base_scrollbar_width = value
-        # If a scrollable frame is active, rebuild it to apply new width
-        if getattr(self, "_scrollable_frame", None) is not None:
-            self._destroy_scrollable_frame()
-            self._create_scrollable_frame()
 
     def _handle_font(self, value):
-        """Handle font configuration, maintain base and reapply scaling."""
+        """Handle font configuration, maintaining base for future scaling."""
         self._base_font = value
-        self.font = self._scaled_font_from_base()
-        # Apply to existing options
-        try:
-            for opt in list(self._options_list):
-                try:
-                    opt.configure(font=self.font)
-                except Exception:
-                    pass
-        except Exception:
-            pass
 
     def _handle_scale(self, value):
-        """Handle scale updates across the entire menu tree."""
+        """Handle scale configuration (configure() re-lays out and propagates it to submenus)."""
         try:
             self.scale = float(value)
         except Exception:
             return
         if self.scale <= 0:
             self.scale = 1.0
-        # Apply to self
-        self._apply_scale()
-        # Propagate to submenus
-        try:
-            for submenu in self._get_submenus():
-                try:
-                    submenu.configure(scale=self.scale)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+
+    def _handle_type_ahead(self, value):
+        """Handle type_ahead configuration, dropping any active search."""
+        self._reset_type_ahead()
+        self.type_ahead = value if value in ("jump", "filter") else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Report what this menu and its submenus cost.
+
+        Useful to find heavy menus and to check that clean()/destroy() release
+        everything. Counting walks Python-side widget references only.
+
+        Returns:
+            Dict with the totals of the menu tree:
+            menus, options, separators: Menus in the tree and their items
+            tk_widgets: Tk widgets inside the menu frames (including pooled buttons)
+            pooled_buttons: Released buttons kept for reuse
+            icons: {"unique": CTkImages shown, "shared": images used by several options,
+            "uses": options with an icon, "bytes": approximate pixel memory}
+            accelerators: Accelerator registrations (one per option and bound window)
+            pending_timers: Armed type-ahead and submenu hover timers
+            scheduled_commands: Throttled/debounced runs still queued
+            background_tasks: Async or thread-pool commands in flight
+            tcl_callbacks: Python callbacks registered with Tcl by the menus' widgets
+            memory_bytes: Approximate Python memory of the widgets plus icon pixels
+        """
+        return _collect_menu_stats([self])
 
     def cget(self, param: str):
         """Get configuration parameter value."""
@@ -1375,7 +2132,9 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             "max_visible_options": self.max_visible_options,
             "enable_scrollbar": self.enable_scrollbar,
             "scrollbar_width": self.scrollbar_width,
-            "scale": self.scale
+            "scale": self.scale,
+            "type_ahead": self.type_ahead,
+            "run_in_executor": self.run_in_executor
         }
 
         if param in param_mapping:
@@ -1412,40 +2171,36 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         if self._scrollable_frame is not None:
             return
 
+        frame_width, max_height, button_width, configured_sb_width = self._scrollable_frame_geometry()
+
+        # Create scrollable frame
+        self._scrollable_frame = customtkinter.CTkScrollableFrame(
+            self,
+            width=frame_width,
+            height=max_height,
+            fg_color=self.fg_color if self.fg_color else DEFAULT_FG_COLOR,
+            corner_radius=0,
+            border_color=self.border_color,
+            border_width=self.border_width
+        )
+
+        self._apply_scrollbar_width(configured_sb_width)
+
+        self._scrollable_frame.pack(fill="both", expand=True, padx=0, pady=0)
+        self._recreate_options("creation", button_width=button_width)
+
+    def _scrollable_frame_geometry(self) -> Tuple[int, int, int, int]:
+        """Compute the scrollable frame size for the current options and scale.
+
+        Returns:
+            (frame width, frame height, option button width, scrollbar width)
+        """
         # Calculate the height for the scrollable area
         option_height = self.height + (2 * (self._scaled_padding + (self.corner_radius/DEFAULT_CORNER_RADIUS_FACTOR)))
         max_height = option_height * self.max_visible_options
 
-        # Calculate maximum required width for all options
-        max_option_width = self.width  # Start with default width
-        
-        # Get font for text measurement
-        try:
-            import tkinter.font as tkFont
-            font = tkFont.Font(font=self.font) if self.font else tkFont.Font()
-            
-            # Check width of all current options
-            for option in self._options_list:
-                try:
-                    option_text = option.cget('text')
-                    # Measure text width
-                    text_width = font.measure(option_text)
-                    # Add conservative padding for accelerator text, icons, checkmarks, etc.
-                    total_width = text_width
-                    max_option_width = max(max_option_width, total_width)
-                except:
-                    continue
-                    
-        except ImportError:
-            # Fallback if tkinter.font is not available
-            for option in self._options_list:
-                try:
-                    option_text = option.cget('text')
-                    # Rough estimation: ~8 pixels per character
-                    estimated_width = len(option_text) * 8 + 20
-                    max_option_width = max(max_option_width, estimated_width)
-                except:
-                    continue
+        # Calculate maximum required width for all options (starting with the default width)
+        max_option_width = max([self.width, *self._measure_option_widths().values()])
 
         # Calculate width accounting for scrollbar space
         # Reserve space equal to the configured scrollbar width (+ small padding)
@@ -1456,34 +2211,55 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         extra_padding = max(SCROLLBAR_EXTRA_SPACE - SCROLLBAR_WIDTH, 0)
         scrollbar_space = max(configured_sb_width, 0) + extra_padding
         frame_width = max_option_width + scrollbar_space
-        
+
         # Ensure minimum width but allow expansion for longer texts
         frame_width = max(frame_width, self.width + scrollbar_space)
-        
-        # Create scrollable frame
-        self._scrollable_frame = customtkinter.CTkScrollableFrame(
-            self,
-            width=frame_width,
-            height=max_height,
-            fg_color=self.fg_color if self.fg_color else DEFAULT_FG_COLOR,
-            corner_radius=0,
-            border_color=self.border_color,
-            border_width=self.border_width
-        )
+        return frame_width, max_height, frame_width - scrollbar_space, configured_sb_width
 
-        # Try to apply scrollbar_width to the internal scrollbar if accessible
+    def _apply_scrollbar_width(self, width: int) -> None:
+        """Apply width to the scrollable frame's internal scrollbar if accessible."""
         try:
             possible_attrs = ("_scrollbar", "scrollbar", "_scrollbar_vertical", "_v_scrollbar")
             for name in possible_attrs:
                 sb = getattr(self._scrollable_frame, name, None)
                 if sb and hasattr(sb, "configure"):
-                    sb.configure(width=configured_sb_width)
+                    sb.configure(width=width)
                     break
         except Exception:
             pass
 
-        self._scrollable_frame.pack(fill="both", expand=True, padx=0, pady=0)
-        self._recreate_options("creation", button_width=frame_width - scrollbar_space)
+    def _measure_option_widths(self) -> Dict[Tuple[str, str], int]:
+        """Measure the display text of every option, reusing widths measured before.
+
+        Returns:
+            Mapping of (font description, text) to width in pixels for this menu's options
+        """
+        widths = {}
+        try:
+            import tkinter.font as tkFont
+            font = tkFont.Font(font=self.font) if self.font else tkFont.Font()
+            font_key = repr(sorted(font.actual().items()))
+
+            for option in self._options_list:
+                try:
+                    key = (font_key, option.cget('text'))
+                    width = _TEXT_WIDTH_CACHE.get(key)
+                    if width is None:
+                        width = _TEXT_WIDTH_CACHE[key] = font.measure(key[1])
+                    widths[key] = width
+                except Exception:
+                    continue
+
+        except ImportError:
+            # Fallback if tkinter.font is not available
+            for option in self._options_list:
+                try:
+                    option_text = option.cget('text')
+                    # Rough estimation: ~8 pixels per character
+                    widths[("", option_text)] = len(option_text) * 8 + 20
+                except Exception:
+                    continue
+        return widths
 
     def _destroy_scrollable_frame(self) -> None:
         """Remove scrollable frame and move options back to main frame."""
@@ -1493,11 +2269,15 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
 
     def _recreate_options(self, process: str, **kwargs):
         button_width = kwargs.pop("button_width", self.width)
-        # Store current options data before recreating them
+        # Recreated widgets replace the ones referenced by type-ahead state
+        self._discard_type_ahead_state()
+        # Store current options data (in display order, with separators) before recreating them
         options_data = []
-        for option in self._options_list:
+        for option in self._items:
             try:
-                if isinstance(option, _CDMSubmenuButton):
+                if not isinstance(option, _CDMOptionButton):
+                    options_data.append({'type': 'separator'})
+                elif isinstance(option, _CDMSubmenuButton):
                     options_data.append({
                         'type': 'submenu',
                         'text': option.cget('option'),
@@ -1511,28 +2291,47 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
                     options_data.append({
                         'type': 'option',
                         'text': option.cget('option'),
-                        'command': option.cget('command'),
+                        'command': getattr(option, '_user_command', None) or self._dummy_command,
                         'accelerator': option.cget('accelerator'),
                         'icon': option.cget('icon'),
                         'icon_size': option.cget('icon_size'),
                         'checkable': option.cget('checkable'),
                         'checked': option.cget('checked'),
-                        'enabled': option.cget('enabled')
+                        'enabled': option.cget('enabled'),
+                        'throttle_ms': option.cget('throttle_ms'),
+                        'debounce_ms': option.cget('debounce_ms'),
+                        'coalesce': option.cget('coalesce'),
+                        'disable_while_running': option.cget('disable_while_running'),
+                        'run_in_executor': option.cget('run_in_executor')
                     })
             except Exception as e:
                 # Issue warning but continue processing other options
                 warnings.warn(f"Error processing option during scrollable frame {process}: {e}")
                 continue
 
-        # Clear existing options with proper error handling
+        # Clear existing options with proper error handling. Tk cannot move the buttons to
+        # the new container, so they are destroyed rather than pooled in the container
+        # that stops holding options (the pooled ones there are dropped as well)
+        scheduler = _get_scheduler(self)
+        previous_container = self._options_container
         for option in self._options_list[:]:
             try:
-                if hasattr(option, 'destroy'):
-                    option.destroy()
+                scheduler.cancel(option)
+                # The rebuilt button registers the same keys; drop this one's records first
+                option._unbind_accelerator()
+                option.destroy()
             except Exception as e:
                 warnings.warn(f"Error destroying option widget: {e}")
                 continue
         self._options_list.clear()
+        for separator in self._separators:
+            try:
+                separator.destroy()
+            except Exception:
+                pass
+        self._separators.clear()
+        self._items.clear()
+        _get_button_pool(previous_container).clear()
 
         if process == "destruction":
             # Destroy scrollable frame with error handling
@@ -1550,10 +2349,12 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
 
         # Recreate options in the main/scrollable frame
         for data in options_data:
-            if data['type'] == 'submenu':
+            if data['type'] == 'separator':
+                self._append_separator()
+            elif data['type'] == 'submenu':
                 # Recreate submenu button
-                submenuButtonSeed = _CDMSubmenuButton(
-                    self._options_container,
+                submenuButtonSeed = self._new_option_button(
+                    _CDMSubmenuButton,
                     text=data['text'],
                     anchor="w",
                     text_color=self.text_color,
@@ -1574,6 +2375,7 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
                 submenuButtonSeed.configure(command=submenu.toggleShow)
                 submenu.is_submenu = True
                 self._options_list.append(submenuButtonSeed)
+                self._items.append(submenuButtonSeed)
                 self._configureButton(submenuButtonSeed)
 
                 submenuButtonSeed.configure(cursor=self.cursor)
@@ -1588,30 +2390,32 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
                 self._setup_submenu_timers(submenuButtonSeed, submenu)
             else:
                 # Recreate option button
-                optionButton = _CDMOptionButton(
-                    self._options_container,
+                optionButton = self._new_option_button(
+                    _CDMOptionButton,
                     width=button_width,
                     height=self.height,
                     text=data['text'],
                     anchor="w",
                     text_color=self.text_color,
-                    command=partial(self.selectOption, data['command']) if data['command'] else None,
                     accelerator=data['accelerator'],
                     icon=data['icon'],
                     icon_size=data['icon_size'],
                     checkable=data['checkable'],
                     checked=data['checked'],
-                    enabled=data['enabled']
+                    enabled=data['enabled'],
+                    throttle_ms=data['throttle_ms'],
+                    debounce_ms=data['debounce_ms'],
+                    coalesce=data['coalesce'],
+                    disable_while_running=data['disable_while_running'],
+                    run_in_executor=data['run_in_executor']
                 )
                 optionButton.configure(cursor=self.cursor)
+                self._bind_option_command(optionButton, data['command'])
                 optionButton.setParentMenu(self)
                 self._options_list.append(optionButton)
+                self._items.append(optionButton)
                 self._configureButton(optionButton)
 
-                # Set up checkable command wrapper if needed
-                if data['checkable'] and data['command'] and data['command'] != self._dummy_command:
-                    self._setup_checkable_command(optionButton, data['command'])
-
                 # Add submenu binding if this is a submenu
                 if self.is_submenu:
                     optionButton.bind("<Enter>", lambda e, submenu=self: submenu.change_hover(self), add="+")
@@ -1633,6 +2437,7 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
         - Cancelling all pending timer callbacks
         - Cleaning up submenu timer references  
         - Destroying scrollable frame components
+        - Unbinding its click handlers from the toplevel
         - Clearing widget references and option lists
         - Calling parent destroy method safely
         
@@ -1646,17 +2451,25 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             except Exception:
                 pass
 
+            # A torn-off menu stops forwarding key presses before it goes away
+            try:
+                self._unfloat()
+            except Exception:
+                pass
+
             # First perform a full logical cleanup to unregister accelerators and destroy children
             try:
                 self.clean()
             except Exception:
                 pass
 
-            # Cancel any pending timers
+            # Cancel any pending timers and background commands
+            self._cancel_type_ahead_timer()
+            self._cancel_background_commands()
             if hasattr(self, '_timer_id') and self._timer_id:
                 try:
                     self.after_cancel(self._timer_id)
-                except:
+                except Exception:
                     pass
                 self._timer_id = None
 
@@ -1667,10 +2480,25 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             if hasattr(self, '_scrollable_frame') and self._scrollable_frame:
                 try:
                     self._scrollable_frame.destroy()
-                except:
+                except Exception:
                     pass
                 self._scrollable_frame = None
 
+            # Drop buttons kept for reuse
+            try:
+                _get_button_pool(self).clear()
+            except Exception:
+                pass
+
+            # Remove the handlers bound outside the menu itself
+            self._unbind_toplevel()
+            seed = getattr(self, 'menu_seed_object', None)
+            if seed is not None and not isinstance(seed, _CDMSubmenuButton):
+                try:
+                    seed.configure(command=None)
+                except Exception:
+                    pass  # Seed destroyed before the menu
+
             # Clear references
             if hasattr(self, '_options_list'):
                 self._options_list.clear()
@@ -1683,7 +2511,7 @@ class CustomDropdownMenu(customtkinter.CTkFrame):
             # Call parent destroy
             try:
                 super().destroy()
-            except:
+            except Exception:
                 pass
 
     def _setup_submenu_timers(self, button, submenu: CustomDropdownMenu = None):
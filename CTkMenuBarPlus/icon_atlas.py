@@ -0,0 +1,276 @@
+"""
+Memory-mapped icon atlas for CTkMenuBarPlus
+
+An atlas stores a whole icon set pre-resized to a few pixel sizes. Every size is one
+raw RGBA sprite sheet (a single column of square icons), so an icon is a contiguous
+byte range of the file. Sheets are memory-mapped and icons are sliced out on demand
+as PIL images sharing the mapped memory: nothing is decoded or resampled at startup
+and untouched icons never become resident.
+
+Layout of an atlas directory:
+    atlas.json       {"format": 1, "sizes": [16, 24], "names": ["edit/copy", "save", ...]}
+    icons_16.rgba    len(names) * 16 * 16 * 4 bytes, icons in "names" order
+    icons_24.rgba    ...
+
+Build an atlas from a directory of images (names are relative paths without extension):
+    python -m CTkMenuBarPlus build-atlas assets/icons build/icons.atlas --sizes 16 24 32
+
+Usage:
+    from CTkMenuBarPlus import load_icon_atlas
+    atlas = load_icon_atlas("build/icons.atlas")
+    file_menu.add_option("Save", command=save, icon=atlas.icon("save"))
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+import argparse
+import json
+import mmap
+import os
+import PIL.Image
+from .custom_exception_classes import MenuIconError
+from .svg_icons import _render_svg_file
+
+# Bump when the atlas layout changes
+_ATLAS_FORMAT = 1
+_ATLAS_INDEX = "atlas.json"
+_IMAGE_EXTENSIONS = (".png", ".gif", ".bmp", ".jpg", ".jpeg", ".ico", ".webp", ".tif", ".tiff", ".svg")
+
+# Open atlases by absolute directory path
+_ATLASES: Dict[str, "IconAtlas"] = {}
+
+
+def _sheet_name(size: int) -> str:
+    return f"icons_{size}.rgba"
+
+
+class _AtlasIcon:
+    """Reference to one icon of an atlas; accepted wherever menu options take an icon."""
+    __slots__ = ('atlas', 'name')
+
+    def __init__(self, atlas: "IconAtlas", name: str):
+        self.atlas = atlas
+        self.name = name
+
+    @property
+    def cache_key(self) -> str:
+        """Identity used by the shared icon cache."""
+        return f"atlas:{self.atlas.path}#{self.name}"
+
+    def image(self, size: int) -> PIL.Image.Image:
+        """Return the icon as a size x size PIL image."""
+        return self.atlas.image(self.name, size)
+
+    def __repr__(self) -> str:
+        return f"_AtlasIcon({self.atlas.path!r}, {self.name!r})"
+
+
+class IconAtlas:
+    """Read-only, memory-mapped icon atlas (see module docstring for the layout)."""
+
+    def __init__(self, path: str):
+        """Open the atlas directory at path.
+
+        Args:
+            path: Directory created by build_icon_atlas()
+
+        Raises:
+            MenuIconError: If the atlas index is missing or has an unknown format
+        """
+        self.path = os.path.abspath(path)
+        try:
+            with open(os.path.join(self.path, _ATLAS_INDEX), "r", encoding="utf-8") as file:
+                index = json.load(file)
+        except (OSError, ValueError) as e:
+            raise MenuIconError(f"Cannot read icon atlas '{path}': {e}") from e
+        if index.get("format") != _ATLAS_FORMAT:
+            raise MenuIconError(f"Unsupported icon atlas format in '{path}': {index.get('format')}")
+        self.sizes: List[int] = sorted(int(size) for size in index["sizes"])
+        self._positions: Dict[str, int] = {name: i for i, name in enumerate(index["names"])}
+        self._sheets: Dict[int, mmap.mmap] = {}
+        # (name, size) -> image, only for sizes that had to be resampled from a sheet
+        self._resampled: Dict[Tuple[str, int], PIL.Image.Image] = {}
+
+    @property
+    def names(self) -> List[str]:
+        """Icon names in atlas order."""
+        return list(self._positions)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    def icon(self, name: str) -> _AtlasIcon:
+        """Return a reference to icon name for use as a menu option icon.
+
+        Raises:
+            MenuIconError: If the atlas has no icon called name
+        """
+        if name not in self._positions:
+            raise MenuIconError(f"Icon '{name}' not found in atlas '{self.path}'")
+        return _AtlasIcon(self, name)
+
+    def _sheet(self, size: int) -> mmap.mmap:
+        """Map the sprite sheet of size on first use."""
+        sheet = self._sheets.get(size)
+        if sheet is None:
+            with open(os.path.join(self.path, _sheet_name(size)), "rb") as file:
+                sheet = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._sheets[size] = sheet
+        return sheet
+
+    def _slice(self, name: str, size: int) -> PIL.Image.Image:
+        """Return icon name from the sheet of size without copying its pixels."""
+        stride = size * size * 4
+        offset = self._positions[name] * stride
+        view = memoryview(self._sheet(size))[offset:offset + stride]
+        return PIL.Image.frombuffer("RGBA", (size, size), view, "raw", "RGBA", 0, 1)
+
+    def image(self, name: str, size: int) -> PIL.Image.Image:
+        """Return icon name at size x size pixels.
+
+        Sizes stored in the atlas are sliced from the mapped sheet; other sizes are
+        resampled once from the nearest larger sheet (or the largest one).
+
+        Raises:
+            MenuIconError: If the atlas has no icon called name
+        """
+        if name not in self._positions:
+            raise MenuIconError(f"Icon '{name}' not found in atlas '{self.path}'")
+        if size in self.sizes:
+            return self._slice(name, size)
+        image = self._resampled.get((name, size))
+        if image is None:
+            source = next((s for s in self.sizes if s > size), self.sizes[-1])
+            image = self._slice(name, source).resize((size, size), PIL.Image.Resampling.LANCZOS)
+            self._resampled[(name, size)] = image
+        return image
+
+    def close(self) -> None:
+        """Unmap all sheets; images sliced from them must no longer be used."""
+        for sheet in self._sheets.values():
+            try:
+                sheet.close()
+            except BufferError:
+                pass  # Still referenced by live images; released with them
+        self._sheets.clear()
+        self._resampled.clear()
+        _ATLASES.pop(self.path, None)
+
+
+def load_icon_atlas(path: str) -> IconAtlas:
+    """Open the atlas at path, reusing an already opened instance.
+
+    Args:
+        path: Atlas directory created by build_icon_atlas()
+
+    Returns:
+        The IconAtlas
+    """
+    key = os.path.abspath(path)
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        atlas = _ATLASES[key] = IconAtlas(key)
+    return atlas
+
+
+def _find_icons(source_dir: str) -> List[Tuple[str, str]]:
+    """Return (name, file path) of every image below source_dir, sorted by name.
+
+    Raises:
+        MenuIconError: If two files map to the same name (e.g. save.png and save.svg)
+    """
+    found = []
+    for root, _dirs, files in os.walk(source_dir):
+        for filename in files:
+            stem, ext = os.path.splitext(filename)
+            if ext.lower() in _IMAGE_EXTENSIONS:
+                rel = os.path.relpath(os.path.join(root, stem), source_dir)
+                found.append((rel.replace(os.sep, "/"), os.path.join(root, filename)))
+    found.sort()
+    for (name, first), (other, second) in zip(found, found[1:]):
+        if name == other:
+            raise MenuIconError(f"Icon name '{name}' is used by both '{first}' and '{second}'")
+    return found
+
+
+def build_icon_atlas(source_dir: str, output_dir: str, sizes: Iterable[int] = (16, 24, 32)) -> IconAtlas:
+    """Build an atlas from every image file below source_dir.
+
+    Args:
+        source_dir: Directory with icon images; an icon's name is its relative path
+            without extension, using '/' as separator
+        output_dir: Atlas directory to create or overwrite
+        sizes: Pixel sizes to pre-render
+
+    Returns:
+        The freshly built atlas
+
+    Raises:
+        MenuIconError: If no icons were found, two files share a name or a file cannot be read
+    """
+    sizes = sorted({int(size) for size in sizes if int(size) > 0})
+    icons = _find_icons(source_dir)
+    if not icons or not sizes:
+        raise MenuIconError(f"No icons (or sizes) to build an atlas from '{source_dir}'")
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Drop a previously opened instance; its sheets are about to be replaced
+    stale = _ATLASES.get(os.path.abspath(output_dir))
+    if stale is not None:
+        stale.close()
+
+    tmp_paths = [os.path.join(output_dir, _sheet_name(size)) + ".tmp" for size in sizes]
+    sheets = {}
+    try:
+        for size, tmp_path in zip(sizes, tmp_paths):
+            sheets[size] = open(tmp_path, "wb")
+        for name, file_path in icons:
+            if file_path.lower().endswith(".svg"):
+                # Vector icons are rendered at every size instead of resampled
+                for size in sizes:
+                    sheets[size].write(_render_svg_file(file_path, size).tobytes())
+                continue
+            try:
+                with PIL.Image.open(file_path) as source:
+                    source = source.convert("RGBA")
+                    for size in sizes:
+                        sheets[size].write(source.resize((size, size), PIL.Image.Resampling.LANCZOS).tobytes())
+            except OSError as e:
+                raise MenuIconError(f"Cannot read icon '{file_path}': {e}") from e
+    except BaseException:
+        # Leave no partial sheets behind; an existing atlas stays as it was
+        for sheet in sheets.values():
+            sheet.close()
+        for tmp_path in tmp_paths:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        raise
+    for sheet in sheets.values():
+        sheet.close()
+    for size in sizes:
+        sheet_path = os.path.join(output_dir, _sheet_name(size))
+        os.replace(sheet_path + ".tmp", sheet_path)
+
+    index = {"format": _ATLAS_FORMAT, "sizes": sizes, "names": [name for name, _path in icons]}
+    with open(os.path.join(output_dir, _ATLAS_INDEX), "w", encoding="utf-8") as file:
+        json.dump(index, file)
+    return load_icon_atlas(output_dir)
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Command line entry point of the atlas builder."""
+    parser = argparse.ArgumentParser(prog="python -m CTkMenuBarPlus build-atlas",
+                                     description="Build a memory-mapped icon atlas from a directory of images.")
+    parser.add_argument("source", help="directory containing the icon images")
+    parser.add_argument("output", help="atlas directory to create")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 24, 32],
+                        help="pixel sizes to pre-render (default: 16 24 32)")
+    args = parser.parse_args(argv)
+    atlas = build_icon_atlas(args.source, args.output, args.sizes)
+    print(f"Built atlas '{atlas.path}': {len(atlas.names)} icons at sizes {atlas.sizes}")
+    return 0
+
+
+__all__ = ["IconAtlas", "load_icon_atlas", "build_icon_atlas", "_AtlasIcon"]
@@ -0,0 +1,220 @@
+"""
+Icon cache for CTkMenuBarPlus
+
+Menu icons given as file paths are decoded and resampled once per (file, size) and
+shared by every option that uses them. Resized icons can also be exported as PNG
+bytes and seeded back (used by menu snapshots) so that a later run skips opening and
+resampling the original files. Icons from an icon atlas are sliced from its mapped
+sprite sheets instead. Options showing the same icon at the same size share one
+CTkImage (and therefore one Tk photo image per scaling).
+
+An icon can also be a (light, dark) pair of sources. Only the variant of the current
+appearance mode is loaded when the image is created; the other one is loaded on the
+first switch to its mode. SVG files are rendered at the exact pixel size requested,
+including the display's widget scaling, instead of being resampled.
+
+Usage:
+    from .icon_cache import _load_resized_icon
+    image = _load_resized_icon("assets/save.png", 16)  # PIL.Image, cached
+
+    from .icon_cache import _get_ctk_image
+    ctk_image = _get_ctk_image(atlas.icon("save"), 16)  # shared between options
+    ctk_image = _get_ctk_image(("icons/save.png", "icons/save-dark.png"), 16)  # light/dark pair
+
+    from .icon_cache import clear_icon_cache
+    clear_icon_cache()  # e.g. after icon files changed on disk
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Tuple
+import io
+import os
+import weakref
+import customtkinter
+import PIL.Image
+from PIL import ImageTk
+from .constants import ICON_CACHE_SIZE
+from .icon_atlas import _AtlasIcon
+from .svg_icons import _is_svg_source, _render_svg_file
+
+# (absolute path, size px) -> resized image, least recently used first
+_ICON_CACHE: "OrderedDict[Tuple[str, int], PIL.Image.Image]" = OrderedDict()
+# (absolute path, size px) -> resized image as PNG bytes, seeded from snapshots
+_ICON_PNG_BYTES: Dict[Tuple[str, int], bytes] = {}
+# (source key, size px) -> CTkImage shared by the options showing it; dropped when unused
+_CTK_IMAGES: "weakref.WeakValueDictionary[Tuple[str, int], customtkinter.CTkImage]" = weakref.WeakValueDictionary()
+
+
+def _icon_file_path(icon: Any) -> str | None:
+    """Return the absolute path of a file icon, or None for other icon sources."""
+    if isinstance(icon, (str, os.PathLike)):
+        return os.path.abspath(os.fspath(icon))
+    return None
+
+
+def _icon_source_key(icon: Any) -> str | None:
+    """Return the cache identity of an icon source, or None if it cannot be cached.
+
+    File paths and atlas icons are cached; PIL images passed directly may be mutated
+    by the application and are resampled on every use.
+    """
+    if isinstance(icon, _AtlasIcon):
+        return icon.cache_key
+    return _icon_file_path(icon)
+
+
+def _resize_icon(icon: Any, size: int) -> PIL.Image.Image:
+    """Open (if needed) and resample an icon to size x size pixels; SVG files are rendered at size."""
+    if _is_svg_source(icon):
+        return _render_svg_file(os.fspath(icon), size)
+    image = PIL.Image.open(icon) if isinstance(icon, (str, os.PathLike)) else icon
+    return image.resize((size, size), PIL.Image.Resampling.LANCZOS)
+
+
+def _load_resized_icon(icon: Any, size: int) -> PIL.Image.Image:
+    """Return icon resized to size x size pixels, reusing cached results for file icons.
+
+    Args:
+        icon: Path to an image file, an atlas icon or a PIL image
+        size: Edge length in pixels
+
+    Returns:
+        The resized PIL image
+    """
+    if isinstance(icon, _AtlasIcon):
+        return icon.image(size)
+    key = _icon_file_path(icon)
+    if key is None:
+        return _resize_icon(icon, size)
+    cache_key = (key, size)
+    image = _ICON_CACHE.get(cache_key)
+    if image is not None:
+        _ICON_CACHE.move_to_end(cache_key)
+        return image
+
+    png = _ICON_PNG_BYTES.get(cache_key)
+    if png is not None:
+        image = PIL.Image.open(io.BytesIO(png))
+        image.load()
+    else:
+        image = _resize_icon(key, size)
+
+    _ICON_CACHE[cache_key] = image
+    if len(_ICON_CACHE) > ICON_CACHE_SIZE:
+        _ICON_CACHE.popitem(last=False)
+    return image
+
+
+def _get_icon_png_bytes(icon: Any, size: int) -> bytes | None:
+    """Return the resized file icon encoded as PNG, or None if icon is not a file path."""
+    key = _icon_file_path(icon)
+    if key is None:
+        return None
+    png = _ICON_PNG_BYTES.get((key, size))
+    if png is None:
+        buffer = io.BytesIO()
+        _load_resized_icon(key, size).save(buffer, format="PNG")
+        png = buffer.getvalue()
+        _ICON_PNG_BYTES[(key, size)] = png
+    return png
+
+
+def _seed_icon_png_bytes(entries: Iterable[Tuple[str, int, bytes]]) -> None:
+    """Provide already resized icons as (absolute path, size, PNG bytes) entries."""
+    for path, size, png in entries:
+        _ICON_PNG_BYTES[(path, int(size))] = png
+
+
+class _LazyCTkImage(customtkinter.CTkImage):
+    """CTkImage with separate light and dark sources that loads each variant on first use.
+
+    SVG sources are rendered again at the scaled display size instead of resampling
+    the base-size raster.
+    """
+
+    def __init__(self, light_source: Any, dark_source: Any, size: int):
+        """Create the image, loading only the variant of the current appearance mode.
+
+        Args:
+            light_source: Icon source (path, atlas icon or PIL image) for light mode
+            dark_source: Icon source for dark mode
+            size: Edge length in pixels
+        """
+        self._sources = {"light": light_source, "dark": dark_source}
+        self._pixel_size = size
+        if customtkinter.get_appearance_mode().lower() == "dark":
+            super().__init__(dark_image=self._load_variant("dark"), size=(size, size))
+        else:
+            super().__init__(light_image=self._load_variant("light"), size=(size, size))
+
+    def _load_variant(self, mode: str) -> PIL.Image.Image:
+        return _load_resized_icon(self._sources[mode], self._pixel_size)
+
+    def create_scaled_photo_image(self, widget_scaling: float, appearance_mode: str):
+        # Load the other variant lazily instead of falling back to the one already loaded
+        if appearance_mode == "dark" and self._dark_image is None:
+            self._dark_image = self._load_variant("dark")
+        elif appearance_mode == "light" and self._light_image is None:
+            self._light_image = self._load_variant("light")
+        return super().create_scaled_photo_image(widget_scaling, appearance_mode)
+
+    def _get_scaled_light_photo_image(self, scaled_size: Tuple[int, int]):
+        if scaled_size not in self._scaled_light_photo_images and _is_svg_source(self._sources["light"]):
+            self._scaled_light_photo_images[scaled_size] = ImageTk.PhotoImage(
+                _load_resized_icon(self._sources["light"], scaled_size[0]))
+        return super()._get_scaled_light_photo_image(scaled_size)
+
+    def _get_scaled_dark_photo_image(self, scaled_size: Tuple[int, int]):
+        if scaled_size not in self._scaled_dark_photo_images and _is_svg_source(self._sources["dark"]):
+            self._scaled_dark_photo_images[scaled_size] = ImageTk.PhotoImage(
+                _load_resized_icon(self._sources["dark"], scaled_size[0]))
+        return super()._get_scaled_dark_photo_image(scaled_size)
+
+
+def _get_ctk_image(icon: Any, size: int) -> customtkinter.CTkImage:
+    """Return a CTkImage showing icon at size x size, shared by all users of the same icon.
+
+    Args:
+        icon: Path to an image file, an atlas icon, a PIL image, or a (light, dark) pair of those
+        size: Edge length in pixels
+
+    Returns:
+        The CTkImage (a new, unshared one if a source is a PIL image)
+
+    Raises:
+        ValueError: If icon is a tuple that is not a (light, dark) pair
+    """
+    if isinstance(icon, tuple):
+        if len(icon) != 2:
+            raise ValueError("Icon variants must be given as a (light, dark) pair")
+        light_key, dark_key = _icon_source_key(icon[0]), _icon_source_key(icon[1])
+        key = f"{light_key}|{dark_key}" if light_key is not None and dark_key is not None else None
+    else:
+        key = _icon_source_key(icon)
+    cache_key = (key, size) if key is not None else None
+    if cache_key is not None:
+        ctk_image = _CTK_IMAGES.get(cache_key)
+        if ctk_image is not None:
+            return ctk_image
+    if isinstance(icon, tuple):
+        ctk_image = _LazyCTkImage(icon[0], icon[1], size)
+    elif _is_svg_source(icon):
+        ctk_image = _LazyCTkImage(icon, icon, size)
+    else:
+        # One image serves both appearance modes
+        ctk_image = customtkinter.CTkImage(light_image=_load_resized_icon(icon, size), size=(size, size))
+    if cache_key is not None:
+        _CTK_IMAGES[cache_key] = ctk_image
+    return ctk_image
+
+
+def clear_icon_cache() -> None:
+    """Drop every cached icon (decoded images and PNG bytes)."""
+    _ICON_CACHE.clear()
+    _ICON_PNG_BYTES.clear()
+    _CTK_IMAGES.clear()
+
+
+__all__ = ["clear_icon_cache", "_load_resized_icon", "_get_icon_png_bytes", "_seed_icon_png_bytes",
+           "_icon_source_key", "_icon_file_path", "_get_ctk_image"]
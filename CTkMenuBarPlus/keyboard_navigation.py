@@ -0,0 +1,138 @@
+"""
+Keyboard navigation for open CTkMenuBarPlus menus
+
+A single navigator serves a whole menu tree (a top-level dropdown and all of its
+submenus). Keys are bound once per menu frame instead of once per option: the
+navigator reads the active row from the menu's option model and only restyles the
+previously and newly highlighted buttons.
+
+Keys:
+    Up / Down     move to the previous / next enabled option (wraps around)
+    Home / End    move to the first / last enabled option
+    Right         open the highlighted submenu and enter it
+    Left          close the current submenu and return to its parent
+    Return        activate the highlighted option (or open its submenu)
+    Escape        clear type-ahead text, otherwise close the current menu level
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+from ._CDMSubmenuButton import _CDMSubmenuButton
+if TYPE_CHECKING:
+    from .dropdown_menu import CustomDropdownMenu
+
+# Sequences bound on every menu frame
+NAVIGATION_SEQUENCES = ("<Up>", "<Down>", "<Home>", "<End>", "<Left>", "<Right>",
+                        "<Return>", "<KP_Enter>", "<Escape>")
+
+
+class _MenuNavigator:
+    """Arrow/Enter/Escape navigation controller shared by one menu tree."""
+
+    def __init__(self, root_menu: "CustomDropdownMenu"):
+        """Create a navigator for the tree rooted at root_menu.
+
+        Args:
+            root_menu: The top-level dropdown of the tree
+        """
+        self.root_menu = root_menu
+
+    def handle_key(self, menu: "CustomDropdownMenu", keysym: str) -> Optional[str]:
+        """Dispatch a navigation key pressed while menu has focus.
+
+        Args:
+            menu: The focused menu of this tree
+            keysym: Tk keysym of the pressed key
+
+        Returns:
+            "break" when the key was consumed, None otherwise
+        """
+        if getattr(menu, "_is_destroyed", False):
+            return None
+        if keysym in ("Up", "Down"):
+            self._move(menu, -1 if keysym == "Up" else 1)
+        elif keysym in ("Home", "End"):
+            self._move_to_edge(menu, last=keysym == "End")
+        elif keysym == "Right":
+            self._open_submenu(menu)
+        elif keysym == "Left":
+            self._close_submenu(menu)
+        elif keysym in ("Return", "KP_Enter"):
+            self._activate(menu)
+        elif keysym == "Escape":
+            self._escape(menu)
+        else:
+            return None
+        return "break"
+
+    def _select(self, menu: "CustomDropdownMenu", option) -> None:
+        """Highlight option in menu and scroll it into view."""
+        menu._highlight_option(option)
+        menu._scroll_option_into_view(option)
+
+    def _move(self, menu: "CustomDropdownMenu", step: int) -> None:
+        """Move the highlight by step rows, skipping disabled options."""
+        options = menu._visible_options()
+        count = len(options)
+        if not count:
+            return
+        current = menu._highlighted_option
+        row = menu._get_row_position(current) if current is not None else None
+        if row is None:
+            row = -1 if step > 0 else count
+        for _ in range(count):
+            row = (row + step) % count
+            if options[row].cget("enabled"):
+                self._select(menu, options[row])
+                return
+
+    def _move_to_edge(self, menu: "CustomDropdownMenu", last: bool) -> None:
+        """Highlight the first (or last) enabled option."""
+        options = menu._visible_options()
+        for option in (reversed(options) if last else options):
+            if option.cget("enabled"):
+                self._select(menu, option)
+                return
+
+    def _open_submenu(self, menu: "CustomDropdownMenu") -> None:
+        """Open the highlighted submenu and highlight its first enabled option."""
+        option = menu._highlighted_option
+        if not isinstance(option, _CDMSubmenuButton) or not option.cget("enabled"):
+            return
+        submenu = option.submenu
+        menu._collapseSiblingSubmenus(option)
+        submenu._show()
+        self._move_to_edge(submenu, last=False)
+
+    def _close_submenu(self, menu: "CustomDropdownMenu") -> None:
+        """Close menu if it is a submenu and give focus back to its parent."""
+        seed = menu.menu_seed_object
+        if not isinstance(seed, _CDMSubmenuButton):
+            return
+        parent = seed.parent_menu
+        menu._hideChildrenMenus()
+        menu._hide()
+        parent.focus()
+        self._select(parent, seed)
+
+    def _activate(self, menu: "CustomDropdownMenu") -> None:
+        """Run the highlighted option, or enter it if it is a submenu."""
+        option = menu._highlighted_option
+        if option is None:
+            return
+        if isinstance(option, _CDMSubmenuButton):
+            self._open_submenu(menu)
+        else:
+            option._execute_if_enabled()
+
+    def _escape(self, menu: "CustomDropdownMenu") -> None:
+        """Clear type-ahead text first, then close one menu level per press."""
+        if menu._type_ahead_buffer or menu._filtered_options is not None:
+            menu._reset_type_ahead()
+        elif isinstance(menu.menu_seed_object, _CDMSubmenuButton):
+            self._close_submenu(menu)
+        else:
+            menu._hideAllMenus()
+
+
+__all__ = ["_MenuNavigator", "NAVIGATION_SEQUENCES"]
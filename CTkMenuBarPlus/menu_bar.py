@@ -2,14 +2,20 @@
 Customtkinter Menu Bar
 
 A menu bar widget for customtkinter applications with support for
-cascading dropdown menus and theme integration.
+cascading dropdown menus and theme integration. Cascades that do not fit the
+width of the bar are moved into an overflow menu behind a chevron button.
 
 Author: Akash Bora (Akascape) | https://github.com/Akascape
 Modified by: xzyqox (KiTant) | https://github.com/KiTant
 """
 
+import bisect
 import customtkinter
-from typing import Optional, Callable, Union, List
+import tkinter as tk
+from functools import partial
+from typing import Optional, Callable, Union, List, Dict, Any
+from .constants import OVERFLOW_BUTTON_TEXT
+from .diagnostics import _collect_menu_stats, _iter_widgets
 
 
 class CTkMenuBar(customtkinter.CTkFrame):
@@ -27,6 +33,7 @@ class CTkMenuBar(customtkinter.CTkFrame):
         width: int = 10,
         padx: int = 5,
         pady: int = 2,
+        overflow: bool = True,
         **kwargs):
         """
         Initialize menu bar.
@@ -38,6 +45,7 @@ class CTkMenuBar(customtkinter.CTkFrame):
             width: Menu button width in pixels
             padx: Horizontal spacing between buttons
             pady: Vertical padding
+            overflow: Move cascades that do not fit the bar into a chevron menu
             **kwargs: Additional CTkFrame arguments
         """
 
@@ -59,6 +67,26 @@ class CTkMenuBar(customtkinter.CTkFrame):
         self.bg_color = bg_color
         self._is_visible = True  # Track visibility state
 
+        # Overflow handling: cascade buttons in order, the running total of their widths
+        # (incl. padding) measured once per button, how many of them are gridded and the
+        # (gridded, total) counts the overflow menu was built for
+        self._cascades: List[customtkinter.CTkButton] = []
+        self._postcommands: Dict[customtkinter.CTkButton, Callable] = {}
+        self._width_prefix: List[int] = []
+        self._visible_count = 0
+        self._overflow_layout = (0, 0)
+        self._overflow_button = None
+        self._overflow_menu = None
+        self._overflow_update_id = None
+        self._destroying = False
+        if overflow:
+            self._overflow_button = customtkinter.CTkButton(
+                self, text=OVERFLOW_BUTTON_TEXT, fg_color="transparent",
+                text_color=customtkinter.ThemeManager.theme["CTkLabel"]["text_color"],
+                width=self.height, height=self.height)
+            # Bound on the frame itself: customtkinter would bind on its canvas
+            tk.Misc.bind(self, "<Configure>", self._on_configure, "+")
+
         super().pack(anchor="n", fill="x")
 
     def add_cascade(self, text: Optional[str] = None, postcommand: Optional[Callable] = None, **kwargs) -> customtkinter.CTkButton:
@@ -104,10 +132,30 @@ class CTkMenuBar(customtkinter.CTkFrame):
         
         if postcommand and callable(postcommand):
             self.menu_button.bind("<Button-1>", lambda event: postcommand(), add="+")
+            self._postcommands[self.menu_button] = postcommand
             
         self.num += 1
+        self._cascades.append(self.menu_button)
+        if self._visible_count < len(self._cascades) - 1:
+            self.menu_button.grid_remove()  # Earlier cascades already overflow
+        else:
+            self._visible_count += 1
+        # Bound on the button itself: customtkinter would bind on its canvas
+        tk.Misc.bind(self.menu_button, "<Destroy>", partial(self._forget_cascade, self.menu_button), "+")
+        self._schedule_overflow_update()
 
         return self.menu_button
+
+    def _forget_cascade(self, button: customtkinter.CTkButton, event: tk.Event) -> None:
+        """Drop a destroyed cascade button from the overflow bookkeeping."""
+        if event.widget is not button or self._destroying or button not in self._cascades:
+            return
+        index = self._cascades.index(button)
+        del self._cascades[index]
+        self._postcommands.pop(button, None)
+        if index < self._visible_count:
+            self._visible_count -= 1
+        self._invalidate_cascade_widths(index)
     
     def configure(self, **kwargs):
         """Configure menu bar properties.
@@ -127,28 +175,119 @@ class CTkMenuBar(customtkinter.CTkFrame):
         if "width" in kwargs:
             self.width = kwargs.pop("width")
             # Update existing buttons if any
-            for child in self.winfo_children():
-                if isinstance(child, customtkinter.CTkButton):
-                    child.configure(width=self.width)
+            for child in self._cascades:
+                child.configure(width=self.width)
+            self._invalidate_cascade_widths()
                     
         if "padx" in kwargs:
             self.padx = kwargs.pop("padx")
-            # Re-grid existing buttons with new padding
-            for i, child in enumerate(self.winfo_children()):
-                if isinstance(child, customtkinter.CTkButton):
-                    child.grid(row=0, column=i, padx=(self.padx, 0), pady=self.pady)
+            self._regrid_cascades()
+            self._invalidate_cascade_widths()
                     
         if "pady" in kwargs:
             self.pady = kwargs.pop("pady")
-            # Re-grid existing buttons with new padding
-            for i, child in enumerate(self.winfo_children()):
-                if isinstance(child, customtkinter.CTkButton):
-                    child.grid(row=0, column=i, padx=(self.padx, 0), pady=self.pady)
+            self._regrid_cascades()
         
         # Pass remaining arguments to parent class
         if kwargs:
             super().configure(**kwargs)
             
+    def _regrid_cascades(self) -> None:
+        """Grid the cascades again with the current padding (overflowed ones stay hidden)."""
+        for i, child in enumerate(self._cascades):
+            child.grid(row=0, column=i, padx=(self.padx, 0), pady=self.pady)
+            if i >= self._visible_count:
+                child.grid_remove()
+
+    def _invalidate_cascade_widths(self, index: int = 0) -> None:
+        """Forget the measured widths from cascade index on; they are measured again on the next layout."""
+        del self._width_prefix[index:]
+        self._schedule_overflow_update()
+
+    def _schedule_overflow_update(self) -> None:
+        """Update the overflow once pending geometry changes have been processed."""
+        if self._overflow_button is not None and self._overflow_update_id is None:
+            self._overflow_update_id = self.after_idle(self._update_overflow)
+
+    def _on_configure(self, event: tk.Event) -> None:
+        """Recompute which cascades fit when the width of the bar changes."""
+        if event.widget is self:
+            if self._overflow_update_id is not None:
+                # This update supersedes the queued one
+                self.after_cancel(self._overflow_update_id)
+            self._update_overflow(event.width)
+
+    def _measure_cascades(self) -> None:
+        """Extend the width prefix sums with the cascades not measured yet."""
+        pad = round(self._apply_widget_scaling(self.padx))
+        total = self._width_prefix[-1] if self._width_prefix else 0
+        for button in self._cascades[len(self._width_prefix):]:
+            total += button.winfo_reqwidth() + pad
+            self._width_prefix.append(total)
+
+    def _fitting_cascades(self, available: int) -> int:
+        """Return how many cascades fit into available pixels, leaving room for the overflow button."""
+        count = bisect.bisect_right(self._width_prefix, available)
+        if count < len(self._cascades):
+            chevron = self._overflow_button.winfo_reqwidth() + round(self._apply_widget_scaling(self.padx))
+            count = bisect.bisect_right(self._width_prefix, available - chevron)
+        return count
+
+    def _update_overflow(self, width: Optional[int] = None) -> None:
+        """Show the cascades that fit the bar and move the others into the overflow menu.
+
+        Button widths are measured once and kept as prefix sums, so a resize only costs
+        a binary search plus gridding the buttons whose visibility changed.
+
+        Args:
+            width: Current width of the bar in pixels (queried if None)
+        """
+        self._overflow_update_id = None
+        if self._destroying:
+            return
+        if width is None:
+            width = self.winfo_width()
+        if width <= 1:
+            return  # Not laid out yet; the first <Configure> triggers the update
+        self._measure_cascades()
+        count = self._fitting_cascades(width)
+        if (count, len(self._cascades)) == self._overflow_layout:
+            return
+        for button in self._cascades[count:self._visible_count]:
+            button.grid_remove()
+        for button in self._cascades[self._visible_count:count]:
+            button.grid()
+        self._visible_count = count
+        self._overflow_layout = (count, len(self._cascades))
+
+        if count < len(self._cascades):
+            self._rebuild_overflow_menu()
+            self._overflow_button.place(relx=1.0, rely=0.5, anchor="e")
+        else:
+            self._overflow_button.place_forget()
+
+    def _rebuild_overflow_menu(self) -> None:
+        """List the cascades that do not fit in the overflow menu."""
+        if self._overflow_menu is None:
+            from .dropdown_menu import CustomDropdownMenu
+            self._overflow_menu = CustomDropdownMenu(widget=self._overflow_button)
+        self._overflow_menu.clean()
+        for button in self._cascades[self._visible_count:]:
+            self._overflow_menu.add_option(str(button.cget("text")), command=partial(self._invoke_cascade, button))
+
+    def _invoke_cascade(self, button: customtkinter.CTkButton) -> None:
+        """Open the cascade of a button that is listed in the overflow menu."""
+        postcommand = self._postcommands.get(button)
+        if postcommand is not None:
+            postcommand()
+        button.invoke()
+
+    def _overflow_anchor(self, button: customtkinter.CTkButton) -> customtkinter.CTkButton:
+        """Return the widget a cascade's dropdown opens below (the overflow button if it does not fit)."""
+        if button in self._cascades[self._visible_count:]:
+            return self._overflow_button
+        return button
+
     def cget(self, param: str):
         """Get configuration parameter value.
         
@@ -171,63 +310,63 @@ class CTkMenuBar(customtkinter.CTkFrame):
         else:
             return super().cget(param)
 
+    def restyle(self, **theme):
+        """Change the colors of every dropdown menu of the bar (and their submenus) in one pass.
+
+        Hidden menus apply the new colors the next time they are shown.
+
+        Args:
+            **theme: Any of fg_color, hover_color, text_color, bg_color, border_color
+                and separator_color (see CustomDropdownMenu.restyle)
+
+        Raises:
+            ValueError: If an unknown theme key is given
+        """
+        for menu in self.menu:
+            menu.restyle(**theme)
+
+    def stats(self) -> Dict[str, Any]:
+        """Report what the menu bar and all of its dropdown menus cost.
+
+        Returns:
+            The totals of CustomDropdownMenu.stats() over every dropdown, plus
+            bar_widgets (Tk widgets of the bar itself) and menus_by_name (the stats
+            of each dropdown keyed by its cascade button text)
+        """
+        report = _collect_menu_stats(self.menu)
+        report["bar_widgets"] = sum(1 for _widget in _iter_widgets(self))
+        by_name = {}
+        for menu in self.menu:
+            try:
+                name = menu.menu_seed_object.cget("text")
+            except Exception:
+                name = str(menu)
+            by_name[name] = menu.stats()
+        report["menus_by_name"] = by_name
+        return report
+
     def show(self):
         """Show the menu bar at the top of parent widget.
         
-        Temporarily removes other widgets to place menu bar first,
-        then restores them with their original layout managers.
+        The bar is packed before the first widget packed in the parent, so the other
+        widgets keep their layout and nothing has to be unmapped or restored.
         """
         if not self._is_visible:
-            # Store information about other widgets using different geometry managers
-            pack_widgets = []
-            grid_widgets = []
-            place_widgets = []
-            
-            for child in self.master.winfo_children():
-                if child != self:
-                    manager = child.winfo_manager()
-                    if manager == 'pack':
-                        pack_info = child.pack_info()
-                        pack_widgets.append((child, pack_info))
-                        child.pack_forget()
-                    elif manager == 'grid':
-                        grid_info = child.grid_info()
-                        grid_widgets.append((child, grid_info))
-                        child.grid_forget()
-                    elif manager == 'place':
-                        place_info = child.place_info()
-                        place_widgets.append((child, place_info))
-                        child.place_forget()
-            
-            # Pack the menu bar first (at the top)
-            super().pack(side="top", anchor="n", fill="x")
-            
-            # Restore other widgets with their original geometry managers
-            for widget, pack_info in pack_widgets:
-                widget.pack(**pack_info)
-            
-            for widget, grid_info in grid_widgets:
-                widget.grid(**grid_info)
-            
-            for widget, place_info in place_widgets:
-                # Filter out problematic parameters for customtkinter place()
-                filtered_place_info = {}
-                for k, v in place_info.items():
-                    if k not in ['width', 'height']:
-                        # Convert string coordinates to numbers if needed
-                        if k in ['x', 'y', 'relx', 'rely', 'relwidth', 'relheight']:
-                            try:
-                                if isinstance(v, str):
-                                    v = float(v) if '.' in v else int(v)
-                            except (ValueError, TypeError):
-                                continue  # Skip invalid values
-                        filtered_place_info[k] = v
-                
-                if filtered_place_info:  # Only place if we have valid parameters
-                    widget.place(**filtered_place_info)
-            
+            slaves = self.master.pack_slaves()
+            if slaves:
+                super().pack(side="top", anchor="n", fill="x", before=slaves[0])
+            else:
+                super().pack(side="top", anchor="n", fill="x")
             self._is_visible = True
 
+    def destroy(self):
+        """Cancel a pending overflow update and destroy the menu bar."""
+        self._destroying = True
+        if self._overflow_update_id is not None:
+            self.after_cancel(self._overflow_update_id)
+            self._overflow_update_id = None
+        super().destroy()
+
     def hide(self):
         """Hide the menu bar."""
         if self._is_visible:
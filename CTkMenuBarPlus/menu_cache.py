@@ -0,0 +1,213 @@
+"""
+Menu snapshots for CTkMenuBarPlus
+
+Builds a menu tree from a declarative spec and keeps a snapshot of everything that
+is expensive to resolve: resized icons (as PNG bytes), measured option widths and
+parsed accelerators. The snapshot file is keyed by a hash of the spec (including the
+icon files' size and modification time, the menu scale and the platform), so it
+stays valid across runs until the spec or its icons change. On a hit the tree is
+built without opening or resampling icon files, parsing accelerators or measuring
+text; on a miss it is built normally and the snapshot is rewritten.
+
+Usage:
+    from CTkMenuBarPlus import build_menu_from_spec
+
+    spec = [
+        {"option": "Open", "command": "open", "accelerator": "Ctrl+O", "icon": "icons/open.png"},
+        {"separator": True},
+        {"submenu": "Recent Files", "items": [{"option": "notes.md", "command": open_notes}]},
+    ]
+    build_menu_from_spec(file_menu, spec, commands={"open": open_file}, cache_path="menu.cache")
+
+Spec items:
+    - {"option": text, ...}: keyword arguments of add_option(); "command" may be a callable
+      or a name looked up in commands
+    - {"submenu": name, "items": [...], ...}: keyword arguments of add_submenu()
+    - {"separator": True}: add_separator()
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Tuple
+import base64
+import hashlib
+import json
+import os
+import sys
+import warnings
+import zlib
+from .accelerators import _parse_accelerator, _seed_parsed_accelerators
+from .icon_cache import _icon_file_path, _get_icon_png_bytes, _seed_icon_png_bytes
+from .dropdown_menu import CustomDropdownMenu, _TEXT_WIDTH_CACHE
+from ._CDMSubmenuButton import _CDMSubmenuButton
+
+# Bump when the snapshot layout changes; older files are then ignored
+_SNAPSHOT_FORMAT = 1
+
+
+def _spec_fingerprint(value: Any) -> Any:
+    """Return a JSON-serializable stand-in of a spec value for hashing."""
+    if isinstance(value, dict):
+        return {str(k): _spec_fingerprint(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_spec_fingerprint(v) for v in value]
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return repr(value)
+
+
+def _icon_fingerprints(spec: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+    """Return size and modification time of every icon file used by spec."""
+    found = {}
+    for item in spec:
+        path = _icon_file_path(item.get("icon"))
+        if path is not None:
+            try:
+                stat = os.stat(path)
+                found[path] = [stat.st_size, stat.st_mtime_ns]
+            except OSError:
+                found[path] = []
+        found.update(_icon_fingerprints(item.get("items", [])))
+    return found
+
+
+def _spec_hash(menu: CustomDropdownMenu, spec: List[Dict[str, Any]]) -> str:
+    """Hash everything that determines the resolved menu model."""
+    payload = {
+        "format": _SNAPSHOT_FORMAT,
+        "platform": sys.platform,
+        "scale": menu.cget("scale"),
+        "icon_size": menu.icon_size,
+        "spec": _spec_fingerprint(spec),
+        "icons": _icon_fingerprints(spec),
+    }
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def _load_snapshot(cache_path: str, key: str) -> Dict[str, Any] | None:
+    """Read the snapshot at cache_path if it exists and matches key."""
+    try:
+        with open(cache_path, "rb") as file:
+            snapshot = json.loads(zlib.decompress(file.read()).decode("utf-8"))
+    except (OSError, ValueError, zlib.error):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("key") != key:
+        return None
+    return snapshot
+
+
+def _apply_snapshot(snapshot: Dict[str, Any]) -> None:
+    """Seed the accelerator, icon and text width caches from a snapshot."""
+    _seed_parsed_accelerators(snapshot.get("accelerators", {}))
+    _seed_icon_png_bytes((path, size, base64.b64decode(png)) for path, size, png in snapshot.get("icons", []))
+    for font_key, text, width in snapshot.get("widths", []):
+        _TEXT_WIDTH_CACHE[(font_key, text)] = width
+
+
+def _build_items(menu: CustomDropdownMenu, items: List[Dict[str, Any]], commands: Dict[str, Callable]) -> None:
+    """Add the spec items to menu, recursing into submenus."""
+    for item in items:
+        item = dict(item)
+        if item.pop("separator", False):
+            menu.add_separator()
+        elif "submenu" in item:
+            children = item.pop("items", [])
+            submenu = menu.add_submenu(item.pop("submenu"), **item)
+            _build_items(submenu, children, commands)
+        elif "option" in item:
+            command = item.get("command")
+            if isinstance(command, str):
+                if command not in commands:
+                    raise ValueError(f"Unknown command '{command}' for menu option '{item['option']}'")
+                item["command"] = commands[command]
+            menu.add_option(**item)
+        else:
+            raise ValueError(f"Menu spec item needs 'option', 'submenu' or 'separator': {item}")
+
+
+def _iter_menus(menu: CustomDropdownMenu):
+    """Yield menu and all of its submenus."""
+    yield menu
+    for option in menu._options_list:
+        if isinstance(option, _CDMSubmenuButton):
+            yield from _iter_menus(option.submenu)
+
+
+def _collect_snapshot(menu: CustomDropdownMenu, key: str) -> Dict[str, Any]:
+    """Gather the resolved model of a freshly built menu tree."""
+    accelerators: Dict[str, Any] = {}
+    icons: Dict[Tuple[str, int], str] = {}
+    widths: Dict[Tuple[str, str], int] = {}
+    for current in _iter_menus(menu):
+        widths.update(current._measure_option_widths())
+        for option in current._options_list:
+            accelerator = option.cget("accelerator")
+            if accelerator and accelerator not in accelerators:
+                strokes = _parse_accelerator(accelerator, warn=False)
+                if strokes is not None:
+                    accelerators[accelerator] = strokes
+            path = _icon_file_path(option.cget("icon"))
+            size = option.cget("scaled_icon_size")
+            if path is not None and (path, size) not in icons:
+                png = _get_icon_png_bytes(path, size)
+                icons[(path, size)] = base64.b64encode(png).decode("ascii")
+    return {
+        "key": key,
+        "accelerators": accelerators,
+        "icons": [[path, size, png] for (path, size), png in icons.items()],
+        "widths": [[font_key, text, width] for (font_key, text), width in widths.items()],
+    }
+
+
+def _write_snapshot(cache_path: str, snapshot: Dict[str, Any]) -> None:
+    """Write the snapshot atomically so a crash never leaves a truncated cache."""
+    data = zlib.compress(json.dumps(snapshot, separators=(",", ":")).encode("utf-8"), 6)
+    temp_path = f"{cache_path}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        warnings.warn(f"Could not write menu snapshot '{cache_path}': {e}")
+
+
+def build_menu_from_spec(menu: CustomDropdownMenu, spec: List[Dict[str, Any]],
+                         commands: Dict[str, Callable] | None = None,
+                         cache_path: str | os.PathLike | None = None) -> bool:
+    """Populate menu from a declarative spec, reusing a snapshot of resolved data when valid.
+
+    Args:
+        menu: The (empty) dropdown menu to fill
+        spec: List of item dicts (see module docstring)
+        commands: Named commands referenced by string "command" values
+        cache_path: Snapshot file; None builds without a snapshot
+
+    Returns:
+        True if the menu was built from a valid snapshot, False if it was resolved from scratch
+
+    Raises:
+        ValueError: If an item is malformed or references an unknown command
+    """
+    commands = commands or {}
+    if cache_path is None:
+        _build_items(menu, spec, commands)
+        return False
+
+    cache_path = os.fspath(cache_path)
+    key = _spec_hash(menu, spec)
+    snapshot = _load_snapshot(cache_path, key)
+    if snapshot is not None:
+        try:
+            _apply_snapshot(snapshot)
+        except Exception:
+            # Damaged entries: resolve from scratch and rewrite the snapshot
+            snapshot = None
+    _build_items(menu, spec, commands)
+    if snapshot is None:
+        _write_snapshot(cache_path, _collect_snapshot(menu, key))
+    return snapshot is not None
+
+
+__all__ = ["build_menu_from_spec"]
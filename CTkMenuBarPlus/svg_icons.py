@@ -0,0 +1,105 @@
+"""
+SVG icon rendering for CTkMenuBarPlus
+
+Icons given as .svg files are rasterized at exactly the pixel size they are shown at
+(icon_size * scale, and the widget scaling of the display), so scaled or high-DPI
+menus stay crisp instead of resampling a small bitmap. Rasters are cached by
+(SVG content hash, pixel size): every size is rendered once, and identical files share
+their rasters.
+
+Rendering uses the optional cairosvg package (pip install CTkMenuBarPlus[svg]).
+Applications can plug in any other backend with set_svg_renderer().
+
+Usage:
+    dropdown.add_option("Save", command=save, icon="icons/save.svg")
+
+    from CTkMenuBarPlus import set_svg_renderer
+    set_svg_renderer(lambda data, size: my_rasterizer(data, size))  # bytes, px -> PIL.Image
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+import hashlib
+import io
+import os
+import PIL.Image
+from .constants import ICON_CACHE_SIZE
+from .custom_exception_classes import MenuIconError
+
+try:
+    import cairosvg
+except ImportError:  # Optional dependency
+    cairosvg = None
+
+SvgRenderer = Callable[[bytes, int], PIL.Image.Image]
+
+_svg_renderer: SvgRenderer | None = None
+# (sha256 of the SVG, size px) -> rendered image, least recently used first
+_SVG_RASTERS: "OrderedDict[Tuple[str, int], PIL.Image.Image]" = OrderedDict()
+
+
+def set_svg_renderer(renderer: SvgRenderer | None) -> None:
+    """Use renderer to rasterize SVG icons instead of cairosvg.
+
+    Args:
+        renderer: Callable receiving the SVG bytes and the pixel size and returning a
+            PIL image of that size, or None to go back to cairosvg
+    """
+    global _svg_renderer
+    _svg_renderer = renderer
+    _SVG_RASTERS.clear()
+
+
+def _render_with_cairosvg(data: bytes, size: int) -> PIL.Image.Image:
+    png = cairosvg.svg2png(bytestring=data, output_width=size, output_height=size)
+    return PIL.Image.open(io.BytesIO(png))
+
+
+def _is_svg_source(icon: Any) -> bool:
+    """Return True if icon is a path to an SVG file."""
+    return isinstance(icon, (str, os.PathLike)) and os.fspath(icon).lower().endswith(".svg")
+
+
+def _render_svg(data: bytes, size: int) -> PIL.Image.Image:
+    """Rasterize SVG data to a size x size RGBA image, reusing earlier renders.
+
+    Raises:
+        MenuIconError: If no SVG backend is available or rendering fails
+    """
+    key = (hashlib.sha256(data).hexdigest(), size)
+    image = _SVG_RASTERS.get(key)
+    if image is not None:
+        _SVG_RASTERS.move_to_end(key)
+        return image
+
+    renderer = _svg_renderer
+    if renderer is None:
+        if cairosvg is None:
+            raise MenuIconError("SVG icons need the optional 'cairosvg' package "
+                                "(pip install CTkMenuBarPlus[svg]) or a renderer set with set_svg_renderer()")
+        renderer = _render_with_cairosvg
+    try:
+        image = renderer(data, size).convert("RGBA")
+    except Exception as e:
+        raise MenuIconError(f"Error rendering SVG icon: {e}") from e
+    if image.size != (size, size):
+        image = image.resize((size, size), PIL.Image.Resampling.LANCZOS)
+
+    _SVG_RASTERS[key] = image
+    if len(_SVG_RASTERS) > ICON_CACHE_SIZE:
+        _SVG_RASTERS.popitem(last=False)
+    return image
+
+
+def _render_svg_file(path: str, size: int) -> PIL.Image.Image:
+    """Rasterize the SVG file at path to size x size pixels."""
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except OSError as e:
+        raise MenuIconError(f"Error loading icon: {e}") from e
+    return _render_svg(data, size)
+
+
+__all__ = ["set_svg_renderer", "_is_svg_source", "_render_svg", "_render_svg_file"]
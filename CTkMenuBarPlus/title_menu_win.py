@@ -4,26 +4,75 @@ Menu Bar in Title Bar of customtkinter window
 A Windows-only title menu system that integrates with the window title bar.
 Provides native-looking menu buttons with dropdown support.
 
+The overlay follows the window through the window's own <Configure> events, moved at
+most once per frame and only when its geometry actually changes. The geometry math
+(_overlay_geometry) is free of Tk calls, so it can be exercised on any platform.
+
+Without an explicit x_offset the menu starts after the window title, measured with
+the system caption font (character widths are cached). Tk reports no event for a new
+title, so the title is compared every TITLE_MENU_TITLE_POLL_INTERVAL (one Tcl call) and
+a change schedules the same coalesced overlay update as a window event.
+
 Author: Akash Bora (Akascape) | https://github.com/Akascape
 Modified by: xzyqox (KiTant) | https://github.com/KiTant
 """
 
 import customtkinter
 import tkinter as tk
+import tkinter.font
 import sys
-from typing import Optional, Union
+from typing import Callable, Dict, Optional, Tuple, Union
+from .widget_pool import _unbind_callback
+from .constants import (TITLE_MENU_UPDATE_INTERVAL, TITLE_MENU_BASE_X_OFFSET, TITLE_MENU_TITLE_GAP,
+                        TITLE_MENU_TITLE_POLL_INTERVAL)
 
 # Platform constants
 SUPPORTED_PLATFORMS = ["win32", "win"]
 DEFAULT_LIGHT_COLOR = 0xFFFFFF
 DEFAULT_DARK_COLOR = 0x303030
 
+# (caption font description, character) -> width in pixels, shared by all title menus
+_CHAR_WIDTHS: Dict[Tuple[str, str], int] = {}
+
 
 class PlatformError(Exception):
     """Exception raised when the platform is not supported."""
     pass
 
 
+def _overlay_geometry(master_width: int, master_height: int, master_x: int, master_y: int,
+                      state: str, x_offset: int, y_offset: int) -> Optional[str]:
+    """Return the overlay geometry string for the window's size, position and state.
+
+    Returns:
+        "WxH+X+Y", or None if the overlay has to be hidden (window iconified or too narrow)
+    """
+    width = master_width - 130 - x_offset
+    if width < 0 or state == "iconic":
+        return None
+    x = master_x + x_offset
+    y = master_y + y_offset
+    if state == "zoomed":
+        y += 4
+        x -= 7
+    return f"{width}x{master_height}+{x}+{y}"
+
+
+def _title_x_offset(title: str, char_width: Callable[[str], int]) -> int:
+    """Return the x offset of the first menu button for a window title.
+
+    Args:
+        title: Window title
+        char_width: Width in pixels of one character in the title font
+
+    Returns:
+        Offset from the left edge of the window in pixels
+    """
+    if not title:
+        return TITLE_MENU_BASE_X_OFFSET
+    return TITLE_MENU_BASE_X_OFFSET + sum(char_width(char) for char in title) + TITLE_MENU_TITLE_GAP
+
+
 class CTkTitleMenu(customtkinter.CTkToplevel):
     """Title menu widget that integrates with Windows title bar.
     
@@ -83,27 +132,37 @@ class CTkTitleMenu(customtkinter.CTkToplevel):
         self.config(background=self.transparent_color)
         self.caption_color = title_bar_color
         self.change_header_color(self.caption_color)
-        self.x_offset = 40 if x_offset is None else x_offset
         self.y_offset = 6 if y_offset is None else y_offset
         self.width = width
+        self._title = None
         if x_offset is None:
-            title = self.master.title()
-            if len(title)>=1:
-                for i in title:
-                    if i.islower():
-                        self.x_offset += 9
-                    else:
-                        self.x_offset += 7
+            self._title_font = tkinter.font.Font(root=self.master, name="TkCaptionFont", exists=True)
+            self._title_font_key = str(self._title_font.actual())
+            self.x_offset = _title_x_offset(self.master.title(), self._char_width)
+            self._title = self.master.title()
+        else:
+            self.x_offset = x_offset
             
         self.padding = padx
   
-        self.master.bind("<Configure>", lambda _: self.change_dimension())
-        self.master.bind("<Destroy>", lambda _: super().destroy() if not self.master.winfo_viewable() else None)
+        # Overlay geometry last applied (None: withdrawn) and the pending coalesced update
+        self._last_geometry = None
+        self._dimension_update_id = None
+        # Window bindings as (sequence, funcid), removed again by destroy()
+        self._master_bindings = [
+            ("<Configure>", self.master.bind("<Configure>", self._on_master_configure, add="+")),
+            ("<Destroy>", self.master.bind("<Destroy>", lambda _: self.destroy() if not self.master.winfo_viewable() else None, add="+")),
+        ]
         self.num = 0
         self._is_visible = True  # Track visibility state
         
         self.master.bind("<Map>", lambda e: self.withdraw)
 
+        # Follow title changes of the window (only for the automatic x offset)
+        self._title_poll_id = None
+        if self._title is not None:
+            self._title_poll_id = self.after(TITLE_MENU_TITLE_POLL_INTERVAL, self._poll_title)
+
     def _set_appearance_mode(self, mode_string):
         if customtkinter.get_appearance_mode()=="Light":
             self.caption_color = DEFAULT_LIGHT_COLOR # RGB order: 0xrrggbb             
@@ -146,32 +205,86 @@ class CTkTitleMenu(customtkinter.CTkToplevel):
             
         return self.menu_button
     
+    def _char_width(self, char: str) -> int:
+        """Return the width of char in the caption font, measured once per character."""
+        key = (self._title_font_key, char)
+        width = _CHAR_WIDTHS.get(key)
+        if width is None:
+            width = _CHAR_WIDTHS[key] = self._title_font.measure(char)
+        return width
+
+    def _update_title_offset(self, title: str) -> None:
+        """Recompute the automatic x offset if the window title changed."""
+        if title == self._title:
+            return
+        self._title = title
+        self.x_offset = _title_x_offset(title, self._char_width)
+
+    def _poll_title(self) -> None:
+        """Schedule an overlay update if the window title changed, then check again later."""
+        try:
+            title = self.master.title()
+        except tk.TclError:
+            self._title_poll_id = None
+            return  # Window destroyed
+        if title != self._title:
+            self._schedule_dimension_update()
+        self._title_poll_id = self.after(TITLE_MENU_TITLE_POLL_INTERVAL, self._poll_title)
+
+    def _on_master_configure(self, event: tk.Event) -> None:
+        """Schedule an overlay update for the window's own <Configure> events.
+
+        <Configure> of every child widget also reaches the window's bindings; those are
+        ignored, and a burst of window events (dragging, resizing) results in one update
+        per TITLE_MENU_UPDATE_INTERVAL.
+        """
+        if event.widget is self.master:
+            self._schedule_dimension_update()
+
+    def _schedule_dimension_update(self) -> None:
+        """Run change_dimension() after TITLE_MENU_UPDATE_INTERVAL unless it is already pending."""
+        if self._dimension_update_id is None:
+            self._dimension_update_id = self.after(TITLE_MENU_UPDATE_INTERVAL, self.change_dimension)
+
     def change_dimension(self):
-        """Update menu position and size to match parent window."""
+        """Update menu position and size to match parent window (and its current title)."""
+        self._dimension_update_id = None
         if not self._is_visible:
             return  # Don't show if manually hidden
-            
-        width = self.master.winfo_width()-130-self.x_offset
-        if width<0:
-            self.withdraw()
+
+        try:
+            if self._title is not None:
+                self._update_title_offset(self.master.title())
+            geometry = _overlay_geometry(self.master.winfo_width(), self.master.winfo_height(),
+                                         self.master.winfo_x(), self.master.winfo_y(),
+                                         self.master.state(), self.x_offset, self.y_offset)
+        except tk.TclError:
+            return  # Window destroyed while the update was pending
+        if geometry == self._last_geometry:
             return
-        if self.master.state()=="iconic":
+        self._last_geometry = geometry
+        if geometry is None:
             self.withdraw()
-            return
-        height = self.master.winfo_height()
-        x = self.master.winfo_x()+self.x_offset
-        y = self.master.winfo_y()+self.y_offset
-        if self.master.state()=="zoomed":
-            y += 4
-            x -= 7
-        self.geometry(f"{width}x{height}+{x}+{y}")
-        self.deiconify()
+        else:
+            self.geometry(geometry)
+            self.deiconify()
+
+    def destroy(self):
+        """Cancel pending updates, remove the window bindings and destroy the title menu."""
+        for name in ("_dimension_update_id", "_title_poll_id"):
+            if getattr(self, name, None) is not None:
+                self.after_cancel(getattr(self, name))
+                setattr(self, name, None)
+        for sequence, funcid in getattr(self, "_master_bindings", ()):
+            _unbind_callback(self.master, sequence, funcid)
+        self._master_bindings = []
+        super().destroy()
 
     def destroy_window(self):
         """
         Destroy the title menu window.
         """
-        super().destroy()
+        self.destroy()
  
     def change_header_color(self, caption_color):
         """Change Windows title bar color (Windows 11 only)."""
@@ -219,12 +332,14 @@ class CTkTitleMenu(customtkinter.CTkToplevel):
         if not self._is_visible:
             self.deiconify()
             self._is_visible = True
+            self.change_dimension()  # The window may have moved while the menu was hidden
 
     def hide(self):
         """Hide the title menu."""
         if self._is_visible:
             self.withdraw()
             self._is_visible = False
+            self._last_geometry = None
 
     def toggle(self):
         """Toggle the visibility of the title menu."""
@@ -0,0 +1,142 @@
+"""
+Option button pool for CTkMenuBarPlus
+
+Creating a CTkButton allocates a canvas, labels and draw-engine state. Buttons of
+removed options (remove_option(), clean()) are therefore released into a pool instead
+of being destroyed, and later options reuse them after a reset. Tk cannot move a
+widget to another parent, so there is one pool per options container (a menu or its
+scrollable frame), holding released buttons per button class; styling is re-applied
+whenever a button is reused. When options move in or out of the scrollable frame the
+buttons are destroyed and the pool of the container left behind is cleared.
+
+Usage:
+    from .widget_pool import _get_button_pool
+    pool = _get_button_pool(container)
+    button = pool.acquire(_CDMOptionButton)  # None if nothing was released
+    pool.release(button)  # unpacked and kept for reuse (destroyed once the pool is full)
+
+    from .widget_pool import _unbind_callback
+    funcid = widget.bind("<Enter>", on_enter, add="+")
+    _unbind_callback(widget, "<Enter>", funcid)  # removes only that callback
+
+    bindings = _bind_callback(ctk_frame, "<Button-3>", on_click)  # also for customtkinter widgets
+    for tk_widget, sequence, funcid in bindings:
+        _unbind_callback(tk_widget, sequence, funcid)
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+from .constants import BUTTON_POOL_SIZE
+
+
+def _unbind_callback(widget: Any, sequence: str, funcid: str) -> None:
+    """Remove one callback bound with add="+" and free its Tcl command.
+
+    tkinter's unbind(sequence, funcid) clears every binding of sequence before Python
+    3.13; this keeps the other callbacks (including customtkinter's internal ones).
+
+    Args:
+        widget: Widget the callback was bound on
+        sequence: Event sequence it was bound to
+        funcid: Identifier returned by bind()
+    """
+    try:
+        script = widget.tk.call("bind", widget._w, sequence)
+        prefix = f'if {{"[{funcid} '
+        keep = "\n".join(line for line in script.split("\n") if not line.startswith(prefix))
+        widget.tk.call("bind", widget._w, sequence, keep if keep.strip() else "")
+    except Exception:
+        pass  # Widget already destroyed; its bindings went with it
+    try:
+        widget.deletecommand(funcid)
+    except Exception:
+        pass
+
+
+def _bind_callback(widget: Any, sequence: str, func: Any) -> List[Tuple[Any, str, str]]:
+    """Bind func to sequence with add="+" and return what _unbind_callback() needs to undo it.
+
+    customtkinter widgets bind on their internal canvas and labels and do not return a
+    funcid, so the Tcl commands the bind created on the widget and its direct children
+    are looked up instead.
+
+    Args:
+        widget: Tk or customtkinter widget
+        sequence: Event sequence
+        func: Callback
+
+    Returns:
+        (Tk widget, sequence, funcid) for every binding that was created
+    """
+    targets = [widget] + list(getattr(widget, "children", {}).values())
+    before = [set(getattr(target, "_tclCommands", None) or ()) for target in targets]
+    widget.bind(sequence, func, add="+")
+    return [(target, sequence, name)
+            for target, known in zip(targets, before)
+            for name in (getattr(target, "_tclCommands", None) or ()) if name not in known]
+
+
+class _ButtonPool:
+    """Released option buttons of one container, ready to be reset and packed again."""
+
+    def __init__(self, max_size: int = BUTTON_POOL_SIZE):
+        """Create an empty pool.
+
+        Args:
+            max_size: Released buttons kept per button class; further ones are destroyed
+        """
+        self._max_size = max_size
+        self._free: Dict[type, List[Any]] = {}
+
+    def acquire(self, button_class: type) -> Any | None:
+        """Return a released button of exactly button_class, or None if there is none."""
+        free = self._free.get(button_class)
+        while free:
+            button = free.pop()
+            try:
+                if button.winfo_exists():
+                    return button
+            except Exception:
+                pass
+        return None
+
+    def release(self, button: Any) -> None:
+        """Unpack button, detach it from its option and keep it for reuse."""
+        free = self._free.setdefault(type(button), [])
+        try:
+            if len(free) >= self._max_size or not button.winfo_exists():
+                button.destroy()
+                return
+            button._release()
+        except Exception:
+            try:
+                button.destroy()
+            except Exception:
+                pass
+            return
+        free.append(button)
+
+    def clear(self) -> None:
+        """Destroy every pooled button."""
+        for free in self._free.values():
+            for button in free:
+                try:
+                    button.destroy()
+                except Exception:
+                    pass
+        self._free.clear()
+
+    def __len__(self) -> int:
+        return sum(len(free) for free in self._free.values())
+
+
+def _get_button_pool(container: Any) -> _ButtonPool:
+    """Return the button pool of container, creating it on first use."""
+    pool = getattr(container, '_ctkmenubar_button_pool', None)
+    if pool is None:
+        pool = _ButtonPool()
+        setattr(container, '_ctkmenubar_button_pool', pool)
+    return pool
+
+
+__all__ = ["_ButtonPool", "_get_button_pool", "_bind_callback", "_unbind_callback"]
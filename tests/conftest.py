@@ -0,0 +1,24 @@
+import tkinter as tk
+
+import pytest
+
+
+@pytest.fixture
+def root():
+    """A mapped CTk window; tests needing one are skipped without a display (use xvfb-run)."""
+    customtkinter = pytest.importorskip("customtkinter")
+    try:
+        window = customtkinter.CTk()
+    except tk.TclError as e:
+        pytest.skip(f"no display available: {e}")
+    window.geometry("400x300")
+    window.update()
+    yield window
+    window.destroy()
+
+
+def press(widget, keysym, state=0):
+    """Deliver a real KeyPress (and its release) to widget through the Tk event queue."""
+    widget.event_generate("<KeyPress>", keysym=keysym, state=state, when="tail")
+    widget.event_generate("<KeyRelease>", keysym=keysym, state=state, when="tail")
+    widget.update()
@@ -0,0 +1,33 @@
+from CTkMenuBarPlus.accelerators import _parse_accelerator, _register_accelerator, _unregister_accelerator
+
+CONTROL_MASK = 0x4
+
+
+def _press_stroke(root, accelerator, keysym):
+    """Send the single stroke accelerator (e.g. "Ctrl+K") as a real key press."""
+    (mods_key, _tk_mods, keycode), = _parse_accelerator(accelerator)
+    state = CONTROL_MASK if mods_key != "none" else 0
+    root.event_generate("<KeyPress>", keysym=keysym, keycode=keycode, state=state, when="tail")
+    root.update()
+
+
+def _chord_calls(root, strokes):
+    calls = []
+    callback = lambda: calls.append(True)
+    _register_accelerator(root, "Ctrl+K Ctrl+S", callback)
+    root.focus_force()
+    root.update()
+    try:
+        for accelerator, keysym in strokes:
+            _press_stroke(root, accelerator, keysym)
+    finally:
+        _unregister_accelerator(root, "Ctrl+K Ctrl+S", callback)
+    return calls
+
+
+def test_chord_completes(root):
+    assert _chord_calls(root, [("Ctrl+K", "k"), ("Ctrl+S", "s")]) == [True]
+
+
+def test_unrelated_plain_key_cancels_pending_chord(root):
+    assert _chord_calls(root, [("Ctrl+K", "k"), ("X", "x"), ("Ctrl+S", "s")]) == []
@@ -0,0 +1,48 @@
+import warnings
+
+import customtkinter
+import pytest
+
+from CTkMenuBarPlus import CustomDropdownMenu, find_conflicts, set_conflict_policy
+from CTkMenuBarPlus.accelerators import _lookup_accelerator
+
+
+@pytest.fixture
+def raise_on_conflict():
+    set_conflict_policy("raise")
+    yield
+    set_conflict_policy("warn")
+
+
+def _menu(root, text, **kwargs):
+    button = customtkinter.CTkButton(root, text=text)
+    button.pack()
+    return CustomDropdownMenu(widget=button, **kwargs)
+
+
+def test_shrinking_scrollable_menu_keeps_one_record_per_accelerator(root, raise_on_conflict):
+    menu = _menu(root, "File", max_visible_options=3)
+    for i in range(5):
+        menu.add_option(f"Item {i}", command=lambda: None, accelerator=f"Ctrl+{i}")
+    assert menu._scrollable_frame is not None
+
+    while menu._scrollable_frame is not None:
+        assert menu.remove_option(menu._options_list[-1])
+
+    assert [option.cget("option") for option in menu._options_list] == ["Item 0", "Item 1"]
+    assert _lookup_accelerator(menu, "Ctrl+0").owner is menu._options_list[0]
+    assert _lookup_accelerator(menu, "Ctrl+4") is None
+    assert find_conflicts() == []
+
+
+def test_duplicate_shadowed_by_another_menu_is_detected(root):
+    file_menu = _menu(root, "File")
+    edit_menu = _menu(root, "Edit")
+    save = file_menu.add_option("Save", command=lambda: None, accelerator="Ctrl+S")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        edit_menu.add_option("Select", command=lambda: None, accelerator="Ctrl+S")
+
+        assert file_menu.add_option("Save As", command=lambda: None, accelerator="Ctrl+S") is save
+
+    assert len(file_menu._options_list) == 1
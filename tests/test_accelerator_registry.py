@@ -0,0 +1,70 @@
+import gc
+from types import SimpleNamespace
+
+import pytest
+
+from CTkMenuBarPlus.accelerators import (_GLOBAL_ACCEL_BINDINGS, _lookup_accelerator, _parse_accelerator,
+                                         _purge_target, _register_accelerator)
+
+
+class _FakeWindow:
+    """Just enough of a toplevel for the registry: an id and recorded key bindings."""
+
+    def __init__(self, window_id):
+        self.window_id = window_id
+        self.handlers = []
+
+    def winfo_toplevel(self):
+        return self
+
+    def winfo_id(self):
+        return self.window_id
+
+    def bind(self, sequence, func, add=None):
+        if "KeyPress" in sequence:
+            self.handlers.append(func)
+
+    def press(self, accelerator, serial):
+        _mods, _tk_mods, keycode = _parse_accelerator(accelerator)[0]
+        event = SimpleNamespace(widget=self, keycode=keycode, keysym="s", serial=serial)
+        for handler in self.handlers:
+            handler(event)
+
+
+class _Helper:
+    calls = []
+
+    def run(self):
+        self.calls.append(self)
+
+
+@pytest.fixture
+def window():
+    window = _FakeWindow(424242)
+    _Helper.calls.clear()
+    yield window
+    _purge_target(window.window_id)
+
+
+def test_bound_method_without_owner_is_held_strongly(window):
+    assert _register_accelerator(window, "Ctrl+S", _Helper().run)
+    gc.collect()
+
+    window.press("Ctrl+S", serial=1)
+
+    assert len(_Helper.calls) == 1
+
+
+def test_bound_method_with_owner_is_held_weakly(window):
+    owner = _Helper()
+    assert _register_accelerator(window, "Ctrl+S", owner.run, owner=owner)
+    window.press("Ctrl+S", serial=1)
+    assert _Helper.calls == [owner]
+
+    _Helper.calls.clear()
+    del owner
+    gc.collect()
+
+    assert _lookup_accelerator(window, "Ctrl+S") is None
+    window.press("Ctrl+S", serial=2)
+    assert window.window_id not in _GLOBAL_ACCEL_BINDINGS
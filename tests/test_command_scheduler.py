@@ -0,0 +1,117 @@
+import pytest
+
+from CTkMenuBarPlus.command_scheduler import _CommandScheduler
+
+
+class _FakeWidget:
+    """Records after() callbacks instead of running an event loop."""
+
+    def __init__(self):
+        self.timers = {}
+        self.most_pending = 0
+        self._ids = 0
+
+    def after(self, delay, func):
+        self._ids += 1
+        after_id = f"after#{self._ids}"
+        self.timers[after_id] = (delay, func)
+        self.most_pending = max(self.most_pending, len(self.timers))
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def delays(self):
+        return [delay for delay, _func in self.timers.values()]
+
+
+class _Option:
+    pass
+
+
+@pytest.fixture
+def clock():
+    return [0.0]
+
+
+@pytest.fixture
+def widget():
+    return _FakeWidget()
+
+
+@pytest.fixture
+def scheduler(widget, clock):
+    scheduler = _CommandScheduler(widget)
+    scheduler._now = lambda: clock[0]
+    return scheduler
+
+
+def _fire(widget, clock, at):
+    """Advance the clock to at and run the armed after() callback."""
+    clock[0] = at
+    (after_id,) = widget.timers
+    _delay, func = widget.timers.pop(after_id)
+    func()
+
+
+def test_throttle_drops_calls_inside_the_window(scheduler, widget, clock):
+    option, runs = _Option(), []
+    for at in (0, 40, 90, 120):
+        clock[0] = at
+        scheduler.submit(option, lambda at=at: runs.append(at), throttle_ms=100)
+
+    assert runs == [0, 120]
+    assert widget.timers == {}
+
+
+def test_throttle_with_coalesce_leaves_one_trailing_run(scheduler, widget, clock):
+    option, runs = _Option(), []
+    for at in (0, 10, 20, 30):
+        clock[0] = at
+        scheduler.submit(option, lambda at=at: runs.append(at), throttle_ms=100, coalesce=True)
+    assert runs == [0]
+    assert widget.delays() == [90]
+
+    _fire(widget, clock, 100)
+
+    assert runs == [0, 30]
+    assert scheduler.pending_count() == 0 and widget.timers == {}
+
+
+def test_debounce_rearms_on_each_call(scheduler, widget, clock):
+    option, runs = _Option(), []
+    for at in (0, 50, 90):
+        clock[0] = at
+        scheduler.submit(option, lambda: runs.append(clock[0]), debounce_ms=100)
+        assert widget.delays() == [100]
+
+    _fire(widget, clock, 190)
+
+    assert runs == [190]
+
+
+def test_cancel_rearms_for_the_next_due_run(scheduler, widget, clock):
+    first, second, runs = _Option(), _Option(), []
+    scheduler.submit(first, lambda: runs.append("first"), debounce_ms=100)
+    scheduler.submit(second, lambda: runs.append("second"), debounce_ms=200)
+    assert widget.delays() == [100]
+
+    scheduler.cancel(first)
+    assert widget.delays() == [200]
+
+    _fire(widget, clock, 200)
+    assert runs == ["second"]
+
+
+def test_only_one_timer_is_armed(scheduler, widget, clock):
+    options = [_Option() for _ in range(5)]
+    for step, option in enumerate(options * 3):
+        clock[0] = step * 7
+        scheduler.submit(option, lambda: None, debounce_ms=50 + step, throttle_ms=20)
+    scheduler.cancel(options[0])
+    while widget.timers:
+        delay, _func = next(iter(widget.timers.values()))
+        _fire(widget, clock, clock[0] + delay)
+
+    assert widget.most_pending == 1
+    assert scheduler.pending_count() == 0
@@ -0,0 +1,53 @@
+import os
+
+import PIL.Image
+import pytest
+
+from CTkMenuBarPlus import build_icon_atlas
+from CTkMenuBarPlus.custom_exception_classes import MenuIconError
+
+
+def _write_icon(path, color, size=64):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    PIL.Image.new("RGBA", (size, size), color).save(path)
+
+
+@pytest.fixture
+def icons_dir(tmp_path):
+    source = tmp_path / "icons"
+    _write_icon(str(source / "save.png"), (255, 0, 0, 255))
+    _write_icon(str(source / "edit" / "copy.png"), (0, 0, 255, 128))
+    return source
+
+
+def test_built_atlas_slices_icons_by_name_and_size(icons_dir, tmp_path):
+    atlas = build_icon_atlas(str(icons_dir), str(tmp_path / "icons.atlas"), sizes=(16, 24))
+    try:
+        assert atlas.names == ["edit/copy", "save"]
+        assert atlas.sizes == [16, 24]
+        assert sorted(os.listdir(atlas.path)) == ["atlas.json", "icons_16.rgba", "icons_24.rgba"]
+
+        save = atlas.icon("save").image(16)
+        assert save.size == (16, 16) and save.getpixel((8, 8)) == (255, 0, 0, 255)
+        assert atlas.image("edit/copy", 24).getpixel((0, 0)) == (0, 0, 255, 128)
+        resampled = atlas.image("save", 20)
+        assert resampled.size == (20, 20) and resampled is atlas.image("save", 20)
+    finally:
+        atlas.close()
+
+
+def test_files_sharing_a_name_are_rejected(icons_dir, tmp_path):
+    (icons_dir / "save.svg").write_text('<svg xmlns="http://www.w3.org/2000/svg"/>')
+
+    with pytest.raises(MenuIconError, match="save"):
+        build_icon_atlas(str(icons_dir), str(tmp_path / "icons.atlas"))
+
+
+def test_failed_build_leaves_no_partial_sheets(icons_dir, tmp_path):
+    (icons_dir / "zz_broken.png").write_bytes(b"not an image")
+    output = tmp_path / "icons.atlas"
+
+    with pytest.raises(MenuIconError, match="zz_broken"):
+        build_icon_atlas(str(icons_dir), str(output), sizes=(16, 24))
+
+    assert os.listdir(output) == []
@@ -0,0 +1,41 @@
+import customtkinter
+
+from CTkMenuBarPlus import CustomDropdownMenu
+from conftest import press
+
+
+def _open_menu(root):
+    button = customtkinter.CTkButton(root, text="Edit")
+    button.pack()
+    menu = CustomDropdownMenu(widget=button)
+    menu.add_option("Undo", command=lambda: None)
+    menu.add_option("Redo", command=lambda: None)
+    submenu = menu.add_submenu("Find")
+    submenu.add_option("Find Next", command=lambda: None)
+    root.update()
+    menu._show()
+    menu.focus_force()
+    root.update()
+    return menu, submenu
+
+
+def test_arrow_keys_move_the_highlight_of_the_focused_menu(root):
+    menu, _submenu = _open_menu(root)
+
+    press(menu, "Down")
+    press(menu, "Down")
+
+    assert menu._highlighted_option.cget("option") == "Redo"
+
+
+def test_right_and_left_enter_and_leave_a_submenu(root):
+    menu, submenu = _open_menu(root)
+    press(menu, "End")
+
+    press(menu, "Right")
+    assert submenu.winfo_ismapped()
+    assert submenu._highlighted_option.cget("option") == "Find Next"
+
+    press(submenu, "Left")
+    assert not submenu.winfo_ismapped()
+    assert menu.focus_get() is menu
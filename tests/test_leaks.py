@@ -0,0 +1,13 @@
+import pytest
+
+from CTkMenuBarPlus import leak_check
+from CTkMenuBarPlus.diagnostics import _leak_scenarios
+
+
+@pytest.mark.parametrize("scenario", ["dropdown", "context", "clean", "remove_option"])
+def test_build_and_teardown_cycles_do_not_leak(root, scenario):
+    build = _leak_scenarios(root)[scenario]
+
+    report = leak_check(root, build, cycles=10)
+
+    assert not report["leaked"], report["growth"]
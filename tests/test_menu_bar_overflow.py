@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+from CTkMenuBarPlus import CTkMenuBar
+
+
+def test_destroyed_cascade_leaves_overflow_bookkeeping(root):
+    bar = CTkMenuBar(root)
+    buttons = [bar.add_cascade(f"Menu {i}", postcommand=lambda: None) for i in range(5)]
+    root.update()
+
+    buttons[1].destroy()
+    root.update()
+    bar.configure(padx=8, pady=3)  # regrids the remaining cascades
+    root.update()
+
+    assert bar._cascades == [buttons[0]] + buttons[2:]
+    assert buttons[1] not in bar._postcommands
+    assert bar._visible_count == 4
+    assert len(bar._width_prefix) == 4
+
+
+def test_configure_replaces_a_queued_overflow_update(root):
+    bar = CTkMenuBar(root)
+    bar.add_cascade("File")
+    root.update()
+
+    bar._schedule_overflow_update()
+    queued = bar._overflow_update_id
+    bar._on_configure(SimpleNamespace(widget=bar, width=bar.winfo_width()))
+
+    assert queued not in root.tk.splitlist(root.tk.call("after", "info"))
+    assert bar._overflow_update_id is None
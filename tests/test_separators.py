@@ -0,0 +1,21 @@
+import tkinter as tk
+
+import customtkinter
+
+from CTkMenuBarPlus import CustomDropdownMenu
+
+
+def test_transparent_separator_takes_the_menu_background(root):
+    button = customtkinter.CTkButton(root, text="Edit")
+    button.pack()
+    menu = CustomDropdownMenu(widget=button, separator_color="transparent", bg_color="#123456",
+                              max_visible_options=3)
+    menu.add_option("Undo", command=lambda: None)
+
+    menu.add_separator()
+    assert menu._separators[0].cget("bg") == "#123456"
+
+    for name in ("Cut", "Copy"):
+        menu.add_option(name, command=lambda: None)
+    assert menu._scrollable_frame is not None
+    assert menu._separators[0].cget("bg") == tk.Frame.cget(menu._scrollable_frame, "bg")
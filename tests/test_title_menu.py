@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+
+from CTkMenuBarPlus import title_menu_win
+from CTkMenuBarPlus.constants import TITLE_MENU_BASE_X_OFFSET, TITLE_MENU_TITLE_GAP
+from CTkMenuBarPlus.title_menu_win import CTkTitleMenu, _overlay_geometry, _title_x_offset
+
+
+class _FakeFont:
+    def __init__(self):
+        self.measured = []
+
+    def measure(self, char):
+        self.measured.append(char)
+        return 7
+
+
+class _FakeWindow:
+    def __init__(self, title=""):
+        self._title = title
+
+    def title(self):
+        return self._title
+
+    def winfo_width(self):
+        return 800
+
+    def winfo_height(self):
+        return 600
+
+    def winfo_x(self):
+        return 100
+
+    def winfo_y(self):
+        return 50
+
+    def state(self):
+        return "normal"
+
+
+def _stub_menu(master=None):
+    """A CTkTitleMenu without a Tk window: after() only records what it schedules."""
+    menu = CTkTitleMenu.__new__(CTkTitleMenu)
+    menu.master = master or _FakeWindow()
+    menu.scheduled = []
+    menu.after = lambda ms, func: menu.scheduled.append((ms, func)) or f"after#{len(menu.scheduled)}"
+    menu._dimension_update_id = None
+    return menu
+
+
+def test_title_x_offset_sums_character_widths():
+    widths = {"a": 5, "b": 9}
+
+    assert _title_x_offset("abba", widths.__getitem__) == TITLE_MENU_BASE_X_OFFSET + 28 + TITLE_MENU_TITLE_GAP
+    assert _title_x_offset("", widths.__getitem__) == TITLE_MENU_BASE_X_OFFSET
+
+
+def test_character_widths_are_measured_once(monkeypatch):
+    monkeypatch.setattr(title_menu_win, "_CHAR_WIDTHS", {})
+    font = _FakeFont()
+    menu = _stub_menu()
+    menu._title_font, menu._title_font_key = font, "caption"
+
+    assert _title_x_offset("Notes - Notes", menu._char_width) == TITLE_MENU_BASE_X_OFFSET + 13 * 7 + TITLE_MENU_TITLE_GAP
+    _title_x_offset("Notes", menu._char_width)
+
+    assert sorted(font.measured) == sorted(set("Notes - Notes"))
+    assert title_menu_win._CHAR_WIDTHS[("caption", "N")] == 7
+
+
+def test_title_change_schedules_an_overlay_update():
+    window = _FakeWindow("Untitled")
+    menu = _stub_menu(window)
+    menu._title = "Untitled"
+
+    menu._poll_title()
+    assert [func for _ms, func in menu.scheduled] == [menu._poll_title]
+
+    window._title = "Untitled - Notes"
+    menu._poll_title()
+    assert [func for _ms, func in menu.scheduled[1:]] == [menu.change_dimension, menu._poll_title]
+
+
+def test_overlay_geometry_follows_window_state():
+    assert _overlay_geometry(800, 600, 100, 50, "normal", 60, 6) == "610x600+160+56"
+    assert _overlay_geometry(800, 600, 100, 50, "zoomed", 60, 6) == "610x600+153+60"
+    assert _overlay_geometry(800, 600, 100, 50, "iconic", 60, 6) is None
+    assert _overlay_geometry(180, 600, 100, 50, "normal", 60, 6) is None  # too narrow
+
+
+def test_child_configure_events_are_ignored():
+    menu = _stub_menu()
+
+    menu._on_master_configure(SimpleNamespace(widget=object()))
+
+    assert menu.scheduled == []
+
+
+def test_configure_burst_runs_one_update():
+    menu = _stub_menu()
+    updates = []
+    menu.change_dimension = lambda: updates.append(1)
+
+    for _ in range(20):
+        menu._on_master_configure(SimpleNamespace(widget=menu.master))
+    for _ms, func in menu.scheduled:
+        func()
+
+    assert len(menu.scheduled) == 1
+    assert updates == [1]
+
+
+def test_unchanged_geometry_is_not_applied_again():
+    menu = _stub_menu()
+    menu._is_visible, menu._last_geometry, menu._title = True, None, None
+    menu.x_offset, menu.y_offset = 60, 6
+    applied = []
+    menu.geometry = applied.append
+    menu.deiconify = lambda: None
+
+    menu.change_dimension()
+    menu.change_dimension()
+
+    assert applied == ["610x600+160+56"]
@@ -0,0 +1,34 @@
+import customtkinter
+
+from CTkMenuBarPlus import CustomDropdownMenu
+from conftest import press
+
+
+def _open_menu(root, **kwargs):
+    button = customtkinter.CTkButton(root, text="Fonts")
+    button.pack()
+    menu = CustomDropdownMenu(widget=button, **kwargs)
+    for name in ("Arial", "Courier", "Symbol"):
+        menu.add_option(name, command=lambda: None)
+    root.update()
+    menu._show()
+    menu.focus_force()
+    root.update()
+    return menu
+
+
+def test_key_press_on_focused_menu_jumps_to_option(root):
+    menu = _open_menu(root)
+    assert menu.focus_get() is menu
+
+    press(menu, "c")
+
+    assert menu._highlighted_option.cget("option") == "Courier"
+
+
+def test_key_press_on_focused_menu_filters_options(root):
+    menu = _open_menu(root, type_ahead="filter")
+
+    press(menu, "s")
+
+    assert [option.cget("option") for option in menu._visible_options()] == ["Symbol"]
@@ -0,0 +1,40 @@
+import customtkinter
+
+from CTkMenuBarPlus import CustomDropdownMenu
+from CTkMenuBarPlus.widget_pool import _get_button_pool
+
+
+def _menu(root, **kwargs):
+    button = customtkinter.CTkButton(root, text="File")
+    button.pack()
+    return CustomDropdownMenu(widget=button, **kwargs)
+
+
+def test_clean_and_refill_reuses_the_option_buttons(root):
+    menu = _menu(root)
+    names = ("New", "Open", "Save")
+    first = [menu.add_option(name, command=lambda: None) for name in names]
+
+    menu.clean()
+    assert len(_get_button_pool(menu)) == len(names)
+    second = [menu.add_option(name, command=lambda: None, accelerator="Ctrl+N" if name == "New" else None)
+              for name in names]
+
+    assert {id(button) for button in second} == {id(button) for button in first}
+    assert all(button.winfo_exists() for button in second)
+    assert [button.cget("option") for button in menu._options_list] == list(names)
+    assert len(_get_button_pool(menu)) == 0
+
+
+def test_moving_into_the_scrollable_frame_keeps_no_hidden_buttons(root):
+    menu = _menu(root, max_visible_options=10)
+    options = [menu.add_option(f"Item {i}", command=lambda: None) for i in range(4)]
+    menu.remove_option(options[0])
+    assert len(_get_button_pool(menu)) == 1
+
+    menu.configure(max_visible_options=3)
+
+    assert menu._scrollable_frame is not None
+    assert len(_get_button_pool(menu)) == 0
+    assert all(option.master is menu._scrollable_frame for option in menu._options_list)
+    assert not any(option.winfo_exists() for option in options)